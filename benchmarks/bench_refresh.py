@@ -0,0 +1,141 @@
+"""Benchmarks for the parse, refresh and entity update paths.
+
+Run from the repository root (needs ``pytest-benchmark``)::
+
+    python -m pytest benchmarks
+
+Each benchmark runs against the hand-written sample feed and synthetic
+feeds at 1x, 10x and 100x the size of the real resort. Peak traced memory
+of one run and entity counts are printed after the timings, and are also
+stored as extra info in ``--benchmark-json`` output.
+"""
+from __future__ import annotations
+
+import tracemalloc
+from typing import Any
+
+import pytest
+
+from conftest import FEEDS, ROUNDS, Harness, load_feed, parse_body, read_state
+
+from big_sky.diff import diff_snapshots
+
+
+def _peak_memory(benchmark: Any, func: Any, *args: Any) -> None:
+    """Record the peak traced memory of one call in the benchmark's extra info."""
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["peak_memory_kib"] = round(peak / 1024)
+
+
+@pytest.mark.parametrize("streaming", [False, True], ids=["xmltodict", "streaming"])
+@pytest.mark.parametrize("feed", FEEDS)
+def test_parse(benchmark: Any, feed: str, streaming: bool) -> None:
+    """Parse a complete feed body into a snapshot."""
+    body = load_feed(feed)
+    benchmark.extra_info["feed_kib"] = round(len(body) / 1024)
+    _peak_memory(benchmark, parse_body, body, streaming)
+    snapshot = benchmark.pedantic(
+        parse_body, args=(body, streaming), rounds=ROUNDS[feed], warmup_rounds=1
+    )
+    assert snapshot.lifts
+
+
+@pytest.mark.parametrize("feed", FEEDS)
+def test_diff(benchmark: Any, feed: str) -> None:
+    """Diff two consecutive revisions of a feed."""
+    old = parse_body(load_feed(feed, 0), False)
+    new = parse_body(load_feed(feed, 1), False)
+    changed = benchmark.pedantic(
+        diff_snapshots, args=(old, new), rounds=ROUNDS[feed] * 10, warmup_rounds=1
+    )
+    assert changed
+
+
+@pytest.mark.parametrize("streaming", [False, True], ids=["xmltodict", "streaming"])
+@pytest.mark.parametrize("feed", FEEDS)
+def test_update_data(benchmark: Any, harness: Harness, feed: str, streaming: bool) -> None:
+    """Fetch, parse and diff a changed feed through the coordinator."""
+    harness.coordinator.streaming = streaming
+    revisions = [load_feed(feed, revision) for revision in range(2)]
+    state = {"revision": 0}
+
+    def setup() -> tuple[tuple[()], dict[str, Any]]:
+        # A new body every round, so each fetch is a full download and parse.
+        state["revision"] ^= 1
+        harness.server.set_body(revisions[state["revision"]])
+        return (), {}
+
+    def update() -> Any:
+        return harness.run(harness.coordinator._async_update_data())  # noqa: SLF001
+
+    setup()
+    _peak_memory(benchmark, update)
+    snapshot = benchmark.pedantic(
+        update, setup=setup, rounds=ROUNDS[feed], warmup_rounds=1
+    )
+    assert snapshot.lifts
+
+
+@pytest.mark.parametrize("feed", FEEDS)
+def test_setup_entities(benchmark: Any, harness: Harness, feed: str) -> None:
+    """Create every sensor, binary sensor and weather entity of a snapshot."""
+    harness.server.set_body(load_feed(feed))
+    harness.run(harness.coordinator.async_refresh())
+
+    def setup_entities() -> list[Any]:
+        # Each round is a fresh platform setup, as on a restart.
+        harness.run(harness.entry._async_process_on_unload(harness.hass))  # noqa: SLF001
+        return harness.run(harness.async_setup_entities())
+
+    entities = benchmark.pedantic(setup_entities, rounds=ROUNDS[feed], warmup_rounds=1)
+    benchmark.extra_info["entities"] = len(entities)
+
+
+@pytest.mark.parametrize("feed", FEEDS)
+def test_read_all_states(benchmark: Any, harness: Harness, feed: str) -> None:
+    """Read the state and attributes of every entity, as on a full state write."""
+    harness.server.set_body(load_feed(feed))
+    harness.run(harness.coordinator.async_refresh())
+    entities = harness.run(harness.async_setup_entities())
+
+    def read_all() -> None:
+        # A new snapshot object, so rollups are rebuilt as after a real refresh.
+        harness.coordinator.data = parse_body(harness.server.body, False)
+        for entity in entities:
+            read_state(entity)
+
+    benchmark.extra_info["entities"] = len(entities)
+    benchmark.pedantic(read_all, rounds=ROUNDS[feed], warmup_rounds=1)
+
+
+@pytest.mark.parametrize("feed", FEEDS)
+def test_refresh_entity_updates(benchmark: Any, harness: Harness, feed: str) -> None:
+    """Notify and read the entities affected by one changed refresh."""
+    coordinator = harness.coordinator
+    old = parse_body(load_feed(feed, 0), False)
+    new = parse_body(load_feed(feed, 1), False)
+    changed = diff_snapshots(old, new)
+    coordinator.data = new
+    entities = harness.run(harness.async_setup_entities())
+    written: list[Any] = []
+    for entity in entities:
+        coordinator.async_add_listener(
+            lambda entity=entity: written.append(read_state(entity)),
+            entity.coordinator_context,
+        )
+    coordinator.last_update_success = True
+    coordinator._notified_success = True  # noqa: SLF001
+
+    def notify() -> None:
+        written.clear()
+        coordinator.changed = set(changed)
+        coordinator.async_update_listeners()
+
+    benchmark.pedantic(notify, rounds=ROUNDS[feed] * 10, warmup_rounds=1)
+    benchmark.extra_info["entities"] = len(entities)
+    benchmark.extra_info["entities_updated"] = len(written)
@@ -0,0 +1,222 @@
+"""Fixtures for the Big Sky Resort benchmark suite.
+
+Everything runs offline: feeds come from ``tests/fixtures`` or ``feedgen``
+and are served by a local stand-in for the resort's feed server.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+import hashlib
+import os
+import sys
+import tempfile
+from typing import Any
+
+from aiohttp import web
+import pytest
+import xmltodict
+
+sys.path[:0] = [
+    os.path.dirname(__file__),
+    os.path.join(os.path.dirname(__file__), "..", "custom_components"),
+]
+
+from feedgen import generate_feed  # noqa: E402
+
+from homeassistant.config_entries import ConfigEntry  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers import entity_registry as er  # noqa: E402
+
+from big_sky import binary_sensor, sensor, weather  # noqa: E402
+from big_sky.const import (  # noqa: E402
+    CONF_FEED_URL,
+    DOMAIN,
+    MAX_CONCURRENT_FETCHES,
+)
+from big_sky.coordinator import BigSkyDataUpdateCoordinator  # noqa: E402
+from big_sky.model import Snapshot, build_snapshot  # noqa: E402
+from big_sky.parser import parse_feed  # noqa: E402
+from big_sky.resort_map import ResortMapIndex  # noqa: E402
+from big_sky.scheduler import FeedScheduler  # noqa: E402
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures")
+FEED_PATH = "/mtnxml/162"
+
+# The hand-written sample feed of the tests, plus synthetic feeds at 1x,
+# 10x and 100x the areas, lifts and trails of the real resort.
+SCALES = (1, 10, 100)
+FEEDS = ["sample"] + [f"synthetic_{scale}x" for scale in SCALES]
+ROUNDS = {"sample": 50, "synthetic_1x": 20, "synthetic_10x": 5, "synthetic_100x": 2}
+
+STATE_PROPERTIES = (
+    "native_value",
+    "is_on",
+    "condition",
+    "native_temperature",
+    "extra_state_attributes",
+)
+
+# Extra info (peak memory, entity counts) of each benchmark, by test id.
+EXTRA_INFO: dict[str, dict[str, Any]] = {}
+
+
+def load_feed(name: str, revision: int = 0) -> bytes:
+    """Return revision ``revision`` of a named feed."""
+    if name == "sample":
+        with open(os.path.join(FIXTURES, "big_sky.xml"), "rb") as file:
+            body = file.read()
+        if revision % 2:
+            # Flip one lift so consecutive revisions differ like real polls.
+            body = body.replace(b'status="Closed"', b'status="Open"', 1)
+        return body
+    scale = int(name.removeprefix("synthetic_").removesuffix("x"))
+    return generate_feed(scale, revision=revision)
+
+
+def parse_body(body: bytes, streaming: bool) -> Snapshot:
+    """Parse a complete feed body into a snapshot, as a refresh does."""
+    if streaming:
+        return parse_feed(body)
+    return build_snapshot(xmltodict.parse(body))
+
+
+class StandInFeedServer:
+    """Serve a settable feed body with ETag support, like the resort CDN."""
+
+    def __init__(self) -> None:
+        """Initialize the server."""
+        self.body = b""
+        self.etag = ""
+        self.url = ""
+        self._runner: web.AppRunner | None = None
+
+    def set_body(self, body: bytes) -> None:
+        """Publish a new feed body."""
+        self.body = body
+        self.etag = f'"{hashlib.md5(body).hexdigest()}"'
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        if request.headers.get("If-None-Match") == self.etag:
+            return web.Response(status=304)
+        return web.Response(
+            body=self.body, content_type="text/xml", headers={"ETag": self.etag}
+        )
+
+    async def async_start(self) -> None:
+        """Start listening on a free local port."""
+        app = web.Application()
+        app.router.add_get(FEED_PATH, self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]  # noqa: SLF001
+        self.url = f"http://127.0.0.1:{port}{FEED_PATH}"
+
+    async def async_stop(self) -> None:
+        """Stop the server."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+
+class Harness:
+    """A Home Assistant instance with one Big Sky entry and its entities."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, config_dir: str) -> None:
+        """Initialize the harness."""
+        self.loop = loop
+        self.config_dir = config_dir
+        self.server = StandInFeedServer()
+        self.hass: HomeAssistant | None = None
+        self.entry: ConfigEntry | None = None
+        self.coordinator: BigSkyDataUpdateCoordinator | None = None
+        self.entities: list[Any] = []
+
+    def run(self, coro: Any) -> Any:
+        """Run a coroutine to completion on the harness loop."""
+        return self.loop.run_until_complete(coro)
+
+    async def async_start(self, **options: Any) -> None:
+        """Start the stand-in server and create the entry's coordinator."""
+        await self.server.async_start()
+        self.hass = HomeAssistant(self.config_dir)
+        await er.async_load(self.hass)
+        self.entry = ConfigEntry(
+            version=3,
+            minor_version=1,
+            domain=DOMAIN,
+            title="Big Sky Resort",
+            data={CONF_FEED_URL: self.server.url, **options},
+            source="user",
+            options={},
+            unique_id="162",
+        )
+        self.coordinator = BigSkyDataUpdateCoordinator(self.hass, self.entry)
+        # Benchmarks refresh back to back; skip the politeness spacing.
+        self.coordinator.scheduler = FeedScheduler(MAX_CONCURRENT_FETCHES, 0)
+        self.hass.data[DOMAIN] = {
+            self.entry.entry_id: {
+                "coordinator": self.coordinator,
+                "resort_map": ResortMapIndex(self.hass, self.entry.entry_id),
+                "config": self.entry.data,
+            }
+        }
+
+    async def async_setup_entities(self) -> list[Any]:
+        """Run the platforms' setup and return the entities they added."""
+        self.entities = []
+        for platform in (sensor, binary_sensor, weather):
+            await platform.async_setup_entry(
+                self.hass, self.entry, lambda new, *_: self.entities.extend(new)
+            )
+        return self.entities
+
+    async def async_stop(self) -> None:
+        """Shut the coordinator and the stand-in server down."""
+        await self.entry._async_process_on_unload(self.hass)  # noqa: SLF001
+        await self.coordinator.async_shutdown()
+        await self.hass.async_stop(force=True)
+        await self.server.async_stop()
+
+
+def read_state(entity: Any) -> tuple[Any, ...]:
+    """Read what Home Assistant reads from an entity when writing its state."""
+    kind = type(entity)
+    return tuple(getattr(entity, name) for name in STATE_PROPERTIES if hasattr(kind, name))
+
+
+@pytest.fixture
+def harness() -> Iterator[Harness]:
+    """Return a started harness, torn down after the benchmark."""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    with tempfile.TemporaryDirectory() as config_dir:
+        instance = Harness(loop, config_dir)
+        instance.run(instance.async_start())
+        try:
+            yield instance
+        finally:
+            instance.run(instance.async_stop())
+            loop.close()
+            asyncio.set_event_loop(None)
+
+
+@pytest.fixture(autouse=True)
+def _collect_extra_info(request: pytest.FixtureRequest) -> Iterator[None]:
+    """Remember each benchmark's extra info for the terminal summary."""
+    yield
+    if (benchmark := request.node.funcargs.get("benchmark")) is not None:
+        if benchmark.extra_info:
+            EXTRA_INFO[request.node.name] = dict(benchmark.extra_info)
+
+
+def pytest_terminal_summary(terminalreporter: Any) -> None:
+    """Print peak memory and entity counts next to pytest-benchmark's timings."""
+    if not EXTRA_INFO:
+        return
+    terminalreporter.section("benchmark extra info")
+    width = max(len(name) for name in EXTRA_INFO)
+    for name, info in sorted(EXTRA_INFO.items()):
+        values = ", ".join(f"{key}={value}" for key, value in info.items())
+        terminalreporter.write_line(f"{name:<{width}}  {values}")
@@ -0,0 +1,123 @@
+"""Synthetic Big Sky Resort feed generator for benchmarks."""
+from __future__ import annotations
+
+import random
+from xml.sax.saxutils import quoteattr
+
+DIFFICULTIES = ("Beginner", "Intermediate", "Advanced", "Expert", "High Exposure")
+LIFT_TYPES = ("Tram", "High Speed Eight", "High Speed Quad", "Fixed Quad", "Triple", "Carpet", "Poma")
+STATUSES = ("Open", "Closed", "Open", "Open", "Expected")
+
+# Roughly the shape of the real feed: ~8 areas, ~40 lifts, ~320 trails.
+BASE_AREAS = 8
+LIFTS_PER_AREA = 5
+TRAILS_PER_AREA = 40
+PARKS_PER_AREA = 1
+
+
+def _attrs(**values: object) -> str:
+    return " ".join(f"{name}={quoteattr(str(value))}" for name, value in values.items())
+
+
+def generate_feed(scale: int = 1, seed: int = 0, revision: int = 0) -> bytes:
+    """Return a feed with ``scale`` times the areas, lifts and trails.
+
+    ``revision`` flips a small, deterministic share of statuses so
+    consecutive revisions look like consecutive polls of a live feed.
+    """
+    rng = random.Random(seed)
+    flip = random.Random(seed * 1000003 + revision)
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        f'<report {_attrs(name="Big Sky Resort", id=162)}>',
+        f'<operations {_attrs(resortStatus="Open", openTime="9:00 AM", closeTime="4:00 PM")}/>',
+        "<currentConditions>",
+        f'<resortwide {_attrs(numTrailsOpen=210 * scale, numParksOpen=3 * scale, numTrailsSnowMaking=4)}/>',
+        "<resortLocations>",
+        f'<location {_attrs(name="Mid Mountain", base=52, snow24Hours=6)}/>',
+        "</resortLocations>",
+        "</currentConditions>",
+        "<facilities><areas>",
+    ]
+    for area_index in range(BASE_AREAS * scale):
+        parts.append(f'<area {_attrs(name=f"Area {area_index}")}><lifts>')
+        for lift_index in range(LIFTS_PER_AREA):
+            status = rng.choice(STATUSES)
+            if flip.random() < 0.02:
+                status = "Closed" if status == "Open" else "Open"
+            parts.append(
+                "<lift "
+                + _attrs(
+                    name=f"Lift {area_index}-{lift_index}",
+                    type=rng.choice(LIFT_TYPES),
+                    status=status,
+                    statusDetail="",
+                    capacity=rng.randint(2, 8),
+                    openTime="9:00 AM",
+                    closeTime="4:00 PM",
+                    skierWaitTime=flip.randint(0, 30),
+                )
+                + "/>"
+            )
+        parts.append("</lifts><trails>")
+        for trail_index in range(TRAILS_PER_AREA):
+            status = rng.choice(STATUSES)
+            if flip.random() < 0.02:
+                status = "Closed" if status == "Open" else "Open"
+            parts.append(
+                "<trail "
+                + _attrs(
+                    name=f"Trail {area_index}-{trail_index}",
+                    difficulty=rng.choice(DIFFICULTIES),
+                    status=status,
+                    groomed=rng.choice(("yes", "no")),
+                    uphill=rng.choice(("yes", "no")),
+                )
+                + "/>"
+            )
+        parts.append("</trails><freestyleTerrain><parks>")
+        for park_index in range(PARKS_PER_AREA):
+            parts.append(
+                "<park "
+                + _attrs(
+                    name=f"Park {area_index}-{park_index}",
+                    difficulty=rng.choice(DIFFICULTIES),
+                    status=rng.choice(STATUSES),
+                    groomedOrCut=rng.choice(("yes", "no")),
+                )
+                + "/>"
+            )
+        parts.append("</parks></freestyleTerrain>")
+        # Unused narrative text, as in the real feed, that no entity reads.
+        parts.append(
+            "<description>" + "Lorem ipsum dolor sit amet. " * 20 + "</description>"
+        )
+        parts.append("</area>")
+    parts.append("</areas><parking>")
+    for lot_index in range(6):
+        parts.append(
+            "<lot "
+            + _attrs(
+                name=f"Lot {lot_index}",
+                status="open",
+                percentFull=min(100, 10 * lot_index + revision % 50),
+                openTime="7:00 AM",
+                closedTime="6:00 PM",
+                alert="",
+            )
+            + "/>"
+        )
+    parts.append("</parking><shuttles>")
+    parts.append(
+        "<line "
+        + _attrs(name="Skyline", status="Running", numberRunning=4, openTime="7:00 AM", closedTime="11:00 PM", comment="", alert="")
+        + "/>"
+    )
+    parts.append("</shuttles></facilities><forecast>")
+    for day, name in enumerate(("Saturday", "Sunday", "Monday", "Tuesday", "Wednesday")):
+        parts.append(
+            f'<day {_attrs(name=name, high=20 + day, low=5 + day, weather="Snow Showers")}>'
+            "Snow showers likely. Snow accumulation of 2 to 4 inches possible.</day>"
+        )
+    parts.append("</forecast></report>")
+    return "\n".join(parts).encode()
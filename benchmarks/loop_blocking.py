@@ -0,0 +1,90 @@
+"""Measure how long feed parsing blocks the event loop.
+
+Compares parsing on the loop (the default) with the ``parse_in_executor``
+mode, while a probe task records how late its 1 ms ticks fire::
+
+    python benchmarks/loop_blocking.py --scale 10
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+from time import perf_counter
+
+sys.path[:0] = [
+    os.path.dirname(__file__),
+    os.path.join(os.path.dirname(__file__), "..", "custom_components"),
+]
+
+from conftest import parse_body  # noqa: E402
+from feedgen import generate_feed  # noqa: E402
+
+from big_sky.diff import diff_snapshots  # noqa: E402
+
+TICK = 0.001
+
+
+async def _probe(stop: asyncio.Event, lags: list[float]) -> None:
+    """Record how late each tick of the loop fires."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + TICK
+        await asyncio.sleep(TICK)
+        lags.append(max(0.0, loop.time() - expected))
+
+
+def _refresh(body: bytes, streaming: bool, previous):
+    snapshot = parse_body(body, streaming)
+    return snapshot, diff_snapshots(previous, snapshot)
+
+
+async def _measure(body: bytes, streaming: bool, executor: bool, rounds: int):
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    lags: list[float] = []
+    probe = asyncio.create_task(_probe(stop, lags))
+    await asyncio.sleep(TICK * 5)
+    previous = None
+    start = perf_counter()
+    for _ in range(rounds):
+        if executor:
+            previous, _ = await loop.run_in_executor(
+                None, _refresh, body, streaming, previous
+            )
+        else:
+            previous, _ = _refresh(body, streaming, previous)
+        await asyncio.sleep(0)
+    elapsed = perf_counter() - start
+    stop.set()
+    await probe
+    return elapsed / rounds, max(lags, default=0.0), sum(lags)
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    body = generate_feed(args.scale)
+    print(f"feed: {len(body) / 1024:.0f} KiB, scale {args.scale}x, {args.rounds} rounds")
+    print(f"{'mode':<28}{'per refresh':>14}{'max loop lag':>16}{'total lag':>14}")
+    for streaming in (False, True):
+        for executor in (False, True):
+            per_refresh, max_lag, total_lag = await _measure(
+                body, streaming, executor, args.rounds
+            )
+            mode = ("streaming" if streaming else "xmltodict") + (
+                " + executor" if executor else " on loop"
+            )
+            print(
+                f"{mode:<28}{per_refresh * 1000:>11.1f} ms"
+                f"{max_lag * 1000:>13.1f} ms{total_lag * 1000:>11.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,271 @@
+"""Soak the integration for memory growth and event loop lag.
+
+Runs the coordinator, every platform, the event source and the search
+index against the local stand-in feed server for many refresh cycles,
+rotating through revisions of a feed with every other poll answered
+``304 Not Modified``. Every ``--sample-every`` cycles it records RSS,
+traced memory, object counts and event loop lag, then compares the end of
+the run with a baseline taken after warm-up. It exits non-zero when
+growth exceeds the thresholds::
+
+    python benchmarks/soak.py --cycles 20000 --feed synthetic_1x
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+import gc
+import json
+import os
+import sys
+import tempfile
+from time import perf_counter
+import tracemalloc
+from typing import Any
+
+sys.path[:0] = [
+    os.path.dirname(__file__),
+    os.path.join(os.path.dirname(__file__), "..", "custom_components"),
+]
+
+from conftest import FEEDS, Harness, load_feed, read_state  # noqa: E402
+
+from big_sky.const import (  # noqa: E402
+    CONF_PARSE_IN_EXECUTOR,
+    CONF_STREAMING_PARSER,
+    DOMAIN,
+)
+from big_sky.events import StatusEvents  # noqa: E402
+from big_sky.search import SearchIndex  # noqa: E402
+
+# Interval of the loop lag probe, in seconds.
+TICK = 0.01
+MIB = 1024 * 1024
+TOP = 10
+
+
+def _rss() -> int | None:
+    """Return the resident set size in bytes, where ``/proc`` has it."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _object_counts() -> Counter[str]:
+    """Return the number of live objects tracked by the GC, by class."""
+    gc.collect()
+    return Counter(
+        f"{type(obj).__module__}.{type(obj).__qualname__}" for obj in gc.get_objects()
+    )
+
+
+def _take_snapshot() -> tracemalloc.Snapshot | None:
+    """Return the traced allocations, less those of this script."""
+    if not tracemalloc.is_tracing():
+        return None
+    return tracemalloc.take_snapshot().filter_traces(
+        (
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, tracemalloc.__file__),
+        )
+    )
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+async def _probe(stop: asyncio.Event, lags: list[float]) -> None:
+    """Record how late each tick of the loop fires."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + TICK
+        await asyncio.sleep(TICK)
+        lags.append(max(0.0, loop.time() - expected))
+
+
+async def _async_setup(harness: Harness, options: dict[str, Any]) -> list[Any]:
+    """Set up the entry as ``async_setup_entry`` would, minus the registries."""
+    await harness.async_start(**options)
+    coordinator = harness.coordinator
+    await coordinator.async_refresh()
+    entry_data = harness.hass.data[DOMAIN][harness.entry.entry_id]
+    StatusEvents(harness.hass, harness.entry, coordinator).async_setup()
+    entry_data["search"] = SearchIndex(harness.entry, coordinator)
+    entry_data["search"].async_setup()
+    entities = await harness.async_setup_entities()
+    # Stand in for the state writes entities make when added to Home Assistant.
+    for entity in entities:
+        harness.entry.async_on_unload(
+            coordinator.async_add_listener(
+                lambda entity=entity: read_state(entity), entity.coordinator_context
+            )
+        )
+    return entities
+
+
+async def _async_sample(
+    cycle: int, start: float, lags: list[float], entities: list[Any]
+) -> dict[str, Any]:
+    """Record and print a sample, then restart the lag window."""
+    rss = _rss()
+    traced = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+    sample = {
+        "cycle": cycle,
+        "elapsed_s": round(perf_counter() - start, 1),
+        "rss_mib": round(rss / MIB, 2) if rss is not None else None,
+        "traced_mib": round(traced / MIB, 2) if traced is not None else None,
+        "gc_objects": len(gc.get_objects()),
+        "entities": len(entities),
+        "lag_max_ms": round(max(lags, default=0.0) * 1000, 1),
+        "lag_p99_ms": round(_percentile(lags, 0.99) * 1000, 1),
+    }
+    print(
+        f"{cycle:>8}{sample['elapsed_s']:>10.1f}"
+        f"{sample['rss_mib'] or 0:>10.1f}{sample['traced_mib'] or 0:>10.2f}"
+        f"{sample['gc_objects']:>11}{sample['lag_max_ms']:>10.1f}{sample['lag_p99_ms']:>10.1f}"
+    )
+    # Sampling blocks the loop itself; let the probe tick it delayed land
+    # before the next window starts.
+    await asyncio.sleep(TICK * 2)
+    lags.clear()
+    return sample
+
+
+async def soak(args: argparse.Namespace) -> int:
+    """Run the soak and return the process exit code."""
+    revisions = [load_feed(args.feed, revision) for revision in range(args.revisions)]
+    options = {CONF_PARSE_IN_EXECUTOR: args.executor, CONF_STREAMING_PARSER: args.streaming}
+    samples: list[dict[str, Any]] = []
+    failures: list[str] = []
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        harness = Harness(asyncio.get_running_loop(), config_dir)
+        harness.server.set_body(revisions[0])
+        entities = await _async_setup(harness, options)
+        stop = asyncio.Event()
+        lags: list[float] = []
+        probe = asyncio.create_task(_probe(stop, lags))
+        print(
+            f"feed {args.feed}, {len(revisions)} revisions, {len(entities)} entities, "
+            f"{args.cycles} cycles after {args.warmup} warm-up"
+        )
+        print(
+            f"{'cycle':>8}{'time s':>10}{'rss MiB':>10}{'traced':>10}"
+            f"{'objects':>11}{'lag max':>10}{'lag p99':>10}"
+        )
+        baseline: dict[str, Any] = {}
+        start = perf_counter()
+        try:
+            last = args.warmup + args.cycles
+            for cycle in range(last + 1):
+                if cycle == args.warmup:
+                    # Caches and series are full by now; measure from here.
+                    baseline["objects"] = _object_counts()
+                    tracemalloc.start(args.frames)
+                    baseline["tracemalloc"] = _take_snapshot()
+                    baseline["sample"] = await _async_sample(cycle, start, lags, entities)
+                    samples.append(baseline["sample"])
+                elif cycle > args.warmup and (
+                    (cycle - args.warmup) % args.sample_every == 0 or cycle == last
+                ):
+                    samples.append(await _async_sample(cycle, start, lags, entities))
+                if cycle == last:
+                    break
+                # Every other poll is a 304 for the previous revision.
+                harness.server.set_body(revisions[(cycle // 2) % len(revisions)])
+                await harness.coordinator.async_refresh()
+                if not harness.coordinator.last_update_success:
+                    failures.append(f"refresh failed at cycle {cycle}")
+                    break
+                await asyncio.sleep(0)
+        finally:
+            stop.set()
+            await probe
+            end_objects = _object_counts()
+            end_tracemalloc = _take_snapshot()
+            tracemalloc.stop()
+            await harness.async_stop()
+
+    if not baseline or end_tracemalloc is None:
+        print("\n".join(failures) or "run ended before the baseline")
+        return 1
+
+    end = samples[-1]
+    first = baseline["sample"]
+    print("\ntop allocators since the baseline:")
+    for stat in end_tracemalloc.compare_to(baseline["tracemalloc"], "lineno")[:TOP]:
+        print(f"  {stat}")
+
+    growth = end_objects - baseline["objects"]
+    print("\nobject growth since the baseline:")
+    for name, count in growth.most_common(TOP):
+        print(f"  {count:>+8}  {name}")
+
+    if first["rss_mib"] is not None and end["rss_mib"] is not None:
+        rss_growth = end["rss_mib"] - first["rss_mib"]
+        if rss_growth > args.max_rss_growth:
+            failures.append(f"RSS grew {rss_growth:.1f} MiB > {args.max_rss_growth} MiB")
+    traced_growth = end["traced_mib"] - first["traced_mib"]
+    if traced_growth > args.max_traced_growth:
+        failures.append(
+            f"traced memory grew {traced_growth:.2f} MiB > {args.max_traced_growth} MiB"
+        )
+    for name, count in growth.items():
+        if name.startswith("big_sky.") and count > args.max_object_growth:
+            failures.append(f"{count} more {name} objects > {args.max_object_growth}")
+    worst_lag = max(sample["lag_max_ms"] for sample in samples)
+    if args.max_loop_lag is not None and worst_lag > args.max_loop_lag:
+        failures.append(f"event loop lag reached {worst_lag} ms > {args.max_loop_lag} ms")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "feed": args.feed,
+                    "cycles": args.cycles,
+                    "samples": samples,
+                    "object_growth": dict(growth.most_common(TOP)),
+                    "failures": failures,
+                },
+                file,
+                indent=2,
+            )
+
+    print()
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if not failures:
+        print("PASS: no growth above the thresholds")
+    return 1 if failures else 0
+
+
+def main() -> None:
+    """Parse the arguments and run the soak."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--feed", choices=FEEDS, default="sample")
+    parser.add_argument("--cycles", type=int, default=20000)
+    parser.add_argument("--warmup", type=int, default=1000)
+    parser.add_argument("--revisions", type=int, default=8)
+    parser.add_argument("--sample-every", type=int, default=1000)
+    parser.add_argument("--frames", type=int, default=1, help="tracemalloc frames")
+    parser.add_argument("--streaming", action="store_true")
+    parser.add_argument("--executor", action="store_true")
+    parser.add_argument("--max-rss-growth", type=float, default=32.0, help="MiB")
+    parser.add_argument("--max-traced-growth", type=float, default=4.0, help="MiB")
+    parser.add_argument(
+        "--max-object-growth", type=int, default=100, help="per big_sky class"
+    )
+    parser.add_argument("--max-loop-lag", type=float, default=None, help="ms")
+    parser.add_argument("--json", help="write the samples to this file")
+    sys.exit(asyncio.run(soak(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,14 @@
 from __future__ import annotations
 from datetime import timedelta
 import logging
-import xmltodict
-import aiohttp
-import async_timeout
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
     DOMAIN,
@@ -17,70 +16,120 @@ from .const import (
     CONF_FEED_URL,
     CONF_CREATE_RUN_ENTITIES,
     CONF_CREATE_LIFT_ENTITIES,
+    CONF_RESORT_MAP,
     CONF_UPDATE_INTERVAL,
     DEFAULT_UPDATE_INTERVAL,
+    SIGNAL_OPTIONS_UPDATED,
 )
+from .api import resort_id_from_url
+from .coordinator import BigSkyDataUpdateCoordinator
+from .events import StatusEvents
+from .history import StatusHistory, async_remove_history
+from .resort_map import ResortMapIndex
+from .search import SearchIndex
+from .services import async_setup_services
+from .storage import SnapshotStore
+from .websocket_api import async_setup_websocket_api
+
 LOGGER = logging.getLogger(__name__)
 LOGGER.debug("Initializing Big Sky Resort component.")
-DEFAULT_PLATFORMS = [Platform.SENSOR, Platform.WEATHER]
+PLATFORMS = [Platform.SENSOR, Platform.WEATHER, Platform.BINARY_SENSOR]
+# Options that running entities pick up without reloading the entry.
+LIVE_OPTIONS = frozenset(
+    {
+        CONF_CREATE_RUN_ENTITIES,
+        CONF_CREATE_LIFT_ENTITIES,
+        CONF_RESORT_MAP,
+        CONF_UPDATE_INTERVAL,
+    }
+)
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Big Sky Resort component."""
     hass.data[DOMAIN] = {}
+    async_setup_services(hass)
+    async_setup_websocket_api(hass)
     return True
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Big Sky Resort from a config entry."""
     LOGGER.debug("Setting up Big Sky Resort entry with data: %s", entry.data)
-    platforms = DEFAULT_PLATFORMS.copy()
-    if entry.data.get(CONF_CREATE_RUN_ENTITIES, True) or entry.data.get(CONF_CREATE_LIFT_ENTITIES, True):
-        platforms.append(Platform.BINARY_SENSOR)
-
-
-    async def async_update_data():
-        """Fetch data from API."""
-        try:
-            feed_url = entry.data.get(CONF_FEED_URL, DEFAULT_FEED_URL)
-            async with async_timeout.timeout(10):
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(feed_url) as response:
-                        if response.status != 200:
-                            raise UpdateFailed(f"Error fetching data: {response.status}")
-                        xml_data = await response.text()
-                        return xmltodict.parse(xml_data)
-        except Exception as err:
-            raise UpdateFailed(f"Error fetching data: {err}")
-
-    coordinator = DataUpdateCoordinator(
-        hass,
-        LOGGER,
-        name="big_sky_resort",
-        update_method=async_update_data,
-        update_interval=timedelta(minutes=entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)),
-    )
-
-    await coordinator.async_config_entry_first_refresh()
+    # The binary sensor platform is always loaded so lift and trail
+    # entities can be switched on later without a reload.
+    platforms = PLATFORMS.copy()
+
+    coordinator = BigSkyDataUpdateCoordinator(hass, entry)
+
+    # Start from the cached snapshot when there is one so entities exist
+    # even while the feed is slow or down, then refresh in the background.
+    cached = await coordinator.async_load_cache()
+    if not cached:
+        await coordinator.async_config_entry_first_refresh()
+
+    history = StatusHistory(hass, entry, coordinator)
+    await history.async_setup()
+    StatusEvents(hass, entry, coordinator).async_setup()
+    search = SearchIndex(entry, coordinator)
+    search.async_setup()
+    resort_map = ResortMapIndex(hass, entry.entry_id)
+    await resort_map.async_load()
 
     hass.data[DOMAIN][entry.entry_id] = {
         "coordinator": coordinator,
+        "history": history,
+        "resort_map": resort_map,
+        "search": search,
         "config": entry.data,
+        "platforms": platforms,
     }
 
     await hass.config_entries.async_forward_entry_setups(entry, platforms)
     entry.async_on_unload(entry.add_update_listener(update_listener))
+    if cached:
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} refresh after cache load"
+        )
     return True
 
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    entry_data = hass.data[DOMAIN].get(entry.entry_id)
+    if entry_data is None:
+        return
+    previous = entry_data["config"]
+    changed = {
+        key for key in previous.keys() | entry.data.keys()
+        if previous.get(key) != entry.data.get(key)
+    }
+    if not changed:
+        return
+    if not changed <= LIVE_OPTIONS:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    entry_data["config"] = entry.data
+    if CONF_UPDATE_INTERVAL in changed:
+        entry_data["coordinator"].async_set_base_interval(
+            timedelta(minutes=entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL))
+        )
+    async_dispatcher_send(hass, SIGNAL_OPTIONS_UPDATED.format(entry.entry_id))
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    platforms = hass.data[DOMAIN][entry.entry_id]["platforms"]
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, platforms)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        await entry_data["coordinator"].async_shutdown()
+        await entry_data["history"].async_close()
     return unload_ok
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the cached snapshot, history and map index of a removed entry."""
+    await SnapshotStore(hass, entry.entry_id).async_remove()
+    await ResortMapIndex(hass, entry.entry_id).async_remove()
+    await async_remove_history(hass, entry.entry_id)
+
 async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Migrate old entry."""
     LOGGER.debug("Migrating from version %s", config_entry.version)
@@ -90,7 +139,25 @@ async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
         new_data.setdefault(CONF_CREATE_RUN_ENTITIES, True)
         new_data.setdefault(CONF_CREATE_LIFT_ENTITIES, True)
         new_data.setdefault(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
-        config_entry.version = 2
-        hass.config_entries.async_update_entry(config_entry, data=new_data)
+        hass.config_entries.async_update_entry(config_entry, data=new_data, version=2)
+
+    if config_entry.version == 2:
+        # Entity unique IDs are namespaced by resort so several resorts can
+        # be configured side by side.
+        resort_id = resort_id_from_url(config_entry.data.get(CONF_FEED_URL, DEFAULT_FEED_URL))
+        prefix = f"{DOMAIN}_{resort_id}_"
+
+        @callback
+        def _migrate_unique_id(entity_entry: er.RegistryEntry) -> dict[str, Any] | None:
+            if entity_entry.unique_id.startswith(prefix):
+                return None
+            return {
+                "new_unique_id": entity_entry.unique_id.replace(f"{DOMAIN}_", prefix, 1)
+            }
+
+        await er.async_migrate_entries(hass, config_entry.entry_id, _migrate_unique_id)
+        hass.config_entries.async_update_entry(
+            config_entry, unique_id=resort_id, version=3
+        )
     LOGGER.info("Migration to version %s successful", config_entry.version)
     return True
\ No newline at end of file
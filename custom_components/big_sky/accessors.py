@@ -0,0 +1,106 @@
+"""Declarative field descriptions compiled into fast accessors."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from operator import attrgetter, itemgetter
+import re
+from typing import Any
+
+_SEGMENT = re.compile(r"\.?([A-Za-z_]\w*)|\[(\w+)\]")
+
+# What a missing link anywhere along a path raises.
+_MISSING = (AttributeError, KeyError, IndexError, TypeError)
+
+
+def compile_path(path: str) -> Callable[[Any], Any]:
+    """Compile ``a.b[key].c[0]`` into a function reading it from an object.
+
+    Runs of attributes become one C-level ``attrgetter`` and ``[key]`` or
+    ``[0]`` become ``itemgetter``s, so a read is one call per run instead
+    of a parse of the path.
+    """
+    getters: list[Callable[[Any], Any]] = []
+    attributes: list[str] = []
+    position = 0
+    while position < len(path):
+        if (match := _SEGMENT.match(path, position)) is None:
+            raise ValueError(f"Invalid field path {path!r} at {position}")
+        position = match.end()
+        name, key = match.groups()
+        if name is not None:
+            attributes.append(name)
+            continue
+        if attributes:
+            getters.append(attrgetter(".".join(attributes)))
+            attributes = []
+        getters.append(itemgetter(int(key) if key.isdigit() else key))
+    if attributes:
+        getters.append(attrgetter(".".join(attributes)))
+
+    if len(getters) == 1:
+        return getters[0]
+
+    def read(source: Any) -> Any:
+        for getter in getters:
+            source = getter(source)
+        return source
+
+    return read
+
+
+def compile_accessor(
+    path: str,
+    converter: Callable[[Any], Any] | None = None,
+    default: Any = None,
+) -> Callable[[Any], Any]:
+    """Compile a path and converter into a reader that never raises.
+
+    A missing link along the path, a None value or a value the converter
+    rejects all read as ``default``.
+    """
+    get = compile_path(path)
+
+    def read(source: Any) -> Any:
+        try:
+            value = get(source)
+        except _MISSING:
+            return default
+        if value is None:
+            return default
+        if converter is None:
+            return value
+        try:
+            return converter(value)
+        except (TypeError, ValueError):
+            return default
+
+    return read
+
+
+def to_minutes(value: timedelta) -> float:
+    """Convert a duration to minutes."""
+    return round(value.total_seconds() / 60, 2)
+
+
+def is_positive(value: float) -> bool:
+    """Return whether a count is above zero."""
+    return value > 0
+
+
+@dataclass(frozen=True, kw_only=True)
+class FieldDescriptionMixin:
+    """Fields of an entity description whose state is one coordinator field.
+
+    Mixed into the platforms' entity descriptions. ``read`` returns the
+    state from the coordinator, usually a ``compile_accessor`` of a path
+    such as ``data.resort.snow_base`` or ``rollups.lifts[open]``.
+    ``sections`` are the diff sections the entity listens to.
+    ``attributes``, when set, builds the state attributes from the
+    coordinator.
+    """
+
+    read: Callable[[Any], Any]
+    sections: tuple[str, ...]
+    attributes: Callable[[Any], dict[str, Any]] | None = None
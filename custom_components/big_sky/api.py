@@ -0,0 +1,162 @@
+"""Feed client for Big Sky Resort."""
+from __future__ import annotations
+
+import hashlib
+from importlib.util import find_spec
+import logging
+import re
+from time import monotonic
+
+from typing import Protocol
+from xml.parsers.expat import ExpatError
+
+import aiohttp
+from aiohttp import hdrs
+
+# aiohttp can only decode brotli when one of these packages is installed.
+ACCEPT_ENCODING = (
+    "gzip, deflate, br"
+    if any(find_spec(name) for name in ("brotli", "brotlicffi"))
+    else "gzip, deflate"
+)
+
+CHUNK_SIZE = 16384
+
+_RESORT_ID = re.compile(r"/mtnxml/(\w+)")
+
+LOGGER = logging.getLogger(__name__)
+
+
+class FeedSink(Protocol):
+    """Consumer that parses the body while it is being downloaded."""
+
+    def feed(self, chunk: bytes) -> None:
+        """Consume the next chunk of the body."""
+
+
+def resort_id_from_url(feed_url: str) -> str:
+    """Return the provider's resort ID from a feed URL.
+
+    Feeds follow ``.../mtnxml/<id>``; other URLs fall back to a short hash
+    so every feed still gets a stable ID.
+    """
+    if match := _RESORT_ID.search(feed_url):
+        return match.group(1)
+    return hashlib.sha256(feed_url.encode()).hexdigest()[:12]
+
+
+class BigSkyFeedError(Exception):
+    """Raised when the resort feed cannot be fetched."""
+
+
+class FeedResponse:
+    """A changed feed body together with its cache validators.
+
+    ``body`` is None when the body was streamed into a sink instead.
+    """
+
+    __slots__ = ("body", "etag", "last_modified", "digest")
+
+    def __init__(
+        self,
+        body: bytes | None,
+        etag: str | None,
+        last_modified: str | None,
+        digest: bytes,
+    ) -> None:
+        """Initialize the response."""
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.digest = digest
+
+
+class BigSkyFeedClient:
+    """Conditional fetcher for the resort XML feed.
+
+    ``ETag``/``Last-Modified`` validators are sent back to the server so an
+    unchanged feed costs a bodiless 304. Servers that ignore validators are
+    caught by hashing the body. Validators are only remembered once the
+    caller commits a response it parsed successfully.
+    """
+
+    def __init__(self, feed_url: str) -> None:
+        """Initialize the client."""
+        self.feed_url = feed_url
+        self.etag: str | None = None
+        self.last_modified: str | None = None
+        self.digest: bytes | None = None
+        self.last_fetch_duration: float | None = None
+        # Bytes on the wire, before decompression; None when unknown.
+        self.last_fetch_bytes: int | None = 0
+
+    async def async_fetch(
+        self, session: aiohttp.ClientSession, sink: FeedSink | None = None
+    ) -> FeedResponse | None:
+        """Fetch the feed, returning None when it has not changed.
+
+        With a ``sink`` the body is handed over chunk by chunk as it arrives
+        and is never buffered in full.
+        """
+        headers = {hdrs.ACCEPT_ENCODING: ACCEPT_ENCODING}
+        if self.etag:
+            headers[hdrs.IF_NONE_MATCH] = self.etag
+        if self.last_modified:
+            headers[hdrs.IF_MODIFIED_SINCE] = self.last_modified
+
+        start = monotonic()
+        async with session.get(self.feed_url, headers=headers) as response:
+            if response.status == 304:
+                self._record_timing(start, 0, response.status)
+                return None
+            if response.status != 200:
+                raise BigSkyFeedError(f"Error fetching data: {response.status}")
+            if sink is None:
+                body = await response.read()
+                size = len(body)
+                digest = hashlib.sha256(body).digest()
+            else:
+                body = None
+                size = 0
+                hasher = hashlib.sha256()
+                async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                    hasher.update(chunk)
+                    try:
+                        sink.feed(chunk)
+                    except (ExpatError, ValueError) as err:
+                        raise BigSkyFeedError(f"Invalid feed: {err}") from err
+                    size += len(chunk)
+                digest = hasher.digest()
+            # aiohttp hands over the decompressed body; the transfer size of
+            # a compressed one is only known from its Content-Length.
+            if response.content_length is not None:
+                size = response.content_length
+            elif hdrs.CONTENT_ENCODING in response.headers:
+                size = None
+            etag = response.headers.get(hdrs.ETAG)
+            last_modified = response.headers.get(hdrs.LAST_MODIFIED)
+        self._record_timing(start, size, response.status)
+
+        if digest == self.digest:
+            self.etag = etag or self.etag
+            self.last_modified = last_modified or self.last_modified
+            return None
+        return FeedResponse(body, etag, last_modified, digest)
+
+    def _record_timing(self, start: float, size: int | None, status: int) -> None:
+        """Record and log how long the last fetch took."""
+        self.last_fetch_duration = monotonic() - start
+        self.last_fetch_bytes = size
+        LOGGER.debug(
+            "Fetched %s in %.3f seconds (status: %s, bytes: %s)",
+            self.feed_url,
+            self.last_fetch_duration,
+            status,
+            size,
+        )
+
+    def commit(self, response: FeedResponse) -> None:
+        """Remember the validators of a successfully parsed response."""
+        self.etag = response.etag
+        self.last_modified = response.last_modified
+        self.digest = response.digest
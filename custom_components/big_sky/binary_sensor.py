@@ -1,8 +1,11 @@
 """Binary sensors for Big Sky Resort."""
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
+    BinarySensorEntityDescription,
     BinarySensorDeviceClass,
 )
 from homeassistant.config_entries import ConfigEntry
@@ -10,10 +13,70 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .accessors import FieldDescriptionMixin, compile_accessor, is_positive
 from .const import (
     DOMAIN,
     CONF_CREATE_LIFT_ENTITIES,
     CONF_CREATE_RUN_ENTITIES,
+    CONF_RESORT_MAP,
+)
+from .diff import (
+    SECTION_COORDINATOR,
+    SECTION_LIFT,
+    SECTION_PARK,
+    SECTION_RESORT,
+    SECTION_TRAIL,
+    item_context,
+    section_context,
+)
+from .reconcile import EntityReconciler, ItemFamily
+
+
+def _resort_attributes(coordinator):
+    resort = coordinator.data.resort
+    last_fetch = coordinator.last_fetch
+    return {
+        "open_time": resort.open_time,
+        "close_time": resort.close_time,
+        "last_fetch": last_fetch.isoformat() if last_fetch else None,
+        "stale": coordinator.stale
+    }
+
+
+def _legacy_unique_id(coordinator, kind, name):
+    """Return the unique ID of an item's entity from before it had the area."""
+    return coordinator.entity_unique_id(f"{kind}_{name.lower().replace(' ', '_')}")
+
+
+@dataclass(frozen=True, kw_only=True)
+class BigSkyBinarySensorEntityDescription(
+    FieldDescriptionMixin, BinarySensorEntityDescription
+):
+    """Binary sensor whose state is one field of the coordinator."""
+
+
+BINARY_SENSOR_DESCRIPTIONS = (
+    BigSkyBinarySensorEntityDescription(
+        key="resort_open",
+        name="Resort Status",
+        read=compile_accessor("data.resort.is_open"),
+        sections=(SECTION_RESORT, SECTION_COORDINATOR),
+        attributes=_resort_attributes,
+        device_class=BinarySensorDeviceClass.RUNNING,
+    ),
+    BigSkyBinarySensorEntityDescription(
+        key="snow_making",
+        name="Snow Making",
+        read=compile_accessor(
+            "data.resort.num_trails_snow_making", is_positive, default=False
+        ),
+        sections=(SECTION_RESORT,),
+        attributes=lambda coordinator: {
+            "trails_with_snowmaking": coordinator.data.resort.num_trails_snow_making
+        },
+        icon="mdi:snowflake",
+        device_class=BinarySensorDeviceClass.RUNNING,
+    ),
 )
 
 
@@ -24,105 +87,100 @@ async def async_setup_entry(
 ) -> None:
     """Set up Big Sky binary sensors based on config entry options."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
-    entities = []
-
-    # Resort status and snow making sensors
-    entities.extend([
-        BigSkyResortStatusBinarySensor(coordinator),
-        BigSkySnowMakingBinarySensor(coordinator)
-    ])
-
-    # Conditionally add lift and trail sensors based on config
-    if config_entry.data.get(CONF_CREATE_LIFT_ENTITIES, True):
-        areas = coordinator.data["report"]["facilities"]["areas"]["area"]
-        if isinstance(areas, list):
-            for area in areas:
-                if "lifts" in area:
-                    area_lifts = area["lifts"]["lift"]
-                    if isinstance(area_lifts, list):
-                        for lift in area_lifts:
-                            entities.append(
-                                BigSkyLiftBinarySensor(
-                                    coordinator,
-                                    lift["@name"],
-                                    area["@name"],
-                                    lift["@type"]
-                                )
-                            )
-                    else:
-                        entities.append(
-                            BigSkyLiftBinarySensor(
-                                coordinator,
-                                area_lifts["@name"],
-                                area["@name"],
-                                area_lifts["@type"]
-                            )
-                        )
-
-    if config_entry.data.get(CONF_CREATE_RUN_ENTITIES, True):
-        areas = coordinator.data["report"]["facilities"]["areas"]["area"]
-        if isinstance(areas, list):
-            for area in areas:
-                if "trails" in area:
-                    trails = area["trails"]["trail"]
-                    if isinstance(trails, list):
-                        for trail in trails:
-                            entities.append(
-                                BigSkyTrailBinarySensor(
-                                    coordinator,
-                                    trail["@name"],
-                                    area["@name"],
-                                    trail["@difficulty"]
-                                )
-                            )
-                    else:
-                        entities.append(
-                            BigSkyTrailBinarySensor(
-                                coordinator,
-                                trails["@name"],
-                                area["@name"],
-                                trails["@difficulty"]
-                            )
-                        )
-
-    async_add_entities(entities)
-
-
-class BigSkyResortStatusBinarySensor(CoordinatorEntity, BinarySensorEntity):
-    """Binary sensor for resort open/closed status."""
-
-    def __init__(self, coordinator):
-        super().__init__(coordinator)
-        self._attr_name = "Big Sky Resort Status"
-        self._attr_unique_id = "big_sky_resort_open"
-        self._attr_device_class = BinarySensorDeviceClass.RUNNING
+    async_add_entities(
+        BigSkyFieldBinarySensor(coordinator, description)
+        for description in BINARY_SENSOR_DESCRIPTIONS
+    )
+
+    # Lift, trail and park sensors follow the feed and the entity options;
+    # in resort map mode the area sensors carry their statuses instead.
+    EntityReconciler(
+        hass,
+        config_entry,
+        coordinator,
+        async_add_entities,
+        [
+            ItemFamily(
+                SECTION_LIFT,
+                CONF_CREATE_LIFT_ENTITIES,
+                lambda snapshot: snapshot.lifts,
+                lambda lift: BigSkyLiftBinarySensor(
+                    coordinator, lift.name, lift.area, lift.type
+                ),
+                disabled_by=CONF_RESORT_MAP,
+                legacy_unique_id=lambda lift: _legacy_unique_id(
+                    coordinator, "lift", lift.name
+                ),
+            ),
+            ItemFamily(
+                SECTION_TRAIL,
+                CONF_CREATE_RUN_ENTITIES,
+                lambda snapshot: snapshot.trails,
+                lambda trail: BigSkyTrailBinarySensor(
+                    coordinator, trail.name, trail.area, trail.difficulty
+                ),
+                disabled_by=CONF_RESORT_MAP,
+                legacy_unique_id=lambda trail: _legacy_unique_id(
+                    coordinator, "trail", trail.name
+                ),
+            ),
+            ItemFamily(
+                SECTION_PARK,
+                CONF_CREATE_RUN_ENTITIES,
+                lambda snapshot: snapshot.parks,
+                lambda park: BigSkyParkBinarySensor(
+                    coordinator, park.name, park.area, park.difficulty
+                ),
+                disabled_by=CONF_RESORT_MAP,
+                legacy_unique_id=lambda park: _legacy_unique_id(
+                    coordinator, "park", park.name
+                ),
+            ),
+        ],
+    ).async_setup()
+
+
+class BigSkyFieldBinarySensor(CoordinatorEntity, BinarySensorEntity):
+    """Binary sensor described by a row of ``BINARY_SENSOR_DESCRIPTIONS``."""
+
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator, description):
+        super().__init__(coordinator, section_context(*description.sections))
+        self.entity_description = description
+        self._attr_unique_id = coordinator.entity_unique_id(description.key)
+        self._attr_device_info = coordinator.device_info
 
     @property
-    def is_on(self) -> bool:
-        """Return true if the resort is open."""
-        return self.coordinator.data["report"]["operations"]["@resortStatus"].lower() == "open"
+    def is_on(self) -> bool | None:
+        """Return the described field."""
+        return self.entity_description.read(self.coordinator)
 
     @property
     def extra_state_attributes(self):
-        """Return additional resort status information."""
-        operations = self.coordinator.data["report"]["operations"]
-        return {
-            "open_time": operations["@openTime"],
-            "close_time": operations["@closeTime"]
-        }
+        """Return the described attributes."""
+        if (attributes := self.entity_description.attributes) is None:
+            return None
+        return attributes(self.coordinator)
 
 
 class BigSkyLiftBinarySensor(CoordinatorEntity, BinarySensorEntity):
     """Binary sensor for lift status."""
 
+    _attr_has_entity_name = True
+
     def __init__(self, coordinator, lift_name, area_name, lift_type):
         """Initialize lift binary sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, item_context(SECTION_LIFT, area_name, lift_name))
         self._lift_name = lift_name
         self._area_name = area_name
         self._lift_type = lift_type
-        self._attr_name = f"Lift {lift_name}"
-        self._attr_unique_id = f"big_sky_lift_{lift_name.lower().replace(' ', '_')}"
+        self._key = (area_name, lift_name)
+        self._attr_name = lift_name
+        self._attr_unique_id = coordinator.item_unique_id(
+            "lift", area_name, lift_name
+        )
+        self._attr_device_info = coordinator.device_info
         self._attr_device_class = BinarySensorDeviceClass.RUNNING
        # Set different icons based on lift type
         if "Tram" in lift_type:
@@ -137,60 +195,41 @@ class BigSkyLiftBinarySensor(CoordinatorEntity, BinarySensorEntity):
     @property
     def is_on(self) -> bool:
         """Return true if the lift is open."""
-        areas = self.coordinator.data["report"]["facilities"]["areas"]["area"]
-        if isinstance(areas, list):
-            for area in areas:
-                if area["@name"] == self._area_name and "lifts" in area:
-                    lifts = area["lifts"]["lift"]
-                    if isinstance(lifts, list):
-                        for lift in lifts:
-                            if lift["@name"] == self._lift_name:
-                                return lift["@status"].lower() == "open"
-                    elif lifts["@name"] == self._lift_name:
-                        return lifts["@status"].lower() == "open"
-        return False
+        lift = self.coordinator.data.lifts.get(self._key)
+        return lift.is_open if lift else False
 
     @property
     def extra_state_attributes(self):
         """Return additional lift status information."""
-        areas = self.coordinator.data["report"]["facilities"]["areas"]["area"]
-        if isinstance(areas, list):
-            for area in areas:
-                if area["@name"] == self._area_name and "lifts" in area:
-                    lifts = area["lifts"]["lift"]
-                    if isinstance(lifts, list):
-                        for lift in lifts:
-                            if lift["@name"] == self._lift_name:
-                                return {
-                                    "type": lift["@type"],
-                                    "capacity": lift.get("@capacity", ""),
-                                    "area": self._area_name,
-                                    "open_time": lift.get("@openTime", ""),
-                                    "close_time": lift.get("@closeTime", ""),
-                                    "status_detail": lift.get("@statusDetail", "")
-                                }
-                    elif lifts["@name"] == self._lift_name:
-                        return {
-                            "type": lifts["@type"],
-                            "capacity": lifts.get("@capacity", ""),
-                            "area": self._area_name,
-                            "open_time": lifts.get("@openTime", ""),
-                            "close_time": lifts.get("@closeTime", ""),
-                            "status_detail": lifts.get("@statusDetail", "")
-                        }
-        return {}
+        lift = self.coordinator.data.lifts.get(self._key)
+        if lift is None:
+            return {}
+        return {
+            "type": lift.type,
+            "capacity": lift.capacity,
+            "area": self._area_name,
+            "open_time": lift.open_time,
+            "close_time": lift.close_time,
+            "status_detail": lift.status_detail
+        }
 
 class BigSkyTrailBinarySensor(CoordinatorEntity, BinarySensorEntity):
     """Binary sensor for trail status."""
 
+    _attr_has_entity_name = True
+
     def __init__(self, coordinator, trail_name, area_name, difficulty):
         """Initialize trail binary sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, item_context(SECTION_TRAIL, area_name, trail_name))
         self._trail_name = trail_name
         self._area_name = area_name
         self._difficulty = difficulty
-        self._attr_name = f"Trail {trail_name}"
-        self._attr_unique_id = f"big_sky_trail_{trail_name.lower().replace(' ', '_')}"
+        self._key = (area_name, trail_name)
+        self._attr_name = trail_name
+        self._attr_unique_id = coordinator.item_unique_id(
+            "trail", area_name, trail_name
+        )
+        self._attr_device_info = coordinator.device_info
         self._attr_device_class = BinarySensorDeviceClass.RUNNING
         
         # Set different icons based on difficulty
@@ -206,63 +245,56 @@ class BigSkyTrailBinarySensor(CoordinatorEntity, BinarySensorEntity):
     @property
     def is_on(self) -> bool:
         """Return true if the trail is open."""
-        areas = self.coordinator.data["report"]["facilities"]["areas"]["area"]
-        if isinstance(areas, list):
-            for area in areas:
-                if area["@name"] == self._area_name and "trails" in area:
-                    trails = area["trails"]["trail"]
-                    if isinstance(trails, list):
-                        for trail in trails:
-                            if trail["@name"] == self._trail_name:
-                                return trail["@status"].lower() == "open"
-                    elif trails["@name"] == self._trail_name:
-                        return trails["@status"].lower() == "open"
-        return False
+        trail = self.coordinator.data.trails.get(self._key)
+        return trail.is_open if trail else False
 
     @property
     def extra_state_attributes(self):
         """Return additional trail status information."""
-        areas = self.coordinator.data["report"]["facilities"]["areas"]["area"]
-        if isinstance(areas, list):
-            for area in areas:
-                if area["@name"] == self._area_name and "trails" in area:
-                    trails = area["trails"]["trail"]
-                    if isinstance(trails, list):
-                        for trail in trails:
-                            if trail["@name"] == self._trail_name:
-                                return {
-                                    "difficulty": trail["@difficulty"],
-                                    "area": self._area_name,
-                                    "groomed": trail.get("@groomed", "no"),
-                                    "uphill": trail.get("@uphill", "no")
-                                }
-                    elif trails["@name"] == self._trail_name:
-                        return {
-                            "difficulty": trails["@difficulty"],
-                            "area": self._area_name,
-                            "groomed": trails.get("@groomed", "no"),
-                            "uphill": trails.get("@uphill", "no")
-                        }
-        return {}
-
-class BigSkySnowMakingBinarySensor(CoordinatorEntity, BinarySensorEntity):
-    """Binary sensor for snow making status."""
-
-    def __init__(self, coordinator):
-        super().__init__(coordinator)
-        self._attr_name = "Big Sky Snow Making"
-        self._attr_unique_id = "big_sky_snow_making"
+        trail = self.coordinator.data.trails.get(self._key)
+        if trail is None:
+            return {}
+        return {
+            "difficulty": trail.difficulty,
+            "area": self._area_name,
+            "groomed": trail.groomed,
+            "uphill": trail.uphill
+        }
+
+class BigSkyParkBinarySensor(CoordinatorEntity, BinarySensorEntity):
+    """Binary sensor for terrain park status."""
+
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator, park_name, area_name, difficulty):
+        """Initialize terrain park binary sensor."""
+        super().__init__(coordinator, item_context(SECTION_PARK, area_name, park_name))
+        self._park_name = park_name
+        self._area_name = area_name
+        self._difficulty = difficulty
+        self._key = (area_name, park_name)
+        self._attr_name = park_name
+        self._attr_unique_id = coordinator.item_unique_id(
+            "park", area_name, park_name
+        )
+        self._attr_device_info = coordinator.device_info
         self._attr_device_class = BinarySensorDeviceClass.RUNNING
-        self._attr_icon = "mdi:snowflake"
+        self._attr_icon = "mdi:snowboard"
 
     @property
     def is_on(self) -> bool:
-        """Return true if snow making is active."""
-        return int(self.coordinator.data["report"]["currentConditions"]["resortwide"]["@numTrailsSnowMaking"]) > 0
+        """Return true if the park is open."""
+        park = self.coordinator.data.parks.get(self._key)
+        return park.is_open if park else False
 
     @property
     def extra_state_attributes(self):
-        """Return number of trails with snowmaking."""
+        """Return additional park status information."""
+        park = self.coordinator.data.parks.get(self._key)
+        if park is None:
+            return {}
         return {
-            "trails_with_snowmaking": self.coordinator.data["report"]["currentConditions"]["resortwide"]["@numTrailsSnowMaking"]
-        }
\ No newline at end of file
+            "difficulty": park.difficulty,
+            "area": self._area_name,
+            "groomed": park.groomed
+        }
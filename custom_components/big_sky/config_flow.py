@@ -1,15 +1,24 @@
 """Config flow for Big Sky Resort integration."""
 from __future__ import annotations
+import asyncio
 from typing import Any
+from xml.parsers.expat import ExpatError
+
+import aiohttp
+import async_timeout
 import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.config_validation as cv
 
+from .api import BigSkyFeedClient, BigSkyFeedError, resort_id_from_url
 from .const import (
     DOMAIN,
+    NAME,
     DEFAULT_FEED_URL,
     DEFAULT_UPDATE_INTERVAL,
     MIN_UPDATE_INTERVAL,
@@ -18,42 +27,70 @@ from .const import (
     CONF_CREATE_RUN_ENTITIES,
     CONF_CREATE_LIFT_ENTITIES,
     CONF_UPDATE_INTERVAL,
+    CONF_STREAMING_PARSER,
+    CONF_PARSE_IN_EXECUTOR,
+    CONF_ADAPTIVE_POLLING,
+    CONF_SLIM_ATTRIBUTES,
+    CONF_RESORT_MAP,
+    CONF_SHARED_CACHE_DIR,
 )
+from .parser import parse_feed
+
+class CannotConnect(HomeAssistantError):
+    """Error to indicate the feed could not be fetched or parsed."""
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
-    # TODO: Add API URL validation
-    return {"title": "Big Sky Resort"}
+    client = BigSkyFeedClient(data[CONF_FEED_URL])
+    try:
+        async with async_timeout.timeout(10):
+            response = await client.async_fetch(async_get_clientsession(hass))
+        snapshot = parse_feed(response.body)
+    except (asyncio.TimeoutError, aiohttp.ClientError, BigSkyFeedError, ExpatError, ValueError) as err:
+        raise CannotConnect from err
+    return {"title": snapshot.resort.name or NAME}
 
 class BigSkyConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Big Sky Resort."""
 
-    VERSION = 2
+    VERSION = 3
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle the initial step."""
-        if self._async_current_entries():
-            return self.async_abort(reason="single_instance_allowed")
-
-        if user_input is None:
-            return self.async_show_form(
-                step_id="user",
-                data_schema=vol.Schema({
-                    vol.Required(CONF_FEED_URL, default=DEFAULT_FEED_URL): cv.string,
-                    vol.Required(CONF_CREATE_LIFT_ENTITIES, default=True): cv.boolean,
-                    vol.Required(CONF_CREATE_RUN_ENTITIES, default=True): cv.boolean,
-                    vol.Required(CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL): vol.All(
-                        vol.Coerce(int),
-                        vol.Range(min=MIN_UPDATE_INTERVAL, max=MAX_UPDATE_INTERVAL)
-                    ),
-                })
-            )
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            await self.async_set_unique_id(resort_id_from_url(user_input[CONF_FEED_URL]))
+            self._abort_if_unique_id_configured()
+            try:
+                info = await validate_input(self.hass, user_input)
+            except CannotConnect:
+                errors["base"] = "cannot_connect"
+            else:
+                return self.async_create_entry(
+                    title=info["title"],
+                    data=user_input
+                )
 
-        return self.async_create_entry(
-            title="Big Sky Resort",
-            data=user_input
+        return self.async_show_form(
+            step_id="user",
+            data_schema=vol.Schema({
+                vol.Required(CONF_FEED_URL, default=DEFAULT_FEED_URL): cv.string,
+                vol.Required(CONF_CREATE_LIFT_ENTITIES, default=True): cv.boolean,
+                vol.Required(CONF_CREATE_RUN_ENTITIES, default=True): cv.boolean,
+                vol.Required(CONF_RESORT_MAP, default=False): cv.boolean,
+                vol.Required(CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=MIN_UPDATE_INTERVAL, max=MAX_UPDATE_INTERVAL)
+                ),
+                vol.Required(CONF_STREAMING_PARSER, default=False): cv.boolean,
+                vol.Required(CONF_PARSE_IN_EXECUTOR, default=False): cv.boolean,
+                vol.Required(CONF_ADAPTIVE_POLLING, default=False): cv.boolean,
+                vol.Required(CONF_SLIM_ATTRIBUTES, default=False): cv.boolean,
+                vol.Optional(CONF_SHARED_CACHE_DIR, default=""): cv.string,
+            }),
+            errors=errors,
         )
 
     @staticmethod
@@ -74,15 +111,18 @@ class BigSkyOptionsFlow(config_entries.OptionsFlow):
     ) -> FlowResult:
         """Manage options."""
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            # The integration reads its settings from entry.data, so options
+            # are merged there rather than kept in entry.options. The feed URL
+            # is not an option: it names the resort the entry's unique ID and
+            # entity IDs are derived from, so another resort is a new entry.
+            self.hass.config_entries.async_update_entry(
+                self.config_entry, data={**self.config_entry.data, **user_input}
+            )
+            return self.async_create_entry(title="", data={})
 
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema({
-                vol.Required(
-                    CONF_FEED_URL,
-                    default=self.config_entry.data.get(CONF_FEED_URL, DEFAULT_FEED_URL),
-                ): cv.string,
                 vol.Required(
                     CONF_CREATE_LIFT_ENTITIES,
                     default=self.config_entry.data.get(CONF_CREATE_LIFT_ENTITIES, True),
@@ -91,6 +131,10 @@ class BigSkyOptionsFlow(config_entries.OptionsFlow):
                     CONF_CREATE_RUN_ENTITIES,
                     default=self.config_entry.data.get(CONF_CREATE_RUN_ENTITIES, True),
                 ): cv.boolean,
+                vol.Required(
+                    CONF_RESORT_MAP,
+                    default=self.config_entry.data.get(CONF_RESORT_MAP, False),
+                ): cv.boolean,
                 vol.Required(
                     CONF_UPDATE_INTERVAL,
                     default=self.config_entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
@@ -98,5 +142,25 @@ class BigSkyOptionsFlow(config_entries.OptionsFlow):
                     vol.Coerce(int),
                     vol.Range(min=MIN_UPDATE_INTERVAL, max=MAX_UPDATE_INTERVAL)
                 ),
+                vol.Required(
+                    CONF_STREAMING_PARSER,
+                    default=self.config_entry.data.get(CONF_STREAMING_PARSER, False),
+                ): cv.boolean,
+                vol.Required(
+                    CONF_PARSE_IN_EXECUTOR,
+                    default=self.config_entry.data.get(CONF_PARSE_IN_EXECUTOR, False),
+                ): cv.boolean,
+                vol.Required(
+                    CONF_ADAPTIVE_POLLING,
+                    default=self.config_entry.data.get(CONF_ADAPTIVE_POLLING, False),
+                ): cv.boolean,
+                vol.Required(
+                    CONF_SLIM_ATTRIBUTES,
+                    default=self.config_entry.data.get(CONF_SLIM_ATTRIBUTES, False),
+                ): cv.boolean,
+                vol.Optional(
+                    CONF_SHARED_CACHE_DIR,
+                    default=self.config_entry.data.get(CONF_SHARED_CACHE_DIR, ""),
+                ): cv.string,
             })
         )
\ No newline at end of file
@@ -7,10 +7,21 @@ CONF_FEED_URL = "feed_url"
 CONF_CREATE_RUN_ENTITIES = "create_run_entities"
 CONF_CREATE_LIFT_ENTITIES = "create_lift_entities"
 CONF_UPDATE_INTERVAL = "update_interval"
+CONF_STREAMING_PARSER = "streaming_parser"
+CONF_PARSE_IN_EXECUTOR = "parse_in_executor"
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_SLIM_ATTRIBUTES = "slim_attributes"
+CONF_RESORT_MAP = "resort_map"
+CONF_SHARED_CACHE_DIR = "shared_cache_dir"
 
 DEFAULT_FEED_URL = "https://reportpal-cdn.resorts-interactive.com/mtnxml/162"
 DEFAULT_UPDATE_INTERVAL = 15
 MIN_UPDATE_INTERVAL = 1
 MAX_UPDATE_INTERVAL = 60
 
+DATA_SCHEDULER = f"{DOMAIN}_scheduler"
+SIGNAL_OPTIONS_UPDATED = f"{DOMAIN}_options_updated_{{}}"
+MAX_CONCURRENT_FETCHES = 4
+FETCH_SPACING = 2.0
+
 ATTRIBUTION = "Data provided by Big Sky Resort"
\ No newline at end of file
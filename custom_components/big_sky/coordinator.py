@@ -0,0 +1,401 @@
+"""Data update coordinator for Big Sky Resort."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Hashable
+from datetime import datetime, timedelta
+import logging
+
+from time import monotonic
+from xml.parsers.expat import ExpatError
+
+import aiohttp
+import async_timeout
+import xmltodict
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util, slugify
+
+from .api import BigSkyFeedClient, BigSkyFeedError, FeedResponse, resort_id_from_url
+from .const import (
+    DOMAIN,
+    DEFAULT_FEED_URL,
+    CONF_ADAPTIVE_POLLING,
+    CONF_FEED_URL,
+    CONF_PARSE_IN_EXECUTOR,
+    CONF_SHARED_CACHE_DIR,
+    CONF_SLIM_ATTRIBUTES,
+    CONF_STREAMING_PARSER,
+    CONF_UPDATE_INTERVAL,
+    DEFAULT_UPDATE_INTERVAL,
+    MAX_UPDATE_INTERVAL,
+    MIN_UPDATE_INTERVAL,
+)
+from .diff import SECTION_COORDINATOR, SECTION_METRICS, diff_snapshots
+from .forecast import ForecastSummary
+from .metrics import (
+    METRIC_BUILD_DURATION,
+    METRIC_ENTITIES_UPDATED,
+    METRIC_FETCH_BYTES,
+    METRIC_FETCH_LATENCY,
+    METRIC_LOOP_TIME,
+    METRIC_PARSE_DURATION,
+    RefreshMetrics,
+)
+from .model import Snapshot, build_snapshot
+from .parking import ParkingTracker
+from .parser import StreamingSnapshotParser, parse_feed
+from .polling import AdaptivePollingPolicy
+from .resilience import BREAKER_HALF_OPEN, CircuitBreaker, RetryPolicy
+from .rollups import Rollups
+from .scheduler import async_get_scheduler
+from .shared_cache import SharedFeedCache
+from .storage import SnapshotStore
+from .waits import WaitTracker
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _parse_and_diff(
+    body: bytes, streaming: bool, previous: Snapshot | None
+) -> tuple[Snapshot, set[Hashable] | None, float, float]:
+    """Parse a feed body and diff it against the previous snapshot.
+
+    Also returns the seconds spent parsing the XML and building and diffing
+    the snapshot. The streaming parser builds records while it parses, so
+    its build time only covers the diff. Runs in the executor when
+    ``parse_in_executor`` is set; neither snapshot is mutated after it is
+    built so the result can be handed back to the event loop as is.
+    """
+    start = monotonic()
+    if streaming:
+        snapshot = parse_feed(body)
+        parsed = monotonic()
+    else:
+        document = xmltodict.parse(body)
+        parsed = monotonic()
+        snapshot = build_snapshot(document)
+    changed = diff_snapshots(previous, snapshot)
+    return snapshot, changed, parsed - start, monotonic() - parsed
+
+
+class BigSkyDataUpdateCoordinator(DataUpdateCoordinator[Snapshot]):
+    """Fetch the resort feed and notify only the entities whose data changed.
+
+    Entities subscribe with a ``frozenset`` context of the item keys or
+    sections they read (see ``diff.py``). After each refresh the new snapshot
+    is compared to the previous one and only listeners whose context
+    intersects the changed set are called. Availability changes and manual
+    updates still notify every listener.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize the coordinator."""
+        feed_url = entry.data.get(CONF_FEED_URL, DEFAULT_FEED_URL)
+        self.resort_id = entry.unique_id or resort_id_from_url(feed_url)
+        super().__init__(
+            hass,
+            LOGGER,
+            name=f"big_sky_resort_{self.resort_id}",
+            update_interval=timedelta(
+                minutes=entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
+            ),
+        )
+        self.entry = entry
+        self.client = BigSkyFeedClient(feed_url)
+        self.scheduler = async_get_scheduler(hass)
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, self.resort_id)},
+            name=entry.title,
+            entry_type=DeviceEntryType.SERVICE,
+        )
+        # Home Assistant's shared session, so polls reuse its pooled
+        # keep-alive connections and nothing is left to clean up.
+        self.session = async_get_clientsession(hass)
+        self.shared_cache: SharedFeedCache | None = None
+        if shared_cache_dir := entry.data.get(CONF_SHARED_CACHE_DIR):
+            self.shared_cache = SharedFeedCache(hass, shared_cache_dir, feed_url)
+        self.streaming = entry.data.get(CONF_STREAMING_PARSER, False)
+        self.parse_in_executor = entry.data.get(CONF_PARSE_IN_EXECUTOR, False)
+        self.slim_attributes = entry.data.get(CONF_SLIM_ATTRIBUTES, False)
+        self.store = SnapshotStore(hass, entry.entry_id)
+        self.stale = False
+        self.last_fetch: datetime | None = None
+        self.changed: set[Hashable] | None = None
+        # What the last notification was about, for listeners that need it.
+        self.last_changed: set[Hashable] | None = None
+        self._notified_success: bool | None = None
+        self._rollups: Rollups | None = None
+        self._forecast: ForecastSummary | None = None
+        self.metrics = RefreshMetrics()
+        self.retry = RetryPolicy()
+        self.breaker = CircuitBreaker()
+        self.waits = WaitTracker()
+        self.parking = ParkingTracker()
+        self._loop_time = 0.0
+        self.polling: AdaptivePollingPolicy | None = None
+        if entry.data.get(CONF_ADAPTIVE_POLLING, False):
+            self.polling = AdaptivePollingPolicy(
+                fast=timedelta(minutes=MIN_UPDATE_INTERVAL),
+                base=self.update_interval,
+                slow=timedelta(minutes=MAX_UPDATE_INTERVAL),
+            )
+
+    async def async_load_cache(self) -> bool:
+        """Hydrate from the on-disk cache, returning True if it had data."""
+        if (cached := await self.store.async_load()) is None:
+            return False
+        self.data, self.last_fetch = cached
+        self.stale = True
+        LOGGER.debug("Loaded cached %s data from %s", self.name, self.last_fetch)
+        return True
+
+    async def _async_update_data(self) -> Snapshot:
+        """Fetch data from API, falling back to the last good snapshot."""
+        self.changed = None
+        self.metrics.refreshes += 1
+        self._loop_time = 0.0
+        try:
+            snapshot, changed = await self._async_fetch_snapshot()
+        except Exception as err:
+            self.metrics.failures += 1
+            self.metrics.last_error = f"{type(err).__name__}: {err}"
+            if self.data is None:
+                raise UpdateFailed(f"Error fetching data: {err}")
+            if not self.stale:
+                LOGGER.warning(
+                    "Error fetching %s data, serving cached data: %s", self.name, err
+                )
+            self.changed = self._set_stale(True, {SECTION_METRICS})
+            return self.data
+
+        self.last_fetch = dt_util.utcnow()
+        sampled = self.waits.add_snapshot(snapshot, self.last_fetch)
+        sampled |= self.parking.add_snapshot(snapshot, self.last_fetch)
+        changed = self._set_stale(False, changed)
+        if snapshot is not self.data:
+            self.store.async_save(snapshot, self.last_fetch)
+        self.changed = self._adapt_interval(snapshot, changed)
+        if self.changed is not None:
+            # After adapting the interval: new samples are not feed activity.
+            self.changed |= sampled
+            self.changed.add(SECTION_METRICS)
+        return snapshot
+
+    async def _async_fetch_snapshot(self) -> tuple[Snapshot, set[Hashable] | None]:
+        """Fetch the feed and return the snapshot and the changed contexts."""
+        response, parser = await self._async_fetch()
+        if response is None:
+            self.metrics.not_modified += 1
+            self.breaker.record_success()
+        if response is None and self.data is not None:
+            LOGGER.debug("Feed unchanged, reusing previous snapshot")
+            return self.data, set()
+        if response is None:
+            raise BigSkyFeedError("Feed reported unchanged before first load")
+        try:
+            if parser is not None:
+                snapshot = parser.close()
+                built = monotonic()
+                changed = diff_snapshots(self.data, snapshot)
+                parse_time, build_time = parser.elapsed, monotonic() - built
+                loop_time = parse_time + build_time
+            elif self.parse_in_executor:
+                snapshot, changed, parse_time, build_time = (
+                    await self.hass.async_add_executor_job(
+                        _parse_and_diff, response.body, self.streaming, self.data
+                    )
+                )
+                loop_time = 0.0
+            else:
+                # Streaming without a parser means the body went through the
+                # shared cache.
+                snapshot, changed, parse_time, build_time = _parse_and_diff(
+                    response.body, self.streaming, self.data
+                )
+                loop_time = parse_time + build_time
+        except (ExpatError, ValueError) as err:
+            # A feed that does not parse is as broken as one that does not
+            # download.
+            self.breaker.record_failure()
+            raise BigSkyFeedError(f"Invalid feed: {err}") from err
+        self.breaker.record_success()
+        LOGGER.debug(
+            "Parsed feed in %.3f seconds and built snapshot in %.3f seconds",
+            parse_time,
+            build_time,
+        )
+        self.metrics.add(METRIC_PARSE_DURATION, parse_time)
+        self.metrics.add(METRIC_BUILD_DURATION, build_time)
+        self._loop_time += loop_time
+        self.client.commit(response)
+        return snapshot, changed
+
+    async def _async_fetch(
+        self,
+    ) -> tuple[FeedResponse | None, StreamingSnapshotParser | None]:
+        """Fetch the feed, through the shared cache when one is configured.
+
+        With the cache lock held, a body another instance fetched within
+        this coordinator's interval is used as is. Otherwise the feed is
+        fetched (downloaded in full, so it can be cached) and published for
+        the other instances. If the lock cannot be taken, the cache is not
+        touched at all.
+        """
+        if self.shared_cache is None:
+            return await self._async_fetch_with_retries(stream=True)
+        async with self.shared_cache.async_lock() as locked:
+            if not locked:
+                # Without the lock another instance may be writing the cache;
+                # leave it alone and fetch as if there were none.
+                return await self._async_fetch_with_retries(stream=True)
+            cached = await self.shared_cache.async_read(self.update_interval)
+            if cached is not None:
+                self.metrics.shared_cache_hits += 1
+                LOGGER.debug("Using %s feed from the shared cache", self.name)
+                return (None if cached.digest == self.client.digest else cached), None
+            response, _ = await self._async_fetch_with_retries(stream=False)
+            if response is not None:
+                await self.shared_cache.async_write(response)
+            elif self.client.digest is not None:
+                await self.shared_cache.async_touch(self.client.digest)
+            return response, None
+
+    async def _async_fetch_with_retries(
+        self, stream: bool
+    ) -> tuple[FeedResponse | None, StreamingSnapshotParser | None]:
+        """Fetch the feed, retrying transient errors behind the circuit breaker.
+
+        Each attempt gets its own timeout and scheduler slot, so a slow
+        attempt cannot eat the budget of the next and backoff delays do not
+        hold a slot. A half-open breaker allows a single attempt. With
+        ``stream`` the streaming parser consumes the body as it downloads.
+        """
+        self.breaker.check()
+        retry = 0
+        while True:
+            # Streaming into the parser happens on the event loop, so the
+            # executor mode downloads the body first and parses it off-loop.
+            # Every attempt needs a fresh parser.
+            parser = (
+                StreamingSnapshotParser()
+                if stream and self.streaming and not self.parse_in_executor
+                else None
+            )
+            try:
+                async with self.scheduler.async_slot():
+                    async with async_timeout.timeout(self.retry.attempt_timeout):
+                        response = await self.client.async_fetch(self.session, parser)
+            except (asyncio.TimeoutError, aiohttp.ClientError, BigSkyFeedError) as err:
+                if (
+                    retry + 1 >= self.retry.attempts
+                    or self.breaker.state == BREAKER_HALF_OPEN
+                ):
+                    self.breaker.record_failure()
+                    raise
+                delay = self.retry.delay(retry)
+                retry += 1
+                self.metrics.retries += 1
+                LOGGER.debug(
+                    "Fetching %s failed (%s), retry %s in %.1f seconds",
+                    self.name,
+                    err or type(err).__name__,
+                    retry,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                continue
+            # Success is recorded once the body has parsed.
+            self.metrics.add(METRIC_FETCH_LATENCY, self.client.last_fetch_duration)
+            if self.client.last_fetch_bytes is not None:
+                self.metrics.add(METRIC_FETCH_BYTES, self.client.last_fetch_bytes)
+            return response, parser
+
+    def _set_stale(
+        self, stale: bool, changed: set[Hashable] | None
+    ) -> set[Hashable] | None:
+        """Track whether entities are being served cached data."""
+        if stale != self.stale:
+            self.stale = stale
+            if changed is not None:
+                changed.add(SECTION_COORDINATOR)
+        return changed
+
+    def _adapt_interval(
+        self, snapshot: Snapshot, changed: set[Hashable] | None
+    ) -> set[Hashable] | None:
+        """Let the adaptive policy pick the next interval for this refresh."""
+        if self.polling is None:
+            return changed
+        interval = self.polling.next_interval(snapshot, changed, dt_util.now())
+        if interval != self.update_interval:
+            LOGGER.debug("Next poll of %s in %s", self.name, interval)
+            self.update_interval = interval
+            if changed is not None:
+                changed.add(SECTION_COORDINATOR)
+        return changed
+
+    @callback
+    def async_set_base_interval(self, interval: timedelta) -> None:
+        """Apply a new configured poll interval without reloading the entry."""
+        if self.polling is not None:
+            self.polling.base = interval
+            self.polling.interval = interval
+        self.update_interval = interval
+        self._schedule_refresh()
+
+    @property
+    def rollups(self) -> Rollups:
+        """Return the aggregates of the current snapshot, computed once."""
+        if self._rollups is None or self._rollups.snapshot is not self.data:
+            self._rollups = Rollups(self.data)
+        return self._rollups
+
+    @property
+    def forecast(self) -> ForecastSummary:
+        """Return the forecast of the current snapshot, derived once."""
+        if self._forecast is None or self._forecast.snapshot is not self.data:
+            self._forecast = ForecastSummary(self.data)
+        return self._forecast
+
+    def entity_unique_id(self, key: str) -> str:
+        """Return an entity unique ID namespaced by the resort ID."""
+        return f"{DOMAIN}_{self.resort_id}_{key}"
+
+    def item_unique_id(self, kind: str, *key: str) -> str:
+        """Return the unique ID of a feed item's entity.
+
+        ``key`` is the item's full key, such as its area and name: names
+        are only unique within an area.
+        """
+        return self.entity_unique_id("_".join((kind, *map(slugify, key))))
+
+    async def async_shutdown(self) -> None:
+        """Cancel refreshes and release the shared cache's lock file."""
+        await super().async_shutdown()
+        if self.shared_cache is not None:
+            self.shared_cache.close()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners whose context intersects the changed set."""
+        changed, self.changed = self.changed, None
+        self.last_changed = changed
+        start = monotonic()
+        if changed is None or self._notified_success != self.last_update_success:
+            self._notified_success = self.last_update_success
+            updated = len(self._listeners)
+            super().async_update_listeners()
+        else:
+            updated = 0
+            for update_callback, context in list(self._listeners.values()):
+                if context is None or not changed.isdisjoint(context):
+                    update_callback()
+                    updated += 1
+        self.metrics.add(METRIC_ENTITIES_UPDATED, updated)
+        self.metrics.add(METRIC_LOOP_TIME, self._loop_time + monotonic() - start)
+        self._loop_time = 0.0
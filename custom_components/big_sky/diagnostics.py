@@ -0,0 +1,49 @@
+"""Diagnostics support for the Big Sky Resort integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    snapshot = coordinator.data
+    interval = coordinator.update_interval
+    last_fetch = coordinator.last_fetch
+    return {
+        "entry": {"title": entry.title, "data": dict(entry.data)},
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "last_fetch": last_fetch.isoformat() if last_fetch else None,
+            "stale": coordinator.stale,
+            "update_interval_seconds": interval.total_seconds() if interval else None,
+            "adaptive_polling": coordinator.polling is not None,
+            "streaming": coordinator.streaming,
+            "parse_in_executor": coordinator.parse_in_executor,
+            "listeners": len(coordinator._listeners),  # noqa: SLF001
+        },
+        "circuit_breaker": {
+            "state": coordinator.breaker.state,
+            "consecutive_failures": coordinator.breaker.failures,
+            "times_opened": coordinator.breaker.opened,
+        },
+        "client": {
+            "etag": coordinator.client.etag,
+            "last_modified": coordinator.client.last_modified,
+        },
+        "snapshot": None if snapshot is None else {
+            "areas": len(snapshot.areas),
+            "lifts": len(snapshot.lifts),
+            "trails": len(snapshot.trails),
+            "parks": len(snapshot.parks),
+            "parking_lots": len(snapshot.parking_lots),
+        },
+        "metrics": coordinator.metrics.as_dict(),
+    }
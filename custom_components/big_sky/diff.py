@@ -0,0 +1,96 @@
+"""Change detection between consecutive Big Sky Resort snapshots."""
+from __future__ import annotations
+
+from collections.abc import Hashable, Mapping
+
+from .model import Snapshot
+
+SECTION_RESORT = "resort"
+SECTION_LIFT = "lift"
+SECTION_TRAIL = "trail"
+SECTION_PARK = "park"
+SECTION_PARKING = "parking"
+SECTION_SHUTTLE = "shuttle"
+SECTION_FORECAST = "forecast"
+# Flagged, together with ``(SECTION_AREA, area)``, when any lift, trail or
+# park of an area changed.
+SECTION_AREA = "area"
+# Not feed data: flagged by the coordinator when its own state (such as the
+# effective poll interval) changed.
+SECTION_COORDINATOR = "coordinator"
+# Not feed data: flagged after every completed refresh for the entities
+# reporting the coordinator's runtime metrics.
+SECTION_METRICS = "metrics"
+# Not feed data: flagged as ``(SECTION_WAIT, area, name)`` and
+# ``(SECTION_FILL, name)`` when the wait series of a lift or the fill series
+# of a parking lot took a new sample, whether or not the feed changed.
+SECTION_WAIT = "wait"
+SECTION_FILL = "fill"
+
+
+def item_context(section: str, *key: str) -> frozenset[Hashable]:
+    """Return the listener context for a single lift, trail, park or lot."""
+    return frozenset({(section, *key)})
+
+
+def section_context(*sections: str) -> frozenset[Hashable]:
+    """Return the listener context for entities reading whole sections."""
+    return frozenset(sections)
+
+
+def section_records(snapshot: Snapshot, section: str) -> Mapping[Hashable, object]:
+    """Return the ``(area, name)`` index of a lift, trail or park section."""
+    if section == SECTION_LIFT:
+        return snapshot.lifts
+    if section == SECTION_TRAIL:
+        return snapshot.trails
+    if section == SECTION_PARK:
+        return snapshot.parks
+    raise ValueError(f"Section {section} has no per-item index")
+
+
+def _diff_index(
+    old: Mapping[Hashable, object],
+    new: Mapping[Hashable, object],
+    section: str,
+    changed: set[Hashable],
+) -> None:
+    """Add the keys of added, removed or modified records to ``changed``."""
+    found = False
+    for key, item in new.items():
+        previous = old.get(key)
+        if previous is not item and previous != item:
+            changed.add((section, *key) if isinstance(key, tuple) else (section, key))
+            found = True
+    for key in old.keys() - new.keys():
+        changed.add((section, *key) if isinstance(key, tuple) else (section, key))
+        found = True
+    if found:
+        changed.add(section)
+
+
+def diff_snapshots(old: Snapshot | None, new: Snapshot) -> set[Hashable] | None:
+    """Return the contexts that changed between two snapshots.
+
+    ``None`` means there is nothing to compare against and every listener
+    has to be updated.
+    """
+    if old is None:
+        return None
+    changed: set[Hashable] = set()
+    if old.resort != new.resort:
+        changed.add(SECTION_RESORT)
+    _diff_index(old.lifts, new.lifts, SECTION_LIFT, changed)
+    _diff_index(old.trails, new.trails, SECTION_TRAIL, changed)
+    _diff_index(old.parks, new.parks, SECTION_PARK, changed)
+    areas = {key[1] for key in changed if isinstance(key, tuple)}
+    areas.update(old.areas.keys() ^ new.areas.keys())
+    if areas:
+        changed.add(SECTION_AREA)
+        changed.update((SECTION_AREA, area) for area in areas)
+    _diff_index(old.parking_lots, new.parking_lots, SECTION_PARKING, changed)
+    if old.shuttles != new.shuttles:
+        changed.add(SECTION_SHUTTLE)
+    if old.forecast != new.forecast:
+        changed.add(SECTION_FORECAST)
+    return changed
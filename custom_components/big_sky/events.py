@@ -0,0 +1,173 @@
+"""Batched events for status transitions and parking thresholds."""
+from __future__ import annotations
+
+from collections.abc import Hashable
+from datetime import date
+import logging
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .diff import (
+    SECTION_LIFT,
+    SECTION_PARK,
+    SECTION_PARKING,
+    SECTION_RESORT,
+    SECTION_TRAIL,
+    section_context,
+    section_records,
+)
+from .model import Snapshot
+
+LOGGER = logging.getLogger(__name__)
+
+EVENT_STATUS_CHANGED = "big_sky_status_changed"
+EVENT_FIRST_OPEN = "big_sky_first_open"
+EVENT_WIND_HOLD = "big_sky_wind_hold"
+EVENT_PARKING_THRESHOLD = "big_sky_parking_threshold"
+
+EVENT_SECTIONS = (SECTION_LIFT, SECTION_TRAIL, SECTION_PARK)
+
+
+def _on_wind_hold(lift: Any) -> bool:
+    return "wind" in f"{lift.status} {lift.status_detail}".lower()
+
+
+class StatusEvents:
+    """Fire one event per refresh for all status transitions.
+
+    Transitions are computed once per refresh from the changed set against
+    the last seen status of each item, so automations can listen to a
+    single event instead of triggering on hundreds of entities. Besides
+    ``big_sky_status_changed`` this fires ``big_sky_first_open`` for items
+    (and the resort) opening for the first time that day, and
+    ``big_sky_wind_hold`` when lifts go on or come off wind hold, and
+    ``big_sky_parking_threshold`` for lots crossing a fill percentage.
+    Nothing fires for the first snapshot, which only sets the baseline.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, coordinator: Any) -> None:
+        """Initialize the event source."""
+        self._hass = hass
+        self._entry = entry
+        self._coordinator = coordinator
+        self._status: dict[tuple[str, str, str], str | None] = {}
+        self._wind_hold: set[tuple[str, str]] = set()
+        self._opened_on: dict[tuple[str, ...], date] = {}
+        self._resort_status: str | None = None
+        self._baseline = False
+
+    @callback
+    def async_setup(self) -> None:
+        """Take the baseline and follow refreshes."""
+        self.async_update()
+        self._entry.async_on_unload(
+            self._coordinator.async_add_listener(
+                self.async_update,
+                section_context(SECTION_RESORT, SECTION_PARKING, *EVENT_SECTIONS),
+            )
+        )
+
+    def _event_data(self, key: str, items: list[dict[str, Any]]) -> dict[str, Any]:
+        return {
+            "entry_id": self._entry.entry_id,
+            "resort_id": self._coordinator.resort_id,
+            key: items,
+        }
+
+    @callback
+    def _async_take_baseline(self, snapshot: Snapshot, today: date) -> None:
+        for section in EVENT_SECTIONS:
+            for (area, name), record in section_records(snapshot, section).items():
+                self._status[(section, area, name)] = record.status
+                if record.is_open:
+                    self._opened_on[(section, area, name)] = today
+        self._wind_hold = {
+            key for key, lift in snapshot.lifts.items() if _on_wind_hold(lift)
+        }
+        self._resort_status = snapshot.resort.status
+        if snapshot.resort.is_open:
+            self._opened_on[(SECTION_RESORT,)] = today
+        self._baseline = True
+
+    @callback
+    def async_update(self) -> None:
+        """Compute and fire the transitions of the latest refresh."""
+        snapshot = self._coordinator.data
+        if snapshot is None:
+            return
+        today = dt_util.now().date()
+        parking = self._coordinator.parking.pop_crossings()
+        if not self._baseline:
+            self._async_take_baseline(snapshot, today)
+            return
+        changed: set[Hashable] | None = self._coordinator.last_changed
+        if changed is None:
+            # Everyone is notified, e.g. after an outage; compare every item.
+            changed = {
+                (section, *key)
+                for section in EVENT_SECTIONS
+                for key in section_records(snapshot, section)
+            }
+
+        transitions: list[dict[str, Any]] = []
+        first_open: list[dict[str, Any]] = []
+        wind_hold: list[dict[str, Any]] = []
+
+        if snapshot.resort.status != self._resort_status:
+            self._resort_status = snapshot.resort.status
+            if snapshot.resort.is_open and self._opened_on.get((SECTION_RESORT,)) != today:
+                self._opened_on[(SECTION_RESORT,)] = today
+                first_open.append({"type": SECTION_RESORT, "name": snapshot.resort.name})
+
+        for key in changed:
+            if not isinstance(key, tuple) or key[0] not in EVENT_SECTIONS:
+                continue
+            section, area, name = key
+            record = section_records(snapshot, section).get((area, name))
+            if record is None:
+                continue
+            old_status = self._status.get(key)
+            if record.status != old_status:
+                self._status[key] = record.status
+                transitions.append(
+                    {
+                        "type": section,
+                        "area": area,
+                        "name": name,
+                        "old_status": old_status,
+                        "new_status": record.status,
+                    }
+                )
+                if record.is_open and self._opened_on.get(key) != today:
+                    self._opened_on[key] = today
+                    first_open.append({"type": section, "area": area, "name": name})
+            if section == SECTION_LIFT:
+                on_hold = _on_wind_hold(record)
+                if on_hold != ((area, name) in self._wind_hold):
+                    if on_hold:
+                        self._wind_hold.add((area, name))
+                    else:
+                        self._wind_hold.discard((area, name))
+                    wind_hold.append(
+                        {
+                            "area": area,
+                            "name": name,
+                            "on_hold": on_hold,
+                            "status": record.status,
+                            "status_detail": record.status_detail,
+                        }
+                    )
+
+        bus = self._hass.bus
+        if transitions:
+            LOGGER.debug("Firing %s status transitions", len(transitions))
+            bus.async_fire(EVENT_STATUS_CHANGED, self._event_data("changes", transitions))
+        if first_open:
+            bus.async_fire(EVENT_FIRST_OPEN, self._event_data("items", first_open))
+        if wind_hold:
+            bus.async_fire(EVENT_WIND_HOLD, self._event_data("lifts", wind_hold))
+        if parking:
+            bus.async_fire(EVENT_PARKING_THRESHOLD, self._event_data("lots", parking))
@@ -0,0 +1,140 @@
+"""Forecast derived once per Big Sky Resort snapshot."""
+from __future__ import annotations
+
+from datetime import date, timedelta
+from functools import lru_cache
+import re
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .model import ForecastDay, Snapshot
+
+WEATHER_ICONS = {
+    "Sunny": "sunny",
+    "Mostly Sunny": "partlycloudy",
+    "Partly Sunny": "partlycloudy",
+    "Mostly Cloudy": "cloudy",
+    "Cloudy": "cloudy",
+    "Rain": "rainy",
+    "Snow": "snowy",
+    "Rain Showers": "rainy",
+    "Snow Showers": "snowy",
+    "Partly Cloudy": "partlycloudy",
+    "Clear": "clear-night",
+    "Chance Rain Showers": "rainy",
+    "Chance Snow Showers": "snowy",
+    "Slight Chance Rain Showers": "rainy",
+}
+
+_NUMBER = r"(\d+(?:\.\d+)?|a half|half|an|a|one|two|three|four|five|six|seven|eight|nine|ten)"
+_WORDS = {
+    "a half": 0.5, "half": 0.5, "an": 1, "a": 1, "one": 1, "two": 2, "three": 3,
+    "four": 4, "five": 5, "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10,
+}
+_AMOUNT = (
+    rf"(?:of |around |near |up to |less than |between )*{_NUMBER}"
+    rf"(?:\s*(?:to|and)\s*{_NUMBER})?\s*inch"
+)
+_SNOW = re.compile(rf"snow accumulation[^.]*?{_AMOUNT}", re.IGNORECASE)
+_RAIN = re.compile(rf"(?:rain(?:fall)?|precipitation) amounts?[^.]*?{_AMOUNT}", re.IGNORECASE)
+_NO_SNOW = re.compile(r"little or no snow accumulation", re.IGNORECASE)
+_PROBABILITY = re.compile(
+    r"(\d+) percent chance of (?:precipitation|rain|snow)"
+    r"|chance of (?:precipitation|rain|snow) is (\d+)\s*(?:%|percent)",
+    re.IGNORECASE,
+)
+
+
+def _number(value: str | None) -> float | None:
+    if value is None:
+        return None
+    value = value.lower()
+    return float(_WORDS[value]) if value in _WORDS else float(value)
+
+
+def _amount(pattern: re.Pattern[str], text: str) -> float | None:
+    """Return the amount in inches of the first match, ranges as their midpoint."""
+    if (match := pattern.search(text)) is None:
+        return None
+    low, high = _number(match.group(1)), _number(match.group(2))
+    return low if high is None else round((low + high) / 2, 2)
+
+
+@lru_cache(maxsize=64)
+def parse_narrative(text: str) -> tuple[int | None, float | None, float | None]:
+    """Return precipitation probability, snowfall and rainfall of a narrative.
+
+    Amounts are in inches. The same narratives repeat across polls, so
+    results are cached by text.
+    """
+    probability = None
+    if match := _PROBABILITY.search(text):
+        probability = int(match.group(1) or match.group(2))
+    snowfall = 0.0 if _NO_SNOW.search(text) else _amount(_SNOW, text)
+    return probability, snowfall, _amount(_RAIN, text)
+
+
+_WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+
+def forecast_dates(snapshot: Snapshot) -> list[date]:
+    """Return the date of each forecast day of ``snapshot``.
+
+    Days follow the report date one per entry. A report published late in
+    the day may start with tomorrow, so the first day is moved forward to
+    the weekday it names. Without a readable report date, today is used.
+    """
+    updated = dt_util.parse_datetime(snapshot.updated or "")
+    if updated is None:
+        try:
+            first = date.fromisoformat((snapshot.updated or "")[:10])
+        except ValueError:
+            first = dt_util.now().date()
+    else:
+        first = updated.date()
+    if snapshot.forecast:
+        name = snapshot.forecast[0].name.split(" ")[0].lower()
+        if name in _WEEKDAYS:
+            first += timedelta(days=(_WEEKDAYS.index(name) - first.weekday()) % 7)
+    return [first + timedelta(days=offset) for offset in range(len(snapshot.forecast))]
+
+
+def condition(day: ForecastDay) -> str:
+    """Return the Home Assistant condition of a feed weather description."""
+    return WEATHER_ICONS.get(day.weather, "exceptional")
+
+
+class ForecastSummary:
+    """The forecast of one snapshot in Home Assistant's format.
+
+    ``native_precipitation`` is the rainfall amount of the narrative in
+    inches, which Home Assistant converts for display. Snow accumulation has
+    no forecast key; ``snowfall`` maps each day's ISO date to inches.
+    """
+
+    __slots__ = ("snapshot", "current", "condition", "daily", "snowfall")
+
+    def __init__(self, snapshot: Snapshot) -> None:
+        """Derive the forecast of ``snapshot``."""
+        self.snapshot = snapshot
+        days = snapshot.forecast
+        self.current: ForecastDay | None = days[0] if days else None
+        self.condition = condition(self.current) if self.current else None
+        self.daily: list[dict[str, Any]] | None = None
+        self.snowfall: dict[str, float | None] = {}
+        if days and all(day.high is not None and day.low is not None for day in days):
+            self.daily = []
+            for day, day_date in zip(days, forecast_dates(snapshot)):
+                probability, snowfall, rainfall = parse_narrative(day.text)
+                self.snowfall[day_date.isoformat()] = snowfall
+                self.daily.append(
+                    {
+                        "datetime": dt_util.start_of_local_day(day_date).isoformat(),
+                        "native_temperature": day.high,
+                        "native_templow": day.low,
+                        "condition": condition(day),
+                        "precipitation_probability": probability,
+                        "native_precipitation": rainfall,
+                    }
+                )
@@ -0,0 +1,327 @@
+"""Compact local history of lift, trail and park status transitions."""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections.abc import Hashable, Iterable
+from datetime import datetime, timedelta
+import logging
+import os
+import sqlite3
+import threading
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .diff import (
+    SECTION_LIFT,
+    SECTION_PARK,
+    SECTION_TRAIL,
+    section_context,
+    section_records,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+HISTORY_SECTIONS = (SECTION_LIFT, SECTION_TRAIL, SECTION_PARK)
+RETENTION = timedelta(days=730)
+
+# Items, statuses and transitions are all stored as integers: the item and
+# status strings are interned once in dictionary tables, so one transition
+# costs three integer columns in a table clustered by (item, ts).
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS items ("
+    " id INTEGER PRIMARY KEY, section TEXT NOT NULL, area TEXT NOT NULL,"
+    " name TEXT NOT NULL, UNIQUE (section, area, name))",
+    "CREATE TABLE IF NOT EXISTS statuses ("
+    " id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE)",
+    "CREATE TABLE IF NOT EXISTS transitions ("
+    " item INTEGER NOT NULL, ts INTEGER NOT NULL, status INTEGER NOT NULL,"
+    " PRIMARY KEY (item, ts)) WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS transitions_ts ON transitions (ts)",
+)
+
+
+def history_path(hass: HomeAssistant, entry_id: str) -> str:
+    """Return the path of an entry's history database."""
+    return hass.config.path(STORAGE_DIR, f"{DOMAIN}.history.{entry_id}.db")
+
+
+def _remove_file(path: str) -> None:
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(path)
+
+
+async def async_remove_history(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete the history database of a removed entry."""
+    await hass.async_add_executor_job(_remove_file, history_path(hass, entry_id))
+
+
+class HistoryDatabase:
+    """Blocking access to the history database, called from the executor."""
+
+    def __init__(self, path: str) -> None:
+        """Initialize the database wrapper."""
+        self._path = path
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def open(self) -> tuple[dict[tuple[str, str, str], int], dict[str, int], dict[int, int]]:
+        """Open the database and return items, statuses and last statuses."""
+        with self._lock:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            self._conn = sqlite3.connect(self._path, check_same_thread=False)
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+            items = {
+                (section, area, name): item_id
+                for item_id, section, area, name in self._conn.execute(
+                    "SELECT id, section, area, name FROM items"
+                )
+            }
+            statuses = {
+                name: status_id
+                for status_id, name in self._conn.execute("SELECT id, name FROM statuses")
+            }
+            last = dict(
+                self._conn.execute(
+                    "SELECT item, status FROM transitions t WHERE ts = "
+                    "(SELECT MAX(ts) FROM transitions WHERE item = t.item)"
+                )
+            )
+            self._conn.commit()
+            return items, statuses, last
+
+    def write(
+        self,
+        new_items: list[tuple[int, str, str, str]],
+        new_statuses: list[tuple[int, str]],
+        rows: list[tuple[int, int, int]],
+    ) -> None:
+        """Insert newly interned items and statuses and a batch of transitions."""
+        with self._lock:
+            if self._conn is None:
+                return
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO items VALUES (?, ?, ?, ?)", new_items
+                )
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO statuses VALUES (?, ?)", new_statuses
+                )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO transitions VALUES (?, ?, ?)", rows
+                )
+
+    def prune(self, before: int) -> None:
+        """Drop transitions older than ``before``, keeping each item's last one."""
+        with self._lock:
+            if self._conn is None:
+                return
+            with self._conn:
+                self._conn.execute(
+                    "DELETE FROM transitions WHERE ts < ? AND ts < "
+                    "(SELECT MAX(ts) FROM transitions t WHERE t.item = transitions.item)",
+                    (before,),
+                )
+
+    def query(
+        self, item_ids: list[int], start: int, end: int
+    ) -> tuple[dict[int, int], list[tuple[int, int, int]]]:
+        """Return each item's status at ``start`` and its transitions until ``end``."""
+        with self._lock:
+            if self._conn is None or not item_ids:
+                return {}, []
+            marks = ",".join("?" * len(item_ids))
+            initial = dict(
+                self._conn.execute(
+                    f"SELECT item, status FROM transitions t WHERE item IN ({marks})"
+                    " AND ts = (SELECT MAX(ts) FROM transitions"
+                    " WHERE item = t.item AND ts <= ?)",
+                    (*item_ids, start),
+                )
+            )
+            rows = self._conn.execute(
+                f"SELECT item, ts, status FROM transitions WHERE item IN ({marks})"
+                " AND ts > ? AND ts <= ? ORDER BY item, ts",
+                (*item_ids, start, end),
+            ).fetchall()
+            return initial, rows
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class StatusHistory:
+    """Record per-item status transitions of one config entry.
+
+    Transitions are detected in the event loop against the last recorded
+    status of each item, which only touches the items the refresh changed,
+    and written to SQLite in the executor in one batch per refresh.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, coordinator: Any) -> None:
+        """Initialize the history."""
+        self._hass = hass
+        self._entry = entry
+        self._coordinator = coordinator
+        self._db = HistoryDatabase(history_path(hass, entry.entry_id))
+        self._items: dict[tuple[str, str, str], int] = {}
+        self._names: dict[int, tuple[str, str, str]] = {}
+        self._statuses: dict[str, int] = {}
+        self._status_names: dict[int, str] = {}
+        self._last: dict[int, int] = {}
+        self._last_ts = 0
+        self._pending: set[asyncio.Future[None]] = set()
+
+    async def async_setup(self) -> None:
+        """Open the database, record the current snapshot and follow refreshes."""
+        self._items, self._statuses, self._last = await self._hass.async_add_executor_job(
+            self._db.open
+        )
+        self._names = {item_id: key for key, item_id in self._items.items()}
+        self._status_names = {status_id: name for name, status_id in self._statuses.items()}
+        await self._hass.async_add_executor_job(
+            self._db.prune, int((dt_util.utcnow() - RETENTION).timestamp())
+        )
+        self.async_record()
+        self._entry.async_on_unload(
+            self._coordinator.async_add_listener(
+                self.async_record, section_context(*HISTORY_SECTIONS)
+            )
+        )
+
+    def _intern(
+        self, key: tuple[str, str, str], status: str,
+        new_items: list[tuple[int, str, str, str]],
+        new_statuses: list[tuple[int, str]],
+    ) -> tuple[int, int]:
+        if (item_id := self._items.get(key)) is None:
+            item_id = self._items[key] = len(self._items) + 1
+            self._names[item_id] = key
+            new_items.append((item_id, *key))
+        if (status_id := self._statuses.get(status)) is None:
+            status_id = self._statuses[status] = len(self._statuses) + 1
+            self._status_names[status_id] = status
+            new_statuses.append((status_id, status))
+        return item_id, status_id
+
+    @callback
+    def async_record(self) -> None:
+        """Queue the transitions of the latest refresh."""
+        snapshot = self._coordinator.data
+        if snapshot is None:
+            return
+        changed: set[Hashable] | None = self._coordinator.last_changed
+        when = self._coordinator.last_fetch or dt_util.utcnow()
+        ts = max(int(when.timestamp()), self._last_ts)
+        new_items: list[tuple[int, str, str, str]] = []
+        new_statuses: list[tuple[int, str]] = []
+        rows: list[tuple[int, int, int]] = []
+        for section in HISTORY_SECTIONS:
+            records = section_records(snapshot, section)
+            if changed is None:
+                keys: Iterable[tuple[str, str]] = records.keys()
+            else:
+                keys = [
+                    key[1:] for key in changed
+                    if isinstance(key, tuple) and key[0] == section and key[1:] in records
+                ]
+            for area, name in keys:
+                status = records[(area, name)].status or ""
+                item_id, status_id = self._intern(
+                    (section, area, name), status, new_items, new_statuses
+                )
+                if self._last.get(item_id) != status_id:
+                    self._last[item_id] = status_id
+                    rows.append((item_id, ts, status_id))
+        if not rows:
+            return
+        self._last_ts = ts
+        future = self._hass.async_add_executor_job(
+            self._db.write, new_items, new_statuses, rows
+        )
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+
+    async def async_query(
+        self,
+        section: str,
+        area: str | None,
+        names: list[str] | None,
+        start: datetime,
+        end: datetime,
+    ) -> list[dict[str, Any]]:
+        """Return timelines and uptime of the matching items between two times."""
+        wanted = {name.lower() for name in names} if names else None
+        item_ids = [
+            item_id
+            for (item_section, item_area, item_name), item_id in self._items.items()
+            if item_section == section
+            and (area is None or item_area.lower() == area.lower())
+            and (wanted is None or item_name.lower() in wanted)
+        ]
+        start_ts, end_ts = int(start.timestamp()), int(end.timestamp())
+        initial, rows = await self._hass.async_add_executor_job(
+            self._db.query, item_ids, start_ts, end_ts
+        )
+        timelines: dict[int, list[tuple[int, int]]] = {item_id: [] for item_id in item_ids}
+        for item_id, ts, status_id in rows:
+            timelines[item_id].append((ts, status_id))
+
+        result = []
+        for item_id in item_ids:
+            _, area_name, name = self._names[item_id]
+            transitions = timelines[item_id]
+            status_id = initial.get(item_id)
+            known_from = start_ts if status_id is not None else None
+            open_seconds = 0
+            openings = 0
+            previous_ts = start_ts
+            for ts, next_status in transitions:
+                if status_id is not None and self._is_open(status_id):
+                    open_seconds += ts - previous_ts
+                if self._is_open(next_status) and (
+                    status_id is None or not self._is_open(status_id)
+                ):
+                    openings += 1
+                if known_from is None:
+                    known_from = ts
+                status_id, previous_ts = next_status, ts
+            if status_id is not None and self._is_open(status_id):
+                open_seconds += end_ts - previous_ts
+            observed = end_ts - known_from if known_from is not None else 0
+            result.append(
+                {
+                    "area": area_name,
+                    "name": name,
+                    "status": self._status_names.get(status_id) if status_id else None,
+                    "uptime": round(100 * open_seconds / observed, 1) if observed else None,
+                    "openings": openings,
+                    "timeline": [
+                        {
+                            "time": dt_util.utc_from_timestamp(ts).isoformat(),
+                            "status": self._status_names.get(value),
+                        }
+                        for ts, value in transitions
+                    ],
+                }
+            )
+        return result
+
+    def _is_open(self, status_id: int) -> bool:
+        return self._status_names.get(status_id, "").lower() == "open"
+
+    async def async_close(self) -> None:
+        """Close the database once pending writes are done."""
+        if self._pending:
+            await asyncio.wait(self._pending)
+        await self._hass.async_add_executor_job(self._db.close)
@@ -0,0 +1,102 @@
+"""Runtime instrumentation of the Big Sky Resort refresh path."""
+from __future__ import annotations
+
+from collections import deque
+from typing import Any
+
+# Samples kept per metric; about two days of refreshes at the default
+# 15 minute interval.
+WINDOW = 200
+
+METRIC_FETCH_LATENCY = "fetch_latency"
+METRIC_FETCH_BYTES = "fetch_bytes"
+METRIC_PARSE_DURATION = "parse_duration"
+METRIC_BUILD_DURATION = "build_duration"
+METRIC_ENTITIES_UPDATED = "entities_updated"
+METRIC_LOOP_TIME = "loop_time"
+
+METRICS = (
+    METRIC_FETCH_LATENCY,
+    METRIC_FETCH_BYTES,
+    METRIC_PARSE_DURATION,
+    METRIC_BUILD_DURATION,
+    METRIC_ENTITIES_UPDATED,
+    METRIC_LOOP_TIME,
+)
+
+
+class RollingStat:
+    """The last ``WINDOW`` samples of one metric."""
+
+    __slots__ = ("_samples", "count")
+
+    def __init__(self) -> None:
+        """Initialize an empty window."""
+        self._samples: deque[float] = deque(maxlen=WINDOW)
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        """Record a sample."""
+        self._samples.append(value)
+        self.count += 1
+
+    @property
+    def last(self) -> float | None:
+        """Return the latest sample."""
+        return self._samples[-1] if self._samples else None
+
+    def percentiles(self) -> dict[str, float | None]:
+        """Return the 50th, 90th and 99th percentile of the window."""
+        if not self._samples:
+            return {"p50": None, "p90": None, "p99": None}
+        ordered = sorted(self._samples)
+        top = len(ordered) - 1
+        return {
+            name: ordered[min(top, round(top * fraction))]
+            for name, fraction in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99))
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the latest sample, percentiles and sample counts."""
+        return {
+            "last": self.last,
+            **self.percentiles(),
+            "samples": len(self._samples),
+            "count": self.count,
+        }
+
+
+class RefreshMetrics:
+    """Rolling statistics of a coordinator's refreshes.
+
+    Durations are in seconds. ``loop_time`` is the time a refresh spent
+    running on the event loop (parsing when it is not done in the executor,
+    and notifying entities) rather than waiting on the network or a worker
+    thread.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.stats = {name: RollingStat() for name in METRICS}
+        self.refreshes = 0
+        self.not_modified = 0
+        self.failures = 0
+        self.retries = 0
+        self.shared_cache_hits = 0
+        self.last_error: str | None = None
+
+    def add(self, name: str, value: float) -> None:
+        """Record a sample of one metric."""
+        self.stats[name].add(value)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all statistics, for diagnostics."""
+        return {
+            "refreshes": self.refreshes,
+            "not_modified": self.not_modified,
+            "failures": self.failures,
+            "retries": self.retries,
+            "shared_cache_hits": self.shared_cache_hits,
+            "last_error": self.last_error,
+            **{name: stat.as_dict() for name, stat in self.stats.items()},
+        }
@@ -0,0 +1,370 @@
+"""Normalized snapshot model for the Big Sky Resort feed."""
+from __future__ import annotations
+
+from typing import Any
+
+
+def _as_list(node: Any) -> list:
+    """Normalize an xmltodict node that may be missing, a dict or a list."""
+    if node is None:
+        return []
+    if isinstance(node, list):
+        return node
+    return [node]
+
+
+def _to_int(value: Any) -> int | None:
+    """Convert a feed attribute to int, returning None when not numeric."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        try:
+            return int(float(value))
+        except (TypeError, ValueError):
+            return None
+
+
+def _to_float(value: Any) -> float | None:
+    """Convert a feed attribute to float, returning None when not numeric."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class _Record:
+    """Base class for immutable, slot based feed records."""
+
+    __slots__ = ()
+
+    def __init__(self, **kwargs: Any) -> None:
+        for name in self.__slots__:
+            object.__setattr__(self, name, kwargs.get(name))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __hash__(self) -> int:
+        return hash(tuple(getattr(self, name) for name in self.__slots__))
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the record as a plain dict."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class Resort(_Record):
+    """Resort wide operations and current conditions."""
+
+    __slots__ = (
+        "name",
+        "status",
+        "open_time",
+        "close_time",
+        "num_trails_open",
+        "num_parks_open",
+        "num_trails_snow_making",
+        "snow_base",
+        "snow_24h",
+    )
+
+    @property
+    def is_open(self) -> bool:
+        """Return true if the resort is open."""
+        return (self.status or "").lower() == "open"
+
+
+class Lift(_Record):
+    """A single lift."""
+
+    __slots__ = (
+        "area",
+        "name",
+        "type",
+        "status",
+        "status_detail",
+        "capacity",
+        "open_time",
+        "close_time",
+        "skier_wait_time",
+        "scenic_wait_time",
+    )
+
+    @property
+    def is_open(self) -> bool:
+        """Return true if the lift is open."""
+        return (self.status or "").lower() == "open"
+
+
+class Trail(_Record):
+    """A single trail."""
+
+    __slots__ = ("area", "name", "difficulty", "status", "groomed", "uphill")
+
+    @property
+    def is_open(self) -> bool:
+        """Return true if the trail is open."""
+        return (self.status or "").lower() == "open"
+
+
+class Park(_Record):
+    """A single terrain park."""
+
+    __slots__ = ("area", "name", "difficulty", "status", "groomed")
+
+    @property
+    def is_open(self) -> bool:
+        """Return true if the park is open."""
+        return (self.status or "").lower() == "open"
+
+
+class ParkingLot(_Record):
+    """A single parking lot."""
+
+    __slots__ = ("name", "status", "percent_full", "open_time", "closed_time", "alert")
+
+
+class ShuttleLine(_Record):
+    """A single shuttle line."""
+
+    __slots__ = (
+        "name",
+        "status",
+        "number_running",
+        "open_time",
+        "closed_time",
+        "comment",
+        "alert",
+    )
+
+
+class ForecastDay(_Record):
+    """A single forecast day."""
+
+    __slots__ = ("name", "high", "low", "weather", "text")
+
+
+class Area(_Record):
+    """A resort area and the facilities it contains."""
+
+    __slots__ = ("name", "lifts", "trails", "parks")
+
+
+class Snapshot:
+    """Indexed view of one feed refresh.
+
+    Lifts, trails and parks are indexed by ``(area, name)`` so entities can
+    read their state without walking the feed.
+    """
+
+    __slots__ = (
+        "resort",
+        "areas",
+        "lifts",
+        "trails",
+        "parks",
+        "parking_lots",
+        "shuttles",
+        "forecast",
+        "updated",
+    )
+
+    def __init__(
+        self,
+        resort: Resort,
+        areas: dict[str, Area],
+        parking_lots: dict[str, ParkingLot],
+        shuttles: tuple[ShuttleLine, ...],
+        forecast: tuple[ForecastDay, ...],
+        updated: str | None = None,
+    ) -> None:
+        """Initialize the snapshot and build its indexes."""
+        self.resort = resort
+        self.areas = areas
+        self.parking_lots = parking_lots
+        self.shuttles = shuttles
+        self.forecast = forecast
+        # When the resort published the report, as written in the feed.
+        self.updated = updated
+        self.lifts = {
+            (lift.area, lift.name): lift for area in areas.values() for lift in area.lifts
+        }
+        self.trails = {
+            (trail.area, trail.name): trail
+            for area in areas.values()
+            for trail in area.trails
+        }
+        self.parks = {
+            (park.area, park.name): park for area in areas.values() for park in area.parks
+        }
+
+    @property
+    def shuttle(self) -> ShuttleLine | None:
+        """Return the primary shuttle line."""
+        return self.shuttles[0] if self.shuttles else None
+
+
+# Record builders take attribute mappings keyed the way xmltodict keys them
+# (``@name``) so the tree walker and the streaming parser share them.
+
+
+def build_lift(area: str, attrs: dict[str, Any]) -> Lift:
+    """Build a lift record from its feed attributes."""
+    get = attrs.get
+    return Lift(
+        area=area,
+        name=get("@name", ""),
+        type=get("@type", ""),
+        status=get("@status", ""),
+        status_detail=get("@statusDetail", ""),
+        capacity=get("@capacity", ""),
+        open_time=get("@openTime", ""),
+        close_time=get("@closeTime", ""),
+        skier_wait_time=get("@skierWaitTime", ""),
+        scenic_wait_time=get("@scenicWaitTime", ""),
+    )
+
+
+def build_trail(area: str, attrs: dict[str, Any]) -> Trail:
+    """Build a trail record from its feed attributes."""
+    get = attrs.get
+    return Trail(
+        area=area,
+        name=get("@name", ""),
+        difficulty=get("@difficulty", ""),
+        status=get("@status", ""),
+        groomed=get("@groomed", "no"),
+        uphill=get("@uphill", "no"),
+    )
+
+
+def build_park(area: str, attrs: dict[str, Any]) -> Park:
+    """Build a terrain park record from its feed attributes."""
+    get = attrs.get
+    return Park(
+        area=area,
+        name=get("@name", ""),
+        difficulty=get("@difficulty", ""),
+        status=get("@status", ""),
+        groomed=get("@groomedOrCut", ""),
+    )
+
+
+def build_parking_lot(attrs: dict[str, Any]) -> ParkingLot:
+    """Build a parking lot record from its feed attributes."""
+    get = attrs.get
+    return ParkingLot(
+        name=get("@name", ""),
+        status=get("@status", ""),
+        percent_full=_to_int(get("@percentFull")),
+        open_time=get("@openTime", ""),
+        closed_time=get("@closedTime", ""),
+        alert=get("@alert", ""),
+    )
+
+
+def build_shuttle_line(attrs: dict[str, Any]) -> ShuttleLine:
+    """Build a shuttle line record from its feed attributes."""
+    get = attrs.get
+    return ShuttleLine(
+        name=get("@name", ""),
+        status=get("@status", ""),
+        number_running=_to_int(get("@numberRunning")),
+        open_time=get("@openTime", ""),
+        closed_time=get("@closedTime", ""),
+        comment=get("@comment", ""),
+        alert=get("@alert", ""),
+    )
+
+
+def build_forecast_day(attrs: dict[str, Any]) -> ForecastDay:
+    """Build a forecast day record from its feed attributes and text."""
+    get = attrs.get
+    return ForecastDay(
+        name=get("@name", ""),
+        high=_to_float(get("@high")),
+        low=_to_float(get("@low")),
+        weather=get("@weather", ""),
+        text=get("#text", ""),
+    )
+
+
+def build_resort(
+    report: dict[str, Any],
+    operations: dict[str, Any],
+    resortwide: dict[str, Any],
+    location: dict[str, Any],
+) -> Resort:
+    """Build the resort record from the report level attributes."""
+    return Resort(
+        name=report.get("@name", ""),
+        status=operations.get("@resortStatus", ""),
+        open_time=operations.get("@openTime", ""),
+        close_time=operations.get("@closeTime", ""),
+        num_trails_open=_to_int(resortwide.get("@numTrailsOpen")),
+        num_parks_open=_to_int(resortwide.get("@numParksOpen")),
+        num_trails_snow_making=_to_int(resortwide.get("@numTrailsSnowMaking")),
+        snow_base=_to_float(location.get("@base")),
+        snow_24h=_to_float(location.get("@snow24Hours")),
+    )
+
+
+def _build_area(node: dict[str, Any]) -> Area:
+    name = node.get("@name", "")
+    lifts = (node.get("lifts") or {}).get("lift")
+    trails = (node.get("trails") or {}).get("trail")
+    parks = ((node.get("freestyleTerrain") or {}).get("parks") or {}).get("park")
+    return Area(
+        name=name,
+        lifts=tuple(build_lift(name, lift) for lift in _as_list(lifts)),
+        trails=tuple(build_trail(name, trail) for trail in _as_list(trails)),
+        parks=tuple(build_park(name, park) for park in _as_list(parks)),
+    )
+
+
+def build_snapshot(document: dict[str, Any]) -> Snapshot:
+    """Build a snapshot from a parsed xmltodict feed document."""
+    report = document["report"]
+    conditions = report.get("currentConditions") or {}
+    locations = _as_list((conditions.get("resortLocations") or {}).get("location"))
+    facilities = report.get("facilities") or {}
+
+    resort = build_resort(
+        report,
+        report.get("operations") or {},
+        conditions.get("resortwide") or {},
+        locations[0] if locations else {},
+    )
+
+    areas = {}
+    for node in _as_list((facilities.get("areas") or {}).get("area")):
+        area = _build_area(node)
+        areas[area.name] = area
+
+    parking_lots = {}
+    for lot in _as_list((facilities.get("parking") or {}).get("lot")):
+        parking_lot = build_parking_lot(lot)
+        parking_lots[parking_lot.name] = parking_lot
+
+    shuttles = tuple(
+        build_shuttle_line(line)
+        for line in _as_list((facilities.get("shuttles") or {}).get("line"))
+    )
+    forecast = tuple(
+        build_forecast_day(day)
+        for day in _as_list((report.get("forecast") or {}).get("day"))
+    )
+
+    return Snapshot(
+        resort, areas, parking_lots, shuttles, forecast, report.get("@updated")
+    )
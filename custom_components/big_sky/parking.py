@@ -0,0 +1,203 @@
+"""Fill rate and time-to-full estimates of the parking lots."""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Hashable, Mapping
+from datetime import datetime, timedelta
+from typing import Any
+
+from .diff import SECTION_FILL
+from .model import ParkingLot, Snapshot
+
+# Minutes of samples the fill rate is fitted over.
+FILL_WINDOW = 60.0
+# Samples kept per lot at most; one hour of refreshes at the minimum interval.
+FILL_SAMPLES = 60
+# Samples needed before a fill rate is reported.
+MIN_SAMPLES = 3
+# Slowest fill rate (percent per minute) that still predicts a time to full.
+MIN_FILL_RATE = 0.05
+# A gap this long (minutes), such as overnight, restarts the series.
+RESET_GAP = 60.0
+
+# Percentages whose crossing fires a parking event.
+PARKING_THRESHOLDS = (50, 75, 90, 100)
+
+FULL = 100
+
+
+class FillSeries:
+    """Percent full of one lot and its least-squares fill rate.
+
+    The regression over the last ``FILL_WINDOW`` minutes is kept as running
+    sums of time, percentage and their products, so adding a sample and
+    evicting old ones costs constant time and the fit never rescans the
+    window. Times are minutes since the series (re)started.
+    """
+
+    __slots__ = (
+        "_samples", "_origin", "_sum_t", "_sum_y", "_sum_tt", "_sum_ty", "last",
+        "last_time",
+    )
+
+    def __init__(self) -> None:
+        """Initialize an empty series."""
+        self._samples: deque[tuple[float, int]] = deque()
+        self._origin: datetime | None = None
+        self._sum_t = self._sum_y = self._sum_tt = self._sum_ty = 0.0
+        self.last: int | None = None
+        self.last_time: datetime | None = None
+
+    def _reset(self, now: datetime) -> None:
+        self._samples.clear()
+        self._origin = now
+        self._sum_t = self._sum_y = self._sum_tt = self._sum_ty = 0.0
+        self.last = None
+
+    def _evict(self) -> None:
+        t, y = self._samples.popleft()
+        self._sum_t -= t
+        self._sum_y -= y
+        self._sum_tt -= t * t
+        self._sum_ty -= t * y
+
+    def add(self, percent: int, now: datetime) -> bool:
+        """Record the percentage full at ``now``.
+
+        Return True if the sample continues the series, False if it is the
+        first one or the first after a restart.
+        """
+        continued = True
+        if (
+            self._origin is None
+            or self.last_time is None
+            or (now - self.last_time).total_seconds() / 60 > RESET_GAP
+        ):
+            self._reset(now)
+            continued = False
+        t = (now - self._origin).total_seconds() / 60
+        if self._samples and t <= self._samples[-1][0]:
+            return False
+        self._samples.append((t, percent))
+        self._sum_t += t
+        self._sum_y += percent
+        self._sum_tt += t * t
+        self._sum_ty += t * percent
+        while self._samples[0][0] < t - FILL_WINDOW or len(self._samples) > FILL_SAMPLES:
+            self._evict()
+        self.last = percent
+        self.last_time = now
+        return continued
+
+    @property
+    def samples(self) -> int:
+        """Return the number of samples in the window."""
+        return len(self._samples)
+
+    @property
+    def rate(self) -> float | None:
+        """Return the fill rate in percent per minute."""
+        count = len(self._samples)
+        if count < MIN_SAMPLES:
+            return None
+        spread = count * self._sum_tt - self._sum_t * self._sum_t
+        if spread <= 0:
+            return None
+        return (count * self._sum_ty - self._sum_t * self._sum_y) / spread
+
+    def minutes_to_full(self) -> float | None:
+        """Return the minutes until the lot is full at the current rate."""
+        if self.last is not None and self.last >= FULL:
+            return 0.0
+        rate = self.rate
+        if self.last is None or rate is None or rate < MIN_FILL_RATE:
+            return None
+        return (FULL - self.last) / rate
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the estimates as state attributes."""
+        rate = self.rate
+        minutes = self.minutes_to_full()
+        return {
+            "percent_full": self.last,
+            "fill_rate_per_hour": round(rate * 60, 1) if rate is not None else None,
+            "predicted_full_at": (
+                (self.last_time + timedelta(minutes=minutes)).isoformat()
+                if minutes is not None and self.last_time is not None
+                else None
+            ),
+            "samples": len(self._samples),
+        }
+
+
+class ParkingTracker:
+    """Fill series of every lot that reports how full it is.
+
+    Fed once per successful refresh like the lift waits. Each refresh also
+    records which lots crossed one of ``PARKING_THRESHOLDS`` since the
+    previous one, for the event source to fire in one batch.
+    """
+
+    def __init__(self) -> None:
+        """Initialize without series."""
+        self.series: dict[str, FillSeries] = {}
+        self._crossings: list[dict[str, Any]] = []
+
+    def add_snapshot(self, snapshot: Snapshot, now: datetime) -> set[Hashable]:
+        """Record the current percentages of the lots of ``snapshot``.
+
+        Return the ``(SECTION_FILL, name)`` contexts of the lots that took a
+        sample.
+        """
+        self._crossings = []
+        sampled: set[Hashable] = set()
+        for name, lot in snapshot.parking_lots.items():
+            if (percent := lot.percent_full) is None:
+                continue
+            percent = max(0, min(percent, FULL))
+            if (series := self.series.get(name)) is None:
+                series = self.series[name] = FillSeries()
+            previous, previous_time = series.last, series.last_time
+            continued = series.add(percent, now)
+            if series.last_time != previous_time:
+                sampled.add((SECTION_FILL, name))
+            if not continued or previous == percent:
+                continue
+            low, high = sorted((previous, percent))
+            crossed = [
+                threshold
+                for threshold in PARKING_THRESHOLDS
+                if low < threshold <= high
+            ]
+            if crossed:
+                minutes = series.minutes_to_full()
+                self._crossings.append(
+                    {
+                        "name": name,
+                        "thresholds": crossed,
+                        "rising": percent > previous,
+                        "previous_percent_full": previous,
+                        "percent_full": percent,
+                        "minutes_to_full": (
+                            round(minutes, 1) if minutes is not None else None
+                        ),
+                    }
+                )
+        return sampled
+
+    def get(self, name: str) -> FillSeries | None:
+        """Return the series of a lot, if it reported a percentage."""
+        return self.series.get(name)
+
+    def index(self, snapshot: Snapshot) -> Mapping[str, ParkingLot]:
+        """Return the lots of ``snapshot`` that have or report a percentage."""
+        return {
+            name: lot
+            for name, lot in snapshot.parking_lots.items()
+            if name in self.series or lot.percent_full is not None
+        }
+
+    def pop_crossings(self) -> list[dict[str, Any]]:
+        """Return and forget the threshold crossings of the latest refresh."""
+        crossings, self._crossings = self._crossings, []
+        return crossings
@@ -0,0 +1,154 @@
+"""Streaming parser for the Big Sky Resort feed."""
+from __future__ import annotations
+
+from time import monotonic
+from typing import Any
+from xml.parsers import expat
+
+from .model import (
+    Area,
+    Snapshot,
+    build_forecast_day,
+    build_lift,
+    build_park,
+    build_parking_lot,
+    build_resort,
+    build_shuttle_line,
+    build_trail,
+)
+
+# Elements the entities read, keyed by (parent tag, tag).
+_AREA = ("areas", "area")
+_LIFT = ("lifts", "lift")
+_TRAIL = ("trails", "trail")
+_PARK = ("parks", "park")
+_LOT = ("parking", "lot")
+_LINE = ("shuttles", "line")
+_DAY = ("forecast", "day")
+_LOCATION = ("resortLocations", "location")
+
+
+def _prefixed(attrs: dict[str, str]) -> dict[str, str]:
+    """Key expat attributes the way the model builders expect."""
+    return {f"@{name}": value for name, value in attrs.items()}
+
+
+class StreamingSnapshotParser:
+    """Build a snapshot from feed chunks as they arrive.
+
+    The expat pull parser is fed the response body chunk by chunk and only
+    the elements and attributes used by the entities are turned into model
+    records. No document tree or full body string is kept in memory.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the parser."""
+        self._parser = expat.ParserCreate()
+        self._parser.buffer_text = True
+        self._parser.StartElementHandler = self._start
+        self._parser.EndElementHandler = self._end
+        self._parser.CharacterDataHandler = self._text
+        self._stack: list[str] = []
+        self._root: str | None = None
+        self._report: dict[str, str] = {}
+        self._operations: dict[str, str] = {}
+        self._resortwide: dict[str, str] = {}
+        self._location: dict[str, str] | None = None
+        self._areas: dict[str, Area] = {}
+        self._area: str | None = None
+        self._lifts: list = []
+        self._trails: list = []
+        self._parks: list = []
+        self._lots: dict = {}
+        self._lines: list = []
+        self._days: list = []
+        self._day: dict[str, str] | None = None
+        self._day_text: list[str] = []
+        # Time spent parsing, as opposed to waiting for the next chunk.
+        self.elapsed = 0.0
+
+    def feed(self, chunk: bytes) -> None:
+        """Parse the next chunk of the response body."""
+        start = monotonic()
+        self._parser.Parse(chunk, False)
+        self.elapsed += monotonic() - start
+
+    def close(self) -> Snapshot:
+        """Finish parsing and return the snapshot."""
+        start = monotonic()
+        self._parser.Parse(b"", True)
+        if self._root != "report":
+            raise ValueError(f"Unexpected feed root element: {self._root}")
+        resort = build_resort(
+            self._report, self._operations, self._resortwide, self._location or {}
+        )
+        snapshot = Snapshot(
+            resort,
+            self._areas,
+            self._lots,
+            tuple(self._lines),
+            tuple(self._days),
+            self._report.get("@updated"),
+        )
+        self.elapsed += monotonic() - start
+        return snapshot
+
+    def _start(self, tag: str, attrs: dict[str, Any]) -> None:
+        parent = self._stack[-1] if self._stack else None
+        self._stack.append(tag)
+        key = (parent, tag)
+        if key == _TRAIL:
+            self._trails.append(build_trail(self._area, _prefixed(attrs)))
+        elif key == _LIFT:
+            self._lifts.append(build_lift(self._area, _prefixed(attrs)))
+        elif key == _PARK:
+            self._parks.append(build_park(self._area, _prefixed(attrs)))
+        elif key == _AREA:
+            self._area = attrs.get("name", "")
+            self._lifts, self._trails, self._parks = [], [], []
+        elif key == _LOT:
+            lot = build_parking_lot(_prefixed(attrs))
+            self._lots[lot.name] = lot
+        elif key == _LINE:
+            self._lines.append(build_shuttle_line(_prefixed(attrs)))
+        elif key == _DAY:
+            self._day = _prefixed(attrs)
+            self._day_text = []
+        elif key == _LOCATION:
+            if self._location is None:
+                self._location = _prefixed(attrs)
+        elif tag == "operations":
+            self._operations = _prefixed(attrs)
+        elif tag == "resortwide":
+            self._resortwide = _prefixed(attrs)
+        elif parent is None:
+            self._root = tag
+            self._report = _prefixed(attrs)
+
+    def _end(self, tag: str) -> None:
+        self._stack.pop()
+        if tag == "area" and self._area is not None:
+            self._areas[self._area] = Area(
+                name=self._area,
+                lifts=tuple(self._lifts),
+                trails=tuple(self._trails),
+                parks=tuple(self._parks),
+            )
+            self._area = None
+        elif tag == "day" and self._day is not None:
+            text = "".join(self._day_text).strip()
+            if text:
+                self._day["#text"] = text
+            self._days.append(build_forecast_day(self._day))
+            self._day = None
+
+    def _text(self, data: str) -> None:
+        if self._day is not None and self._stack[-1] == "day":
+            self._day_text.append(data)
+
+
+def parse_feed(body: bytes) -> Snapshot:
+    """Parse a complete feed body with the streaming parser."""
+    parser = StreamingSnapshotParser()
+    parser.feed(body)
+    return parser.close()
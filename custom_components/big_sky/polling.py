@@ -0,0 +1,114 @@
+"""Adaptive polling interval for Big Sky Resort."""
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable
+from datetime import datetime, time, timedelta
+
+from .diff import SECTION_LIFT, SECTION_PARK, SECTION_RESORT, SECTION_TRAIL
+from .model import Snapshot
+
+# Sections whose changes mean the mountain is actively changing state.
+ACTIVITY_SECTIONS = frozenset({SECTION_RESORT, SECTION_LIFT, SECTION_TRAIL, SECTION_PARK})
+
+# How close to an opening or closing time polling runs at the fastest rate.
+EVENT_WINDOW = timedelta(minutes=30)
+
+
+def parse_feed_time(value: str | None, cache: dict[str, time | None]) -> time | None:
+    """Parse a feed time such as ``9:00 AM``, memoizing the result."""
+    if not value:
+        return None
+    if value not in cache:
+        parsed = None
+        for fmt in ("%I:%M %p", "%I:%M%p", "%H:%M"):
+            try:
+                parsed = datetime.strptime(value.strip(), fmt).time()
+                break
+            except ValueError:
+                continue
+        cache[value] = parsed
+    return cache[value]
+
+
+class AdaptivePollingPolicy:
+    """Pick the next poll interval from the resort schedule and change rate.
+
+    While the resort is open, polling runs at ``fast`` inside
+    ``EVENT_WINDOW`` of the resort's or any lift's opening or closing time,
+    and right after lifts, trails, parks or the resort status changed.
+    While nothing changes the interval doubles, up to ``base`` during
+    operating hours and ``slow`` outside them, but never past the start of
+    the next event window. While the resort is closed, such as off-season,
+    polling stays at ``slow``; only a change of the resort itself, which is
+    how a reopening shows up, polls at ``fast`` once.
+    """
+
+    def __init__(self, fast: timedelta, base: timedelta, slow: timedelta) -> None:
+        """Initialize the policy."""
+        self.fast = fast
+        self.base = base
+        self.slow = slow
+        self.interval = base
+        self._times: dict[str, time | None] = {}
+
+    def _event_times(self, snapshot: Snapshot) -> set[time]:
+        resort = snapshot.resort
+        values: Iterable[str | None] = (
+            resort.open_time,
+            resort.close_time,
+            *(lift.open_time for lift in snapshot.lifts.values()),
+            *(lift.close_time for lift in snapshot.lifts.values()),
+        )
+        events = set()
+        for value in values:
+            if (parsed := parse_feed_time(value, self._times)) is not None:
+                events.add(parsed)
+        return events
+
+    def _is_operating(self, snapshot: Snapshot, now: datetime) -> bool:
+        resort = snapshot.resort
+        if not resort.is_open:
+            return False
+        opens = parse_feed_time(resort.open_time, self._times)
+        closes = parse_feed_time(resort.close_time, self._times)
+        if opens is None or closes is None:
+            return True
+        return opens <= now.time() <= closes
+
+    def next_interval(
+        self,
+        snapshot: Snapshot,
+        changed: set[Hashable] | None,
+        now: datetime,
+    ) -> timedelta:
+        """Return and remember the interval until the next poll."""
+        if not snapshot.resort.is_open:
+            reopening = changed is not None and SECTION_RESORT in changed
+            self.interval = self.fast if reopening else self.slow
+            return self.interval
+
+        until_event: timedelta | None = None
+        for event in self._event_times(snapshot):
+            at = now.replace(
+                hour=event.hour, minute=event.minute, second=0, microsecond=0
+            )
+            if at + EVENT_WINDOW < now:
+                at += timedelta(days=1)
+            delta = at - now
+            if abs(delta) <= EVENT_WINDOW:
+                until_event = timedelta(0)
+                break
+            if until_event is None or delta < until_event:
+                until_event = delta
+
+        if until_event == timedelta(0) or (
+            changed is not None and not ACTIVITY_SECTIONS.isdisjoint(changed)
+        ):
+            interval = self.fast
+        else:
+            limit = self.base if self._is_operating(snapshot, now) else self.slow
+            interval = min(self.interval * 2, limit)
+            if until_event is not None:
+                interval = min(interval, max(self.fast, until_event - EVENT_WINDOW))
+        self.interval = max(interval, self.fast)
+        return self.interval
@@ -0,0 +1,200 @@
+"""Keep per-item entities in sync with the resort feed."""
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Mapping
+from datetime import datetime
+import logging
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+
+from .const import SIGNAL_OPTIONS_UPDATED
+from .diff import section_context
+from .model import Snapshot
+
+LOGGER = logging.getLogger(__name__)
+
+# Poll intervals an item must be missing from the feed before its entity is
+# removed, so a single truncated feed does not drop entities.
+REMOVE_AFTER_MISSED = 3
+
+
+class ItemFamily:
+    """A kind of per-item entity, such as one binary sensor per lift.
+
+    ``option`` names the entry setting that switches the family on and off;
+    families without one are always created. ``disabled_by`` names a
+    setting that switches the family off while it is set.
+    ``legacy_unique_id`` returns the unique ID an item's entity had before
+    it was keyed by the item's full key; a registry entry still holding it
+    is moved over to the new ID rather than left orphaned.
+    """
+
+    __slots__ = (
+        "section", "option", "index", "factory", "disabled_by", "legacy_unique_id"
+    )
+
+    def __init__(
+        self,
+        section: str,
+        option: str | None,
+        index: Callable[[Snapshot], Mapping[Hashable, Any]],
+        factory: Callable[[Any], Entity],
+        disabled_by: str | None = None,
+        legacy_unique_id: Callable[[Any], str] | None = None,
+    ) -> None:
+        """Initialize the family."""
+        self.section = section
+        self.option = option
+        self.index = index
+        self.factory = factory
+        self.disabled_by = disabled_by
+        self.legacy_unique_id = legacy_unique_id
+
+
+class EntityReconciler:
+    """Add and remove per-item entities as the feed and options change.
+
+    Runs once at setup, after every refresh that touched one of the
+    families' sections and whenever the entry's options change. New items
+    are added in one ``async_add_entities`` batch. Items that vanished from
+    the feed, or whose family was switched off, are removed through the
+    entity registry in the same pass. Vanished items get a grace period of
+    ``REMOVE_AFTER_MISSED`` poll intervals, since an unchanged feed does not
+    notify listeners and cannot be counted on to trigger a pass.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        coordinator: Any,
+        async_add_entities: AddEntitiesCallback,
+        families: list[ItemFamily],
+    ) -> None:
+        """Initialize the reconciler."""
+        self._hass = hass
+        self._entry = entry
+        self._coordinator = coordinator
+        self._async_add_entities = async_add_entities
+        self._families = families
+        # Per family, by position: several families may share a section.
+        self._entities: list[dict[Hashable, Entity]] = [{} for _ in families]
+        self._missing_since: dict[tuple[int, Hashable], datetime] = {}
+        self._unsub_recheck: Callable[[], None] | None = None
+
+    @callback
+    def async_setup(self) -> None:
+        """Create the initial entities and start following updates."""
+        self.async_reconcile()
+        sections = section_context(*(family.section for family in self._families))
+        self._entry.async_on_unload(
+            self._coordinator.async_add_listener(self.async_reconcile, sections)
+        )
+        self._entry.async_on_unload(
+            async_dispatcher_connect(
+                self._hass,
+                SIGNAL_OPTIONS_UPDATED.format(self._entry.entry_id),
+                self.async_reconcile,
+            )
+        )
+        self._entry.async_on_unload(self._async_cancel_recheck)
+
+    @callback
+    def _async_cancel_recheck(self) -> None:
+        if self._unsub_recheck is not None:
+            self._unsub_recheck()
+            self._unsub_recheck = None
+
+    @callback
+    def _async_recheck(self, _now: datetime) -> None:
+        self._unsub_recheck = None
+        self.async_reconcile()
+
+    @callback
+    def async_reconcile(self) -> None:
+        """Bring the set of entities in line with the snapshot and options."""
+        snapshot = self._coordinator.data
+        if snapshot is None:
+            return
+        now = dt_util.utcnow()
+        grace = self._coordinator.update_interval * REMOVE_AFTER_MISSED
+        new_entities: list[Entity] = []
+        legacy: dict[str, Entity] = {}
+        removed: list[Entity] = []
+        for position, family in enumerate(self._families):
+            index = family.index(snapshot)
+            data = self._entry.data
+            enabled = (
+                family.option is None or data.get(family.option, True)
+            ) and not (family.disabled_by and data.get(family.disabled_by, False))
+            wanted = index.keys() if enabled else set()
+            entities = self._entities[position]
+            known = entities.keys()
+            for item_key in wanted - known:
+                entity = family.factory(index[item_key])
+                entities[item_key] = entity
+                new_entities.append(entity)
+                if family.legacy_unique_id is not None:
+                    legacy.setdefault(family.legacy_unique_id(index[item_key]), entity)
+            for item_key in known - wanted:
+                key = (position, item_key)
+                if enabled:
+                    since = self._missing_since.setdefault(key, now)
+                    if now - since < grace:
+                        continue
+                self._missing_since.pop(key, None)
+                removed.append(entities.pop(item_key))
+            # Items that came back after a short absence start over.
+            for key in [
+                key for key in self._missing_since
+                if key[0] == position and key[1] in wanted
+            ]:
+                del self._missing_since[key]
+
+        self._async_cancel_recheck()
+        if self._missing_since:
+            self._unsub_recheck = async_track_point_in_utc_time(
+                self._hass,
+                self._async_recheck,
+                min(self._missing_since.values()) + grace,
+            )
+
+        if legacy:
+            self._async_migrate_unique_ids(legacy)
+        if new_entities:
+            LOGGER.debug("Adding %s entities", len(new_entities))
+            self._async_add_entities(new_entities)
+        if removed:
+            LOGGER.debug("Removing %s entities", len(removed))
+            registry = er.async_get(self._hass)
+            for entity in removed:
+                if entity.entity_id and registry.async_get(entity.entity_id):
+                    registry.async_remove(entity.entity_id)
+                elif entity.hass is not None:
+                    self._hass.async_create_task(entity.async_remove())
+
+    @callback
+    def _async_migrate_unique_ids(self, legacy: dict[str, Entity]) -> None:
+        """Move registry entries from legacy unique IDs to the new entities'."""
+        registry = er.async_get(self._hass)
+        for entry in er.async_entries_for_config_entry(registry, self._entry.entry_id):
+            if (entity := legacy.get(entry.unique_id)) is None:
+                continue
+            if registry.async_get_entity_id(
+                entry.domain, entry.platform, entity.unique_id
+            ):
+                continue
+            LOGGER.debug(
+                "Migrating unique ID of %s to %s", entry.entity_id, entity.unique_id
+            )
+            registry.async_update_entity(
+                entry.entity_id, new_unique_id=entity.unique_id
+            )
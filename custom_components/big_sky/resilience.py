@@ -0,0 +1,82 @@
+"""Retry and circuit breaker policies for fetching the resort feed."""
+from __future__ import annotations
+
+import random
+from time import monotonic
+
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+BREAKER_STATES = [BREAKER_CLOSED, BREAKER_OPEN, BREAKER_HALF_OPEN]
+
+
+class RetryPolicy:
+    """Bounded retries with full-jitter exponential backoff.
+
+    The delay before retry ``n`` (counting from 0) is drawn uniformly from
+    ``[0, min(max_delay, base_delay * 2 ** n)]`` so several Home Assistant
+    instances that lost the feed at the same moment do not retry in step.
+    """
+
+    def __init__(
+        self,
+        attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 8.0,
+        attempt_timeout: float = 10.0,
+    ) -> None:
+        """Initialize the policy."""
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.attempt_timeout = attempt_timeout
+
+    def delay(self, retry: int) -> float:
+        """Return the seconds to wait before retry ``retry``."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**retry))
+
+
+class CircuitBreakerOpen(Exception):
+    """Raised instead of fetching while the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Stop calling a failing endpoint for a while.
+
+    After ``failure_threshold`` consecutive failed refreshes the breaker
+    opens and refreshes skip the network for ``reset_timeout`` seconds.
+    The next refresh after that is a single trial (half open): success
+    closes the breaker, failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 300.0) -> None:
+        """Initialize a closed breaker."""
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = BREAKER_CLOSED
+        self.failures = 0
+        self.opened = 0
+        self._opened_at = 0.0
+
+    def check(self) -> None:
+        """Raise ``CircuitBreakerOpen`` unless a fetch may be attempted."""
+        if self.state != BREAKER_OPEN:
+            return
+        remaining = self._opened_at + self.reset_timeout - monotonic()
+        if remaining > 0:
+            raise CircuitBreakerOpen(f"Circuit breaker open, next trial in {remaining:.0f}s")
+        self.state = BREAKER_HALF_OPEN
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful fetch."""
+        self.state = BREAKER_CLOSED
+        self.failures = 0
+
+    def record_failure(self) -> None:
+        """Count a failed fetch, opening the breaker at the threshold."""
+        self.failures += 1
+        if self.state == BREAKER_HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != BREAKER_OPEN:
+                self.opened += 1
+            self.state = BREAKER_OPEN
+            self._opened_at = monotonic()
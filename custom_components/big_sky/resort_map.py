@@ -0,0 +1,108 @@
+"""Compact per-area encoding of lift, trail and park statuses.
+
+In resort map mode the individual lift, trail and park binary sensors are
+replaced by bitmaps on the area sensors. Each area keeps an append-only
+index of item names per section; bit ``n`` of a bitmap is set when the
+item at position ``n`` of the index is open. Positions are never reused or
+reordered, so a recorded bitmap still decodes against today's index.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .diff import SECTION_LIFT, SECTION_PARK, SECTION_TRAIL
+from .model import Area, Snapshot
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 30
+
+MAP_SECTIONS = (SECTION_LIFT, SECTION_TRAIL, SECTION_PARK)
+
+
+def _records(area: Area, section: str) -> tuple[Any, ...]:
+    if section == SECTION_LIFT:
+        return area.lifts
+    if section == SECTION_TRAIL:
+        return area.trails
+    return area.parks
+
+
+def encode_bitmap(positions: list[int]) -> str:
+    """Return the hex bitmap with bits ``positions`` set.
+
+    Decodes in a template with ``value | int(base=16) | bitwise_and(2 ** n)``.
+    """
+    bits = 0
+    for position in positions:
+        bits |= 1 << position
+    return format(bits, "x")
+
+
+class ResortMapIndex:
+    """Stable name index and per-snapshot bitmaps of a config entry."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the index."""
+        self._store: Store[dict[str, dict[str, list[str]]]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.resort_map.{entry_id}"
+        )
+        # area -> section -> names, in position order
+        self._names: dict[str, dict[str, list[str]]] = {}
+        self._positions: dict[tuple[str, str, str], int] = {}
+        self._snapshot: Snapshot | None = None
+        self._maps: dict[str, dict[str, str]] = {}
+
+    async def async_load(self) -> None:
+        """Load the index written by earlier runs."""
+        self._names = await self._store.async_load() or {}
+        for area, sections in self._names.items():
+            for section, names in sections.items():
+                for position, name in enumerate(names):
+                    self._positions[(section, area, name)] = position
+
+    async def async_remove(self) -> None:
+        """Delete the stored index."""
+        await self._store.async_remove()
+
+    def position(self, section: str, area: str, name: str) -> int | None:
+        """Return an item's bit position, if it has one."""
+        return self._positions.get((section, area, name))
+
+    def names(self, area: str, section: str) -> list[str]:
+        """Return the indexed names of an area's section, in position order."""
+        return self._names.get(area, {}).get(section, [])
+
+    @callback
+    def bitmaps(self, snapshot: Snapshot) -> dict[str, dict[str, str]]:
+        """Return the open bitmaps of every area of ``snapshot`` by section.
+
+        Computed once per snapshot; new items are appended to the index.
+        """
+        if snapshot is self._snapshot:
+            return self._maps
+        grown = False
+        maps: dict[str, dict[str, str]] = {}
+        for area in snapshot.areas.values():
+            area_maps = maps[area.name] = {}
+            for section in MAP_SECTIONS:
+                open_positions = []
+                for record in _records(area, section):
+                    key = (section, area.name, record.name)
+                    position = self._positions.get(key)
+                    if position is None:
+                        names = self._names.setdefault(area.name, {}).setdefault(section, [])
+                        position = self._positions[key] = len(names)
+                        names.append(record.name)
+                        grown = True
+                    if record.is_open:
+                        open_positions.append(position)
+                area_maps[section] = encode_bitmap(open_positions)
+        if grown:
+            self._store.async_delay_save(lambda: self._names, SAVE_DELAY)
+        self._snapshot = snapshot
+        self._maps = maps
+        return maps
@@ -0,0 +1,165 @@
+"""Aggregate counts computed once per Big Sky Resort snapshot."""
+from __future__ import annotations
+
+from typing import Any
+
+from .model import Lift, Snapshot
+
+TRAM_AREA = "Lone Peak Area"
+
+# Difficulties always reported by the trails by difficulty sensor, even when
+# the feed has no trails of that rating.
+DIFFICULTIES = ("beginner", "intermediate", "advanced", "expert", "high_exposure")
+
+
+def _counter() -> dict[str, int]:
+    return {"open": 0, "total": 0}
+
+
+def _count(counters: dict[str, dict[str, int]], key: str, is_open: bool) -> None:
+    counter = counters.get(key)
+    if counter is None:
+        counter = counters[key] = _counter()
+    counter["total"] += 1
+    if is_open:
+        counter["open"] += 1
+
+
+def _is_yes(value: str | None) -> bool:
+    return (value or "").lower() == "yes"
+
+
+def difficulty_key(difficulty: str | None) -> str:
+    """Return the attribute key of a feed difficulty such as ``High Exposure``."""
+    return (difficulty or "").lower().replace(" ", "_")
+
+
+class AreaRollup:
+    """Open and total counts for one resort area."""
+
+    __slots__ = ("name", "lifts", "trails", "parks", "groomed", "uphill")
+
+    def __init__(self, name: str) -> None:
+        """Initialize empty counters."""
+        self.name = name
+        self.lifts = _counter()
+        self.trails = _counter()
+        self.parks = _counter()
+        self.groomed = 0
+        self.uphill = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counts as state attributes."""
+        return {
+            "lifts_open": self.lifts["open"],
+            "lifts_total": self.lifts["total"],
+            "trails_open": self.trails["open"],
+            "trails_total": self.trails["total"],
+            "parks_open": self.parks["open"],
+            "parks_total": self.parks["total"],
+            "groomed": self.groomed,
+            "uphill": self.uphill,
+        }
+
+
+class Rollups:
+    """Aggregates of one snapshot, built in a single pass over its areas.
+
+    Entities read their counts and detail attributes from here instead of
+    walking the snapshot on every state write. The mappings are shared
+    between readers and must not be modified.
+    """
+
+    __slots__ = (
+        "snapshot",
+        "areas",
+        "trails_by_difficulty",
+        "lifts_by_type",
+        "lifts",
+        "trails",
+        "parks",
+        "groomed",
+        "uphill",
+        "parks_detail",
+        "parking_open",
+        "parking_detail",
+        "tram",
+        "tram_trails",
+    )
+
+    def __init__(self, snapshot: Snapshot) -> None:
+        """Compute the aggregates of ``snapshot``."""
+        self.snapshot = snapshot
+        self.areas: dict[str, AreaRollup] = {}
+        self.trails_by_difficulty = {key: _counter() for key in DIFFICULTIES}
+        self.lifts_by_type: dict[str, dict[str, int]] = {}
+        self.lifts = _counter()
+        self.trails = _counter()
+        self.parks = _counter()
+        self.groomed = 0
+        self.uphill = 0
+        self.parks_detail: dict[str, dict[str, Any]] = {}
+        self.tram: Lift | None = None
+        self.tram_trails: list[dict[str, Any]] = []
+
+        for area in snapshot.areas.values():
+            rollup = self.areas[area.name] = AreaRollup(area.name)
+            for lift in area.lifts:
+                is_open = lift.is_open
+                _count(self.lifts_by_type, lift.type or "unknown", is_open)
+                for counter in (rollup.lifts, self.lifts):
+                    counter["total"] += 1
+                    counter["open"] += is_open
+            for trail in area.trails:
+                is_open = trail.is_open
+                counter = self.trails_by_difficulty.get(difficulty_key(trail.difficulty))
+                if counter is not None:
+                    counter["total"] += 1
+                    counter["open"] += is_open
+                for counter in (rollup.trails, self.trails):
+                    counter["total"] += 1
+                    counter["open"] += is_open
+                if _is_yes(trail.groomed):
+                    rollup.groomed += 1
+                if _is_yes(trail.uphill):
+                    rollup.uphill += 1
+            for park in area.parks:
+                is_open = park.is_open
+                for counter in (rollup.parks, self.parks):
+                    counter["total"] += 1
+                    counter["open"] += is_open
+                self.parks_detail[park.name] = {
+                    "status": park.status,
+                    "difficulty": park.difficulty,
+                    "groomed": park.groomed,
+                }
+            self.groomed += rollup.groomed
+            self.uphill += rollup.uphill
+
+            if area.name == TRAM_AREA and area.lifts:
+                self.tram = next(
+                    (lift for lift in area.lifts if "Tram" in (lift.type or "")),
+                    area.lifts[0],
+                )
+                self.tram_trails = [
+                    {
+                        "name": trail.name,
+                        "status": trail.status,
+                        "difficulty": trail.difficulty,
+                        "groomed": trail.groomed,
+                    }
+                    for trail in area.trails
+                ]
+
+        self.parking_open = 0
+        self.parking_detail: dict[str, dict[str, Any]] = {}
+        for lot in snapshot.parking_lots.values():
+            if lot.status == "open":
+                self.parking_open += 1
+            self.parking_detail[lot.name] = {
+                "status": lot.status,
+                "percent_full": lot.percent_full,
+                "open_time": lot.open_time,
+                "closed_time": lot.closed_time,
+                "alert": lot.alert,
+            }
@@ -0,0 +1,51 @@
+"""Shared fetch scheduler for all configured resorts."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_SCHEDULER, FETCH_SPACING, MAX_CONCURRENT_FETCHES
+
+
+class FeedScheduler:
+    """Bound and spread out feed fetches across config entries.
+
+    Every coordinator fetches inside ``async_slot``. At most
+    ``max_concurrent`` fetches run at once and consecutive fetches start at
+    least ``spacing`` seconds apart, so resorts that refresh at the same
+    moment (for example at startup) do not all hit the network together.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = MAX_CONCURRENT_FETCHES,
+        spacing: float = FETCH_SPACING,
+    ) -> None:
+        """Initialize the scheduler."""
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._spacing = spacing
+        self._next_start = 0.0
+
+    @asynccontextmanager
+    async def async_slot(self) -> AsyncIterator[None]:
+        """Wait for this fetch's start time and a free slot."""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        # Reserve the start time before awaiting so callers keep their order.
+        start = max(now, self._next_start)
+        self._next_start = start + self._spacing
+        if start > now:
+            await asyncio.sleep(start - now)
+        async with self._semaphore:
+            yield
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> FeedScheduler:
+    """Return the scheduler shared by all Big Sky config entries."""
+    if (scheduler := hass.data.get(DATA_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_SCHEDULER] = FeedScheduler()
+    return scheduler
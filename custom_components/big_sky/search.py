@@ -0,0 +1,260 @@
+"""In-memory search index of lifts, trails and terrain parks."""
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable
+import heapq
+import re
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
+
+from .diff import (
+    SECTION_LIFT,
+    SECTION_PARK,
+    SECTION_TRAIL,
+    section_context,
+    section_records,
+)
+from .rollups import difficulty_key
+
+SEARCH_SECTIONS = (SECTION_LIFT, SECTION_TRAIL, SECTION_PARK)
+
+# Trail colors people say instead of the feed's difficulty names.
+DIFFICULTY_ALIASES = {
+    "green": "beginner",
+    "blue": "intermediate",
+    "black": "advanced",
+    "double_black": "expert",
+}
+
+FIELD_SECTION = "section"
+FIELD_AREA = "area"
+FIELD_DIFFICULTY = "difficulty"
+FIELD_GROOMED = "groomed"
+FIELD_UPHILL = "uphill"
+FIELD_STATUS = "status"
+FIELD_OPEN = "open"
+FIELDS = (
+    FIELD_SECTION,
+    FIELD_AREA,
+    FIELD_DIFFICULTY,
+    FIELD_GROOMED,
+    FIELD_UPHILL,
+    FIELD_STATUS,
+    FIELD_OPEN,
+)
+
+# Minimum trigram similarity (Dice coefficient) of a fuzzy name match.
+FUZZY_THRESHOLD = 0.4
+
+SCORE_EXACT = 1.0
+SCORE_PREFIX = 0.9
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+ItemKey = tuple[str, str, str]
+
+_EMPTY: frozenset[ItemKey] = frozenset()
+
+
+def normalize(text: str | None) -> str:
+    """Return lowercase words separated by single spaces."""
+    return " ".join(_WORD.findall((text or "").lower()))
+
+
+def trigrams(text: str) -> set[str]:
+    """Return the trigrams of normalized text, padded at word boundaries."""
+    padded = f"  {text} "
+    return {padded[index : index + 3] for index in range(len(padded) - 2)}
+
+
+def _intersect(postings: list[set[ItemKey]]) -> set[ItemKey] | None:
+    """Intersect posting sets smallest first; None when there are none."""
+    if not postings:
+        return None
+    postings = sorted(postings, key=len)
+    return postings[0].intersection(*postings[1:])
+
+
+def _is_yes(value: str | None) -> bool:
+    return (value or "").lower() == "yes"
+
+
+def difficulty_filter(value: str) -> str:
+    """Return the difficulty key of a filter, accepting trail colors."""
+    key = difficulty_key(normalize(value))
+    return DIFFICULTY_ALIASES.get(key, key)
+
+
+class SearchIndex:
+    """Name and attribute indexes over the items of the current snapshot.
+
+    Names are indexed by word prefix and by trigram, and items by area,
+    difficulty, groomed, uphill, status and open state. After a refresh only
+    the items in the coordinator's changed set are re-indexed. Queries
+    intersect the smallest posting sets first and never touch entity states.
+    """
+
+    def __init__(self, entry: ConfigEntry, coordinator: Any) -> None:
+        """Initialize an empty index."""
+        self._entry = entry
+        self._coordinator = coordinator
+        self._records: dict[ItemKey, Any] = {}
+        self._names: dict[ItemKey, str] = {}
+        self._trigram_counts: dict[ItemKey, int] = {}
+        self._prefixes: dict[str, set[ItemKey]] = {}
+        self._trigrams: dict[str, set[ItemKey]] = {}
+        self._fields: dict[str, dict[Hashable, set[ItemKey]]] = {
+            field: {} for field in FIELDS
+        }
+        # Where each item is posted, so it can be unindexed without a scan.
+        self._postings: dict[ItemKey, list[tuple[dict, Hashable]]] = {}
+
+    @callback
+    def async_setup(self) -> None:
+        """Build the index and follow refreshes."""
+        self.async_update()
+        self._entry.async_on_unload(
+            self._coordinator.async_add_listener(
+                self.async_update, section_context(*SEARCH_SECTIONS)
+            )
+        )
+
+    @callback
+    def async_update(self) -> None:
+        """Re-index the items changed by the latest refresh."""
+        snapshot = self._coordinator.data
+        if snapshot is None:
+            return
+        changed = self._coordinator.last_changed
+        if changed is None or not self._records:
+            keys: Iterable[ItemKey] = set(self._records) | {
+                (section, *key)
+                for section in SEARCH_SECTIONS
+                for key in section_records(snapshot, section)
+            }
+        else:
+            keys = (
+                key
+                for key in changed
+                if isinstance(key, tuple) and len(key) == 3 and key[0] in SEARCH_SECTIONS
+            )
+        for key in keys:
+            section, area, name = key
+            self._remove(key)
+            if (record := section_records(snapshot, section).get((area, name))) is not None:
+                self._add(key, record)
+
+    def _post(self, index: dict[Hashable, set[ItemKey]], value: Hashable, key: ItemKey) -> None:
+        posting = index.get(value)
+        if posting is None:
+            posting = index[value] = set()
+        posting.add(key)
+        self._postings[key].append((index, value))
+
+    def _add(self, key: ItemKey, record: Any) -> None:
+        section = key[0]
+        name = normalize(record.name)
+        self._records[key] = record
+        self._names[key] = name
+        self._postings[key] = []
+        for word in name.split():
+            for end in range(1, len(word) + 1):
+                self._post(self._prefixes, word[:end], key)
+        name_trigrams = trigrams(name)
+        self._trigram_counts[key] = len(name_trigrams)
+        for trigram in name_trigrams:
+            self._post(self._trigrams, trigram, key)
+        fields = self._fields
+        self._post(fields[FIELD_SECTION], section, key)
+        self._post(fields[FIELD_AREA], normalize(record.area), key)
+        self._post(fields[FIELD_STATUS], normalize(record.status), key)
+        self._post(fields[FIELD_OPEN], record.is_open, key)
+        if section != SECTION_LIFT:
+            self._post(fields[FIELD_DIFFICULTY], difficulty_key(record.difficulty), key)
+            self._post(fields[FIELD_GROOMED], _is_yes(record.groomed), key)
+        if section == SECTION_TRAIL:
+            self._post(fields[FIELD_UPHILL], _is_yes(record.uphill), key)
+
+    def _remove(self, key: ItemKey) -> None:
+        if self._records.pop(key, None) is None:
+            return
+        del self._names[key]
+        del self._trigram_counts[key]
+        for index, value in self._postings.pop(key):
+            posting = index[value]
+            posting.discard(key)
+            if not posting:
+                del index[value]
+
+    def _fuzzy(self, query: str, candidates: set[ItemKey] | None) -> dict[ItemKey, float]:
+        """Score items whose name shares enough trigrams with ``query``."""
+        query_trigrams = trigrams(query)
+        counts: dict[ItemKey, int] = {}
+        for trigram in query_trigrams:
+            for key in self._trigrams.get(trigram, ()):
+                if candidates is None or key in candidates:
+                    counts[key] = counts.get(key, 0) + 1
+        scores = {}
+        for key, count in counts.items():
+            # Dice coefficient of the two trigram sets.
+            score = 2 * count / (len(query_trigrams) + self._trigram_counts[key])
+            if score >= FUZZY_THRESHOLD:
+                scores[key] = round(score * SCORE_PREFIX, 3)
+        return scores
+
+    def search(
+        self,
+        query: str | None = None,
+        filters: dict[str, Any] | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return matching items, best name matches first.
+
+        ``filters`` maps field names to the value items must have; area and
+        status compare case-insensitively and difficulty also accepts trail
+        colors such as ``blue``.
+        """
+        postings = []
+        for field, value in (filters or {}).items():
+            if field == FIELD_DIFFICULTY:
+                value = difficulty_filter(value)
+            elif field in (FIELD_AREA, FIELD_STATUS):
+                value = normalize(value)
+            postings.append(self._fields[field].get(value, _EMPTY))
+        candidates = _intersect(postings)
+
+        scores: dict[ItemKey, float | None]
+        if query and (query := normalize(query)):
+            # Every word of the query must start a word of the name; failing
+            # that, fall back to fuzzy trigram matching.
+            matches = _intersect(
+                postings + [self._prefixes.get(word, _EMPTY) for word in query.split()]
+            )
+            if matches:
+                scores = {
+                    key: SCORE_EXACT if self._names[key] == query else SCORE_PREFIX
+                    for key in matches
+                }
+            else:
+                scores = self._fuzzy(query, candidates)
+        else:
+            scores = dict.fromkeys(self._records if candidates is None else candidates)
+
+        def rank(key: ItemKey) -> tuple[float, str]:
+            return -(scores[key] or 0), self._names[key]
+
+        if limit is None:
+            ranked = sorted(scores, key=rank)
+        else:
+            ranked = heapq.nsmallest(limit, scores, key=rank)
+        return [
+            {
+                "section": key[0],
+                **self._records[key].as_dict(),
+                "is_open": self._records[key].is_open,
+                "score": scores[key],
+            }
+            for key in ranked
+        ]
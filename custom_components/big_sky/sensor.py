@@ -1,23 +1,254 @@
 """Sensor platform for Big Sky Resort."""
 from __future__ import annotations
+from dataclasses import dataclass
 from typing import Any
 
 from homeassistant.components.sensor import (
     SensorEntity,
+    SensorEntityDescription,
     SensorDeviceClass,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.const import (
+    EntityCategory,
+    UnitOfInformation,
     UnitOfLength,
     UnitOfTemperature,
+    UnitOfTime,
     PERCENTAGE,
 )
 
-from .const import DOMAIN
+from .accessors import FieldDescriptionMixin, compile_accessor, to_minutes
+from .const import CONF_RESORT_MAP, DOMAIN, SIGNAL_OPTIONS_UPDATED
+from .diff import (
+    SECTION_AREA,
+    SECTION_COORDINATOR,
+    SECTION_FILL,
+    SECTION_FORECAST,
+    SECTION_LIFT,
+    SECTION_METRICS,
+    SECTION_PARK,
+    SECTION_PARKING,
+    SECTION_RESORT,
+    SECTION_SHUTTLE,
+    SECTION_TRAIL,
+    SECTION_WAIT,
+    item_context,
+    section_context,
+)
+from .metrics import (
+    METRIC_BUILD_DURATION,
+    METRIC_ENTITIES_UPDATED,
+    METRIC_FETCH_BYTES,
+    METRIC_FETCH_LATENCY,
+    METRIC_LOOP_TIME,
+    METRIC_PARSE_DURATION,
+)
+from .reconcile import EntityReconciler, ItemFamily
+from .resilience import BREAKER_STATES
+from .resort_map import MAP_SECTIONS
+from .waits import PREDICTION_HORIZON, WAIT_SCENIC, WAIT_SKIER, parse_wait
+
+# Runtime metric sensors: metric, name, unit, device class, scale, icon.
+# Durations are recorded in seconds and reported in milliseconds.
+METRIC_SENSORS = (
+    (METRIC_FETCH_LATENCY, "Fetch Latency", UnitOfTime.MILLISECONDS,
+     SensorDeviceClass.DURATION, 1000, "mdi:timer-outline"),
+    (METRIC_FETCH_BYTES, "Fetch Size", UnitOfInformation.BYTES,
+     SensorDeviceClass.DATA_SIZE, 1, "mdi:download-network"),
+    (METRIC_PARSE_DURATION, "Parse Duration", UnitOfTime.MILLISECONDS,
+     SensorDeviceClass.DURATION, 1000, "mdi:code-tags"),
+    (METRIC_BUILD_DURATION, "Snapshot Build Time", UnitOfTime.MILLISECONDS,
+     SensorDeviceClass.DURATION, 1000, "mdi:table-cog"),
+    (METRIC_ENTITIES_UPDATED, "Entities Updated", None,
+     None, 1, "mdi:update"),
+    (METRIC_LOOP_TIME, "Event Loop Time", UnitOfTime.MILLISECONDS,
+     SensorDeviceClass.DURATION, 1000, "mdi:sync"),
+)
+
+
+def _park_attributes(coordinator):
+    rollups = coordinator.rollups
+    if coordinator.slim_attributes:
+        return {"open": rollups.parks["open"], "total": rollups.parks["total"]}
+    return rollups.parks_detail
+
+
+def _trail_attributes(coordinator):
+    rollups = coordinator.rollups
+    return {
+        **rollups.trails_by_difficulty,
+        "groomed": rollups.groomed,
+        "uphill": rollups.uphill,
+    }
+
+
+def _lift_attributes(coordinator):
+    rollups = coordinator.rollups
+    return {"total": rollups.lifts["total"], **rollups.lifts_by_type}
+
+
+def _weather_attributes(coordinator):
+    current = coordinator.forecast.current
+    if current is None:
+        return {}
+    return {
+        "condition": current.weather,
+        "high": current.high,
+        "low": current.low,
+        "details": current.text
+    }
+
+
+def _parking_attributes(coordinator):
+    rollups = coordinator.rollups
+    if coordinator.slim_attributes:
+        return {"total": len(rollups.parking_detail)}
+    return rollups.parking_detail
+
+
+def _shuttle_attributes(coordinator):
+    shuttle = coordinator.data.shuttle
+    if shuttle is None:
+        return {}
+    return {
+        "number_running": shuttle.number_running,
+        "open_time": shuttle.open_time,
+        "closed_time": shuttle.closed_time,
+        "comment": shuttle.comment,
+        "alert": shuttle.alert
+    }
+
+
+def _breaker_attributes(coordinator):
+    breaker = coordinator.breaker
+    return {
+        "consecutive_failures": breaker.failures,
+        "times_opened": breaker.opened,
+        "stale": coordinator.stale,
+    }
+
+
+def _retry_attributes(coordinator):
+    metrics = coordinator.metrics
+    return {"refreshes": metrics.refreshes, "failures": metrics.failures}
+
+
+@dataclass(frozen=True, kw_only=True)
+class BigSkySensorEntityDescription(FieldDescriptionMixin, SensorEntityDescription):
+    """Sensor whose state is one field of the coordinator."""
+
+
+# Sensors whose state is one field of the coordinator; a new one is a row.
+SENSOR_DESCRIPTIONS = (
+    BigSkySensorEntityDescription(
+        key="snow_depth",
+        name="Snow Depth",
+        read=compile_accessor("data.resort.snow_base"),
+        sections=(SECTION_RESORT,),
+        icon="mdi:ruler",
+        device_class=SensorDeviceClass.DISTANCE,
+        native_unit_of_measurement=UnitOfLength.INCHES,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    BigSkySensorEntityDescription(
+        key="snowfall_24h",
+        name="24h Snowfall",
+        read=compile_accessor("data.resort.snow_24h"),
+        sections=(SECTION_RESORT,),
+        icon="mdi:weather-snowy-heavy",
+        device_class=SensorDeviceClass.DISTANCE,
+        native_unit_of_measurement=UnitOfLength.INCHES,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    BigSkySensorEntityDescription(
+        key="current_weather",
+        name="Current Weather",
+        read=compile_accessor("forecast.current.high"),
+        sections=(SECTION_FORECAST,),
+        attributes=_weather_attributes,
+        icon="mdi:weather-partly-cloudy",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
+    ),
+    BigSkySensorEntityDescription(
+        key="terrain_parks",
+        name="Terrain Parks",
+        read=compile_accessor("data.resort.num_parks_open"),
+        sections=(SECTION_RESORT, SECTION_PARK),
+        attributes=_park_attributes,
+        icon="mdi:snowboard",
+    ),
+    BigSkySensorEntityDescription(
+        key="trails_by_difficulty",
+        name="Trails by Difficulty",
+        read=compile_accessor("data.resort.num_trails_open"),
+        sections=(SECTION_RESORT, SECTION_TRAIL),
+        attributes=_trail_attributes,
+        icon="mdi:ski",
+    ),
+    BigSkySensorEntityDescription(
+        key="lifts",
+        name="Lifts",
+        read=compile_accessor("rollups.lifts[open]"),
+        sections=(SECTION_LIFT,),
+        attributes=_lift_attributes,
+        icon="mdi:gondola",
+    ),
+    BigSkySensorEntityDescription(
+        key="parking",
+        name="Parking",
+        read=compile_accessor("rollups.parking_open"),
+        sections=(SECTION_PARKING,),
+        attributes=_parking_attributes,
+        icon="mdi:parking",
+    ),
+    BigSkySensorEntityDescription(
+        key="shuttle",
+        name="Shuttle",
+        read=compile_accessor("data.shuttle.status"),
+        sections=(SECTION_SHUTTLE,),
+        attributes=_shuttle_attributes,
+        icon="mdi:bus",
+    ),
+    BigSkySensorEntityDescription(
+        key="poll_interval",
+        name="Poll Interval",
+        read=compile_accessor("update_interval", to_minutes),
+        sections=(SECTION_COORDINATOR,),
+        attributes=lambda coordinator: {"adaptive": coordinator.polling is not None},
+        icon="mdi:timer-sync-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    BigSkySensorEntityDescription(
+        key="circuit_breaker",
+        name="Feed Circuit Breaker",
+        read=compile_accessor("breaker.state"),
+        sections=(SECTION_METRICS,),
+        attributes=_breaker_attributes,
+        icon="mdi:electric-switch",
+        device_class=SensorDeviceClass.ENUM,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        options=BREAKER_STATES,
+    ),
+    BigSkySensorEntityDescription(
+        key="fetch_retries",
+        name="Fetch Retries",
+        read=compile_accessor("metrics.retries"),
+        sections=(SECTION_METRICS,),
+        attributes=_retry_attributes,
+        icon="mdi:reload-alert",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+)
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -25,264 +256,334 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Big Sky Resort sensors."""
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
-    
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator = entry_data["coordinator"]
+    resort_map = entry_data["resort_map"]
+
     sensors = [
-        BigSkySnowDepthSensor(coordinator),
-        BigSkySnowfall24hSensor(coordinator),
-        BigSkyCurrentWeatherSensor(coordinator),
-        BigSkyTerrainParksSensor(coordinator),
-        BigSkyTrailsByDifficultySensor(coordinator),
-        BigSkyTramSensor(coordinator),
-        BigSkyParkingSensor(coordinator),
-        BigSkyShuttleSensor(coordinator),
+        BigSkyFieldSensor(coordinator, description)
+        for description in SENSOR_DESCRIPTIONS
     ]
+    sensors.append(BigSkyTramSensor(coordinator))
+    sensors.extend(
+        BigSkyMetricSensor(coordinator, *description) for description in METRIC_SENSORS
+    )
 
     async_add_entities(sensors)
 
-class BigSkySnowDepthSensor(CoordinatorEntity, SensorEntity):
-    """Snow depth sensor."""
-    def __init__(self, coordinator):
-        super().__init__(coordinator)
-        self._attr_name = "Big Sky Snow Depth"
-        self._attr_unique_id = "big_sky_snow_depth"
-        self._attr_device_class = SensorDeviceClass.DISTANCE
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_native_unit_of_measurement = UnitOfLength.INCHES
-        self._attr_icon = "mdi:ruler"
+    EntityReconciler(
+        hass,
+        config_entry,
+        coordinator,
+        async_add_entities,
+        [
+            ItemFamily(
+                SECTION_AREA,
+                None,
+                lambda snapshot: snapshot.areas,
+                lambda area: BigSkyAreaSensor(
+                    coordinator, area.name, config_entry, resort_map
+                ),
+            ),
+            ItemFamily(
+                SECTION_LIFT,
+                None,
+                coordinator.waits.index,
+                lambda lift: BigSkyLiftWaitSensor(coordinator, lift.name, lift.area),
+            ),
+            ItemFamily(
+                SECTION_LIFT,
+                None,
+                coordinator.waits.index,
+                lambda lift: BigSkyLiftWaitPredictionSensor(
+                    coordinator, lift.name, lift.area
+                ),
+            ),
+            ItemFamily(
+                SECTION_PARKING,
+                None,
+                coordinator.parking.index,
+                lambda lot: BigSkyParkingFillSensor(coordinator, lot.name),
+            ),
+        ],
+    ).async_setup()
+
+class BigSkyFieldSensor(CoordinatorEntity, SensorEntity):
+    """Sensor described by a row of ``SENSOR_DESCRIPTIONS``."""
+
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator, description):
+        super().__init__(coordinator, section_context(*description.sections))
+        self.entity_description = description
+        self._attr_unique_id = coordinator.entity_unique_id(description.key)
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self):
-        """Return snow depth."""
-        return float(self.coordinator.data["report"]["currentConditions"]["resortLocations"]["location"]["@base"])
+        """Return the described field."""
+        return self.entity_description.read(self.coordinator)
 
-class BigSkySnowfall24hSensor(CoordinatorEntity, SensorEntity):
-    """24h snowfall sensor."""
-    def __init__(self, coordinator):
-        super().__init__(coordinator)
-        self._attr_name = "Big Sky 24h Snowfall"
-        self._attr_unique_id = "big_sky_snowfall_24h"
-        self._attr_device_class = SensorDeviceClass.DISTANCE
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_native_unit_of_measurement = UnitOfLength.INCHES
-        self._attr_icon = "mdi:weather-snowy-heavy"
+    @property
+    def extra_state_attributes(self):
+        """Return the described attributes."""
+        if (attributes := self.entity_description.attributes) is None:
+            return None
+        return attributes(self.coordinator)
+
+class BigSkyAreaSensor(CoordinatorEntity, SensorEntity):
+    """Summary of one resort area.
+
+    In resort map mode this also carries the open lifts, trails and parks
+    of the area as bitmaps over a stable name index.
+    """
+
+    _attr_has_entity_name = True
+    _unrecorded_attributes = frozenset(
+        f"{section}_index" for section in MAP_SECTIONS
+    )
+
+    def __init__(self, coordinator, area_name, config_entry, resort_map):
+        super().__init__(coordinator, item_context(SECTION_AREA, area_name))
+        self._area_name = area_name
+        self._config_entry = config_entry
+        self._resort_map = resort_map
+        self._attr_name = area_name
+        self._attr_unique_id = coordinator.entity_unique_id(
+            f"area_{area_name.lower().replace(' ', '_')}"
+        )
+        self._attr_device_info = coordinator.device_info
+        self._attr_icon = "mdi:map-marker-radius"
+
+    async def async_added_to_hass(self) -> None:
+        """Also rewrite the state when resort map mode is switched."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_OPTIONS_UPDATED.format(self._config_entry.entry_id),
+                self.async_write_ha_state,
+            )
+        )
 
     @property
     def native_value(self):
-        """Return 24h snowfall."""
-        return float(self.coordinator.data["report"]["currentConditions"]["resortLocations"]["location"]["@snow24Hours"])
+        """Return open trails in the area."""
+        area = self.coordinator.rollups.areas.get(self._area_name)
+        return area.trails["open"] if area else None
 
-class BigSkyTerrainParksSensor(CoordinatorEntity, SensorEntity):
-    """Terrain parks sensor."""
-    def __init__(self, coordinator):
-        super().__init__(coordinator)
-        self._attr_name = "Big Sky Terrain Parks"
-        self._attr_unique_id = "big_sky_terrain_parks"
-        self._attr_icon = "mdi:snowboard"
+    @property
+    def extra_state_attributes(self):
+        """Return lift, trail and park counts of the area."""
+        area = self.coordinator.rollups.areas.get(self._area_name)
+        if area is None:
+            return {}
+        attributes = area.as_dict()
+        if self._config_entry.data.get(CONF_RESORT_MAP, False):
+            bitmaps = self._resort_map.bitmaps(self.coordinator.data)[self._area_name]
+            for section in MAP_SECTIONS:
+                attributes[f"{section}_map"] = bitmaps[section]
+                attributes[f"{section}_index"] = self._resort_map.names(
+                    self._area_name, section
+                )
+        return attributes
+
+class BigSkyLiftWaitSensor(CoordinatorEntity, SensorEntity):
+    """Skier wait time of one lift, with rolling statistics and prediction."""
+
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator, lift_name, area_name):
+        # Statistics move with every sample, not only when the lift changes.
+        super().__init__(
+            coordinator,
+            item_context(SECTION_LIFT, area_name, lift_name)
+            | item_context(SECTION_WAIT, area_name, lift_name),
+        )
+        self._key = (area_name, lift_name)
+        self._attr_name = f"{lift_name} Wait"
+        self._attr_unique_id = coordinator.item_unique_id(
+            "lift_wait", area_name, lift_name
+        )
+        self._attr_device_info = coordinator.device_info
+        self._attr_icon = "mdi:human-queue"
+        self._attr_device_class = SensorDeviceClass.DURATION
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_native_unit_of_measurement = UnitOfTime.MINUTES
 
     @property
     def native_value(self):
-        """Return number of open parks."""
-        return self.coordinator.data["report"]["currentConditions"]["resortwide"]["@numParksOpen"]
+        """Return the current skier wait, or None while the lift is closed."""
+        lift = self.coordinator.data.lifts.get(self._key)
+        if lift is None or not lift.is_open:
+            return None
+        return parse_wait(lift.skier_wait_time)
 
     @property
     def extra_state_attributes(self):
-        """Return park details."""
-        parks_data = {}
-        areas = self.coordinator.data["report"]["facilities"]["areas"]["area"]
-        if isinstance(areas, list):
-            for area in areas:
-                if "freestyleTerrain" in area and "parks" in area["freestyleTerrain"]:
-                    parks = area["freestyleTerrain"]["parks"]["park"]
-                    if isinstance(parks, list):
-                        for park in parks:
-                            parks_data[park["@name"]] = {
-                                "status": park["@status"],
-                                "difficulty": park["@difficulty"],
-                                "groomed": park.get("@groomedOrCut", "")
-                            }
-                    else:
-                        parks_data[parks["@name"]] = {
-                            "status": parks["@status"],
-                            "difficulty": parks["@difficulty"],
-                            "groomed": parks.get("@groomedOrCut", "")
-                        }
-        return parks_data
-
-class BigSkyTrailsByDifficultySensor(CoordinatorEntity, SensorEntity):
-    """Trails by difficulty sensor."""
-    def __init__(self, coordinator):
-        super().__init__(coordinator)
-        self._attr_name = "Big Sky Trails by Difficulty"
-        self._attr_unique_id = "big_sky_trails_by_difficulty"
-        self._attr_icon = "mdi:ski"
+        """Return rolling statistics and the predicted wait."""
+        waits = self.coordinator.waits
+        attributes = {}
+        if (series := waits.get(self._key, WAIT_SKIER)) is not None:
+            attributes.update(series.as_dict())
+        if (scenic := waits.get(self._key, WAIT_SCENIC)) is not None:
+            attributes["scenic_wait"] = scenic.last
+            attributes.update(
+                {f"scenic_{name}": value for name, value in scenic.as_dict().items()}
+            )
+        return attributes
+
+class BigSkyLiftWaitPredictionSensor(CoordinatorEntity, SensorEntity):
+    """Skier wait of one lift predicted ``PREDICTION_HORIZON`` minutes ahead."""
+
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator, lift_name, area_name):
+        super().__init__(
+            coordinator,
+            item_context(SECTION_LIFT, area_name, lift_name)
+            | item_context(SECTION_WAIT, area_name, lift_name),
+        )
+        self._key = (area_name, lift_name)
+        self._attr_name = f"{lift_name} Predicted Wait"
+        self._attr_unique_id = coordinator.item_unique_id(
+            "lift_wait_predicted", area_name, lift_name
+        )
+        self._attr_device_info = coordinator.device_info
+        self._attr_icon = "mdi:chart-timeline-variant"
+        self._attr_device_class = SensorDeviceClass.DURATION
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_native_unit_of_measurement = UnitOfTime.MINUTES
 
     @property
     def native_value(self):
-        """Return total open trails."""
-        return self.coordinator.data["report"]["currentConditions"]["resortwide"]["@numTrailsOpen"]
+        """Return the predicted skier wait, or None while the lift is closed."""
+        lift = self.coordinator.data.lifts.get(self._key)
+        series = self.coordinator.waits.get(self._key, WAIT_SKIER)
+        if lift is None or not lift.is_open or series is None:
+            return None
+        if (predicted := series.predict()) is None:
+            return None
+        return round(predicted, 1)
 
     @property
     def extra_state_attributes(self):
-        """Return trail counts by difficulty."""
-        difficulties = {
-            "beginner": {"open": 0, "total": 0},
-            "intermediate": {"open": 0, "total": 0},
-            "advanced": {"open": 0, "total": 0},
-            "expert": {"open": 0, "total": 0},
-            "high_exposure": {"open": 0, "total": 0}
+        """Return the horizon and the trend the prediction follows."""
+        series = self.coordinator.waits.get(self._key, WAIT_SKIER)
+        return {
+            "horizon_minutes": PREDICTION_HORIZON,
+            "trend_per_hour": round(series.trend * 60, 1) if series is not None else None,
         }
-        
-        areas = self.coordinator.data["report"]["facilities"]["areas"]["area"]
-        if isinstance(areas, list):
-            for area in areas:
-                if "trails" in area:
-                    trails = area["trails"]["trail"]
-                    if isinstance(trails, list):
-                        for trail in trails:
-                            diff = trail["@difficulty"].lower().replace(" ", "_")
-                            if diff in difficulties:
-                                difficulties[diff]["total"] += 1
-                                if trail["@status"].lower() == "open":
-                                    difficulties[diff]["open"] += 1
-        return difficulties
+
+class BigSkyParkingFillSensor(CoordinatorEntity, SensorEntity):
+    """Predicted time until one parking lot is full, from its fill rate."""
+
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator, lot_name):
+        # The fit moves with every sample, not only when the lot changes.
+        super().__init__(
+            coordinator,
+            item_context(SECTION_PARKING, lot_name) | item_context(SECTION_FILL, lot_name),
+        )
+        self._lot_name = lot_name
+        self._attr_name = f"{lot_name} Time to Full"
+        # Lots are listed for the whole resort, so the name is the full key.
+        self._attr_unique_id = coordinator.item_unique_id("parking_fill", lot_name)
+        self._attr_device_info = coordinator.device_info
+        self._attr_icon = "mdi:car-clock"
+        self._attr_device_class = SensorDeviceClass.DURATION
+        self._attr_native_unit_of_measurement = UnitOfTime.MINUTES
+
+    @property
+    def native_value(self):
+        """Return the minutes until full, or None while the lot is not filling."""
+        series = self.coordinator.parking.get(self._lot_name)
+        if series is None or (minutes := series.minutes_to_full()) is None:
+            return None
+        return round(minutes, 1)
+
+    @property
+    def extra_state_attributes(self):
+        """Return the fill rate and the predicted time the lot fills."""
+        series = self.coordinator.parking.get(self._lot_name)
+        return series.as_dict() if series is not None else {}
 
 class BigSkyTramSensor(CoordinatorEntity, SensorEntity):
     """Lone Peak Tram sensor."""
+
+    _attr_has_entity_name = True
+    _unrecorded_attributes = frozenset({"serviced_trails"})
+
     def __init__(self, coordinator):
-        super().__init__(coordinator)
-        self._attr_name = "Big Sky Tram"
-        self._attr_unique_id = "big_sky_tram"
+        super().__init__(coordinator, section_context(SECTION_LIFT, SECTION_TRAIL))
+        self._attr_name = "Tram"
+        self._attr_unique_id = coordinator.entity_unique_id("tram")
+        self._attr_device_info = coordinator.device_info
         self._attr_icon = "mdi:ski-lift"
 
     @property
     def native_value(self):
         """Return tram status."""
-        areas = self.coordinator.data["report"]["facilities"]["areas"]["area"]
-        if isinstance(areas, list):
-            for area in areas:
-                if area["@name"] == "Lone Peak Area":
-                    if "lifts" in area:
-                        tram = area["lifts"]["lift"]
-                        return tram["@status"]
-        return "Unknown"
+        tram = self.coordinator.rollups.tram
+        return tram.status if tram else "Unknown"
 
     @property
     def extra_state_attributes(self):
         """Return tram details."""
-        tram_data = {}
-        areas = self.coordinator.data["report"]["facilities"]["areas"]["area"]
-        if isinstance(areas, list):
-            for area in areas:
-                if area["@name"] == "Lone Peak Area":
-                    if "lifts" in area:
-                        tram = area["lifts"]["lift"]
-                        tram_data.update({
-                            "capacity": tram["@capacity"],
-                            "type": tram["@type"],
-                            "status_detail": tram["@statusDetail"],
-                            "open_time": tram["@openTime"],
-                            "close_time": tram["@closeTime"],
-                            "skier_wait_time": tram.get("@skierWaitTime", ""),
-                            "scenic_wait_time": tram.get("@scenicWaitTime", ""),
-                            "serviced_trails": self._get_serviced_trails(area)
-                        })
-        return tram_data
-
-    def _get_serviced_trails(self, area):
-        """Get trails serviced by tram."""
-        serviced_trails = []
-        if "trails" in area:
-            trails = area["trails"]["trail"]
-            if isinstance(trails, list):
-                for trail in trails:
-                    serviced_trails.append({
-                        "name": trail["@name"],
-                        "status": trail["@status"],
-                        "difficulty": trail["@difficulty"],
-                        "groomed": trail.get("@groomed", "")
-                    })
-        return serviced_trails
-
-class BigSkyParkingSensor(CoordinatorEntity, SensorEntity):
-   """Parking status sensor."""
-   def __init__(self, coordinator):
-       super().__init__(coordinator)
-       self._attr_name = "Big Sky Parking"
-       self._attr_unique_id = "big_sky_parking"
-       self._attr_icon = "mdi:parking"
+        rollups = self.coordinator.rollups
+        tram = rollups.tram
+        if tram is None:
+            return {}
+        attributes = {
+            "capacity": tram.capacity,
+            "type": tram.type,
+            "status_detail": tram.status_detail,
+            "open_time": tram.open_time,
+            "close_time": tram.close_time,
+            "skier_wait_time": tram.skier_wait_time,
+            "scenic_wait_time": tram.scenic_wait_time,
+        }
+        if self.coordinator.slim_attributes:
+            area = rollups.areas.get(tram.area)
+            attributes["serviced_trails_open"] = area.trails["open"] if area else 0
+            attributes["serviced_trails_total"] = area.trails["total"] if area else 0
+        else:
+            attributes["serviced_trails"] = rollups.tram_trails
+        return attributes
 
-   @property
-   def native_value(self):
-       """Return number of open lots."""
-       lots = self.coordinator.data["report"]["facilities"]["parking"]["lot"]
-       return len([lot for lot in lots if lot["@status"] == "open"]) if isinstance(lots, list) else 0
+class BigSkyMetricSensor(CoordinatorEntity, SensorEntity):
+   """Runtime metric diagnostic sensor, disabled by default."""
 
-   @property
-   def extra_state_attributes(self):
-       """Return lot details."""
-       lots = self.coordinator.data["report"]["facilities"]["parking"]["lot"]
-       return {lot["@name"]: {
-           "status": lot["@status"],
-           "percent_full": lot["@percentFull"],
-           "open_time": lot["@openTime"],
-           "closed_time": lot["@closedTime"],
-           "alert": lot["@alert"]
-       } for lot in lots} if isinstance(lots, list) else {}
-
-class BigSkyShuttleSensor(CoordinatorEntity, SensorEntity):
-   """Shuttle status sensor."""
-   def __init__(self, coordinator):
-       super().__init__(coordinator)
-       self._attr_name = "Big Sky Shuttle"
-       self._attr_unique_id = "big_sky_shuttle"
-       self._attr_icon = "mdi:bus"
+   _attr_has_entity_name = True
 
-   @property
-   def native_value(self):
-       """Return shuttle status."""
-       return self.coordinator.data["report"]["facilities"]["shuttles"]["line"]["@status"]
+   def __init__(self, coordinator, metric, name, unit, device_class, scale, icon):
+       super().__init__(coordinator, section_context(SECTION_METRICS))
+       self._metric = metric
+       self._scale = scale
+       self._attr_name = name
+       self._attr_unique_id = coordinator.entity_unique_id(metric)
+       self._attr_device_info = coordinator.device_info
+       self._attr_icon = icon
+       self._attr_entity_category = EntityCategory.DIAGNOSTIC
+       self._attr_entity_registry_enabled_default = False
+       self._attr_device_class = device_class
+       self._attr_native_unit_of_measurement = unit
+       self._attr_state_class = SensorStateClass.MEASUREMENT
 
-   @property
-   def extra_state_attributes(self):
-       """Return shuttle details."""
-       shuttle = self.coordinator.data["report"]["facilities"]["shuttles"]["line"]
-       return {
-           "number_running": shuttle["@numberRunning"],
-           "open_time": shuttle["@openTime"],
-           "closed_time": shuttle["@closedTime"],
-           "comment": shuttle["@comment"],
-           "alert": shuttle["@alert"]
-       }
-
-class BigSkyCurrentWeatherSensor(CoordinatorEntity, SensorEntity):
-   """Current weather sensor."""
-   def __init__(self, coordinator):
-       super().__init__(coordinator)
-       self._attr_name = "Big Sky Current Weather"
-       self._attr_unique_id = "big_sky_current_weather"
-       self._attr_icon = "mdi:weather-partly-cloudy"
-       self._attr_device_class = SensorDeviceClass.TEMPERATURE
-       self._attr_native_unit_of_measurement = UnitOfTemperature.FAHRENHEIT
+   def _scaled(self, value):
+       return None if value is None else round(value * self._scale, 3)
 
    @property
    def native_value(self):
-       """Return current temperature."""
-       try:
-           return float(self.coordinator.data["report"]["forecast"]["day"][0]["@high"])
-       except (KeyError, IndexError, ValueError):
-           return None
+       """Return the metric of the latest refresh."""
+       return self._scaled(self.coordinator.metrics.stats[self._metric].last)
 
    @property
    def extra_state_attributes(self):
-       """Return weather details."""
-       try:
-           current = self.coordinator.data["report"]["forecast"]["day"][0]
-           return {
-               "condition": current["@weather"],
-               "high": current["@high"],
-               "low": current["@low"],
-               "details": current.get("#text", "")
-           }
-       except (KeyError, IndexError):
-           return {}
\ No newline at end of file
+       """Return rolling percentiles of the metric."""
+       stat = self.coordinator.metrics.stats[self._metric]
+       return {
+           **{name: self._scaled(value) for name, value in stat.percentiles().items()},
+           "samples": stat.count,
+       }
\ No newline at end of file
@@ -0,0 +1,248 @@
+"""Services for the Big Sky Resort integration."""
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .diff import SECTION_LIFT, SECTION_PARK, SECTION_TRAIL, section_records
+from .search import (
+    FIELD_AREA,
+    FIELD_DIFFICULTY,
+    FIELD_GROOMED,
+    FIELD_OPEN,
+    FIELD_SECTION,
+    FIELD_STATUS,
+    FIELD_UPHILL,
+)
+
+SERVICE_HISTORY = "history"
+SERVICE_DETAILS = "details"
+SERVICE_LOOKUP = "lookup"
+SERVICE_SEARCH = "search"
+
+ATTR_ENTRY_ID = "entry_id"
+ATTR_SECTION = "section"
+ATTR_AREA = "area"
+ATTR_NAMES = "names"
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_KIND = "kind"
+ATTR_QUERY = "query"
+ATTR_LIMIT = "limit"
+
+SEARCH_FILTERS = (
+    FIELD_SECTION,
+    FIELD_AREA,
+    FIELD_DIFFICULTY,
+    FIELD_GROOMED,
+    FIELD_UPHILL,
+    FIELD_STATUS,
+    FIELD_OPEN,
+)
+
+DETAIL_TRAM = "tram"
+DETAIL_PARKS = "parks"
+DETAIL_PARKING = "parking"
+DETAIL_AREAS = "areas"
+DETAIL_KINDS = [DETAIL_TRAM, DETAIL_PARKS, DETAIL_PARKING, DETAIL_AREAS]
+
+DEFAULT_HISTORY_SPAN = timedelta(days=7)
+
+HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_SECTION, default=SECTION_LIFT): vol.In(
+            [SECTION_LIFT, SECTION_TRAIL, SECTION_PARK]
+        ),
+        vol.Optional(ATTR_AREA): cv.string,
+        vol.Optional(ATTR_NAMES): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+    }
+)
+
+LOOKUP_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_SECTION, default=SECTION_LIFT): vol.In(
+            [SECTION_LIFT, SECTION_TRAIL, SECTION_PARK]
+        ),
+        vol.Optional(ATTR_AREA): cv.string,
+        vol.Optional(ATTR_NAMES): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+SEARCH_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_QUERY): cv.string,
+        vol.Optional(FIELD_SECTION): vol.In([SECTION_LIFT, SECTION_TRAIL, SECTION_PARK]),
+        vol.Optional(FIELD_AREA): cv.string,
+        vol.Optional(FIELD_DIFFICULTY): cv.string,
+        vol.Optional(FIELD_GROOMED): cv.boolean,
+        vol.Optional(FIELD_UPHILL): cv.boolean,
+        vol.Optional(FIELD_STATUS): cv.string,
+        vol.Optional(FIELD_OPEN): cv.boolean,
+        vol.Optional(ATTR_LIMIT, default=20): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    }
+)
+
+DETAILS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+        vol.Required(ATTR_KIND): vol.In(DETAIL_KINDS),
+    }
+)
+
+
+def snapshot_details(coordinator: Any, kind: str) -> dict[str, Any]:
+    """Return the nested detail data that slim attributes leave out."""
+    rollups = coordinator.rollups
+    if kind == DETAIL_TRAM:
+        if rollups.tram is None:
+            return {}
+        return {**rollups.tram.as_dict(), "serviced_trails": rollups.tram_trails}
+    if kind == DETAIL_PARKS:
+        return rollups.parks_detail
+    if kind == DETAIL_PARKING:
+        return rollups.parking_detail
+    return {name: area.as_dict() for name, area in rollups.areas.items()}
+
+
+def lookup_items(
+    entry_data: dict[str, Any],
+    section: str,
+    area: str | None,
+    names: list[str] | None,
+) -> list[dict[str, Any]]:
+    """Return the current record and resort map position of matching items."""
+    resort_map = entry_data["resort_map"]
+    wanted = set(names) if names else None
+    return [
+        {
+            **record.as_dict(),
+            "is_open": record.is_open,
+            "position": resort_map.position(section, item_area, name),
+        }
+        for (item_area, name), record in section_records(
+            entry_data["coordinator"].data, section
+        ).items()
+        if (area is None or item_area == area) and (wanted is None or name in wanted)
+    ]
+
+
+def loaded_entries(hass: HomeAssistant, entry_id: str | None) -> dict[str, dict]:
+    """Return the loaded entries a service call or command targets."""
+    loaded = hass.data.get(DOMAIN, {})
+    if entry_id is None:
+        return loaded
+    if entry_id not in loaded:
+        raise HomeAssistantError(f"Big Sky Resort entry {entry_id} is not loaded")
+    return {entry_id: loaded[entry_id]}
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services."""
+
+    async def async_history(call: ServiceCall) -> ServiceResponse:
+        """Return status timelines and uptime of lifts, trails or parks."""
+        end = dt_util.as_utc(call.data.get(ATTR_END) or dt_util.utcnow())
+        start = dt_util.as_utc(call.data.get(ATTR_START) or end - DEFAULT_HISTORY_SPAN)
+        if start >= end:
+            raise HomeAssistantError("start must be before end")
+        resorts = {}
+        entries = loaded_entries(hass, call.data.get(ATTR_ENTRY_ID))
+        for entry_id, entry_data in entries.items():
+            resorts[entry_id] = await entry_data["history"].async_query(
+                call.data[ATTR_SECTION],
+                call.data.get(ATTR_AREA),
+                call.data.get(ATTR_NAMES),
+                start,
+                end,
+            )
+        return {"start": start.isoformat(), "end": end.isoformat(), "resorts": resorts}
+
+    async def async_details(call: ServiceCall) -> ServiceResponse:
+        """Return detail data of the cached snapshot of each resort."""
+        return {
+            "resorts": {
+                entry_id: snapshot_details(entry_data["coordinator"], call.data[ATTR_KIND])
+                for entry_id, entry_data in loaded_entries(
+                    hass, call.data.get(ATTR_ENTRY_ID)
+                ).items()
+            }
+        }
+
+    async def async_lookup(call: ServiceCall) -> ServiceResponse:
+        """Return the status of individual lifts, trails or parks."""
+        return {
+            "resorts": {
+                entry_id: lookup_items(
+                    entry_data,
+                    call.data[ATTR_SECTION],
+                    call.data.get(ATTR_AREA),
+                    call.data.get(ATTR_NAMES),
+                )
+                for entry_id, entry_data in loaded_entries(
+                    hass, call.data.get(ATTR_ENTRY_ID)
+                ).items()
+            }
+        }
+
+    async def async_search(call: ServiceCall) -> ServiceResponse:
+        """Return lifts, trails or parks matching a name and filters."""
+        filters = {
+            field: call.data[field] for field in SEARCH_FILTERS if field in call.data
+        }
+        return {
+            "resorts": {
+                entry_id: entry_data["search"].search(
+                    call.data.get(ATTR_QUERY), filters, call.data[ATTR_LIMIT]
+                )
+                for entry_id, entry_data in loaded_entries(
+                    hass, call.data.get(ATTR_ENTRY_ID)
+                ).items()
+            }
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DETAILS,
+        async_details,
+        schema=DETAILS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_HISTORY,
+        async_history,
+        schema=HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_LOOKUP,
+        async_lookup,
+        schema=LOOKUP_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SEARCH,
+        async_search,
+        schema=SEARCH_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -0,0 +1,166 @@
+"""Feed cache shared by Home Assistant instances on the same host."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import timedelta
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .api import FeedResponse
+
+try:
+    import fcntl
+except ImportError:  # Not POSIX; the cache is then never used.
+    fcntl = None
+
+LOGGER = logging.getLogger(__name__)
+
+# Seconds to wait for another instance's fetch before fetching anyway. Long
+# enough to cover a fetch with all its retries.
+LOCK_TIMEOUT = 60.0
+LOCK_POLL = 0.25
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, "wb") as file:
+        file.write(data)
+    os.replace(tmp_path, path)
+
+
+class SharedFeedCache:
+    """File-locked on-disk cache of one feed URL.
+
+    Instances that share ``directory`` take an exclusive ``flock`` on the
+    feed's lock file, then either read a body younger than their poll
+    interval or fetch it themselves and write it back before releasing the
+    lock. Only one instance fetches per interval; the others wait for it
+    and read its bytes. The metadata file keeps the fetch time and the
+    body's validators and digest, so readers whose snapshot is already up to
+    date skip parsing. File errors are logged and never fail a refresh; the
+    instance then just fetches on its own.
+    """
+
+    def __init__(self, hass: HomeAssistant, directory: str, feed_url: str) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self.directory = directory
+        self.feed_url = feed_url
+        key = hashlib.sha256(feed_url.encode()).hexdigest()[:16]
+        base = os.path.join(directory, key)
+        self._body_path = f"{base}.xml"
+        self._meta_path = f"{base}.json"
+        self._lock_path = f"{base}.lock"
+        self._lock_fd: int | None = None
+        self._unavailable = False
+
+    def _open_lock(self) -> int:
+        os.makedirs(self.directory, exist_ok=True)
+        return os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+
+    @asynccontextmanager
+    async def async_lock(self) -> AsyncIterator[bool]:
+        """Hold the feed's lock, yielding False if it could not be taken."""
+        if fcntl is None:
+            if not self._unavailable:
+                LOGGER.warning("Shared feed cache needs file locking, which this host lacks")
+                self._unavailable = True
+            yield False
+            return
+        if self._lock_fd is None:
+            try:
+                self._lock_fd = await self._hass.async_add_executor_job(self._open_lock)
+            except OSError as err:
+                LOGGER.warning("Shared feed cache unavailable: %s", err)
+                yield False
+                return
+        deadline = time.monotonic() + LOCK_TIMEOUT
+        while True:
+            try:
+                fcntl.flock(self._lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    LOGGER.debug("Timed out waiting for %s, fetching anyway", self._lock_path)
+                    yield False
+                    return
+                await asyncio.sleep(LOCK_POLL)
+        try:
+            yield True
+        finally:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    def _read(self, max_age: float) -> FeedResponse | None:
+        try:
+            with open(self._meta_path, encoding="utf-8") as file:
+                meta = json.load(file)
+            if meta["url"] != self.feed_url or time.time() - meta["fetched_at"] > max_age:
+                return None
+            with open(self._body_path, "rb") as file:
+                body = file.read()
+            digest = bytes.fromhex(meta["digest"])
+        except FileNotFoundError:
+            return None
+        except (OSError, KeyError, TypeError, ValueError) as err:
+            LOGGER.debug("Ignoring unreadable shared cache entry: %s", err)
+            return None
+        if hashlib.sha256(body).digest() != digest:
+            return None
+        return FeedResponse(body, meta.get("etag"), meta.get("last_modified"), digest)
+
+    async def async_read(self, max_age: timedelta) -> FeedResponse | None:
+        """Return the cached body if it was fetched within ``max_age``."""
+        return await self._hass.async_add_executor_job(
+            self._read, max_age.total_seconds()
+        )
+
+    def _meta(self, response: FeedResponse) -> dict[str, Any]:
+        return {
+            "url": self.feed_url,
+            "fetched_at": time.time(),
+            "etag": response.etag,
+            "last_modified": response.last_modified,
+            "digest": response.digest.hex(),
+        }
+
+    def _write(self, response: FeedResponse) -> None:
+        _write_atomic(self._body_path, response.body)
+        _write_atomic(self._meta_path, json.dumps(self._meta(response)).encode())
+
+    def _touch(self, digest: bytes) -> None:
+        try:
+            with open(self._meta_path, encoding="utf-8") as file:
+                meta = json.load(file)
+        except (FileNotFoundError, ValueError):
+            return
+        if meta.get("digest") == digest.hex():
+            meta["fetched_at"] = time.time()
+            _write_atomic(self._meta_path, json.dumps(meta).encode())
+
+    async def async_write(self, response: FeedResponse) -> None:
+        """Publish a freshly fetched body."""
+        try:
+            await self._hass.async_add_executor_job(self._write, response)
+        except OSError as err:
+            LOGGER.warning("Could not write the shared feed cache: %s", err)
+
+    async def async_touch(self, digest: bytes) -> None:
+        """Mark the cached body fresh after the server reported it unchanged."""
+        try:
+            await self._hass.async_add_executor_job(self._touch, digest)
+        except OSError as err:
+            LOGGER.warning("Could not write the shared feed cache: %s", err)
+
+    def close(self) -> None:
+        """Close the lock file."""
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = None
@@ -0,0 +1,121 @@
+"""On-disk cache of the last good Big Sky Resort snapshot."""
+from __future__ import annotations
+
+from datetime import datetime
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .model import (
+    Area,
+    ForecastDay,
+    Lift,
+    Park,
+    ParkingLot,
+    Resort,
+    ShuttleLine,
+    Snapshot,
+    Trail,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 30
+
+_AREA_ITEM = ("area",)
+
+
+def _row(record: Any, skip: tuple[str, ...] = ()) -> list[Any]:
+    """Return a record's values in slot order, dropping ``skip`` slots."""
+    return [getattr(record, name) for name in record.__slots__ if name not in skip]
+
+
+def _record(cls: type, row: list[Any], **extra: Any) -> Any:
+    """Rebuild a record from a row written by ``_row``."""
+    names = [name for name in cls.__slots__ if name not in extra]
+    if len(names) != len(row):
+        raise ValueError(f"Cached {cls.__name__} has {len(row)} fields")
+    return cls(**dict(zip(names, row)), **extra)
+
+
+def serialize_snapshot(snapshot: Snapshot, fetched_at: datetime) -> dict[str, Any]:
+    """Encode a snapshot as compact, JSON friendly rows."""
+    return {
+        "fetched_at": fetched_at.isoformat(),
+        "resort": _row(snapshot.resort),
+        "areas": [
+            [
+                area.name,
+                [_row(lift, _AREA_ITEM) for lift in area.lifts],
+                [_row(trail, _AREA_ITEM) for trail in area.trails],
+                [_row(park, _AREA_ITEM) for park in area.parks],
+            ]
+            for area in snapshot.areas.values()
+        ],
+        "parking_lots": [_row(lot) for lot in snapshot.parking_lots.values()],
+        "shuttles": [_row(line) for line in snapshot.shuttles],
+        "forecast": [_row(day) for day in snapshot.forecast],
+        "updated": snapshot.updated,
+    }
+
+
+def deserialize_snapshot(data: dict[str, Any]) -> tuple[Snapshot, datetime]:
+    """Decode rows written by ``serialize_snapshot``."""
+    areas = {}
+    for name, lifts, trails, parks in data["areas"]:
+        areas[name] = Area(
+            name=name,
+            lifts=tuple(_record(Lift, row, area=name) for row in lifts),
+            trails=tuple(_record(Trail, row, area=name) for row in trails),
+            parks=tuple(_record(Park, row, area=name) for row in parks),
+        )
+    parking_lots = {}
+    for row in data["parking_lots"]:
+        lot = _record(ParkingLot, row)
+        parking_lots[lot.name] = lot
+    snapshot = Snapshot(
+        _record(Resort, data["resort"]),
+        areas,
+        parking_lots,
+        tuple(_record(ShuttleLine, row) for row in data["shuttles"]),
+        tuple(_record(ForecastDay, row) for row in data["forecast"]),
+        data.get("updated"),
+    )
+    fetched_at = dt_util.parse_datetime(data["fetched_at"]) or dt_util.utcnow()
+    return snapshot, fetched_at
+
+
+class SnapshotStore:
+    """Persist the last good snapshot of a config entry."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.snapshot.{entry_id}"
+        )
+
+    async def async_load(self) -> tuple[Snapshot, datetime] | None:
+        """Return the cached snapshot and when it was fetched, if any."""
+        if (data := await self._store.async_load()) is None:
+            return None
+        try:
+            return deserialize_snapshot(data)
+        except (KeyError, TypeError, ValueError) as err:
+            LOGGER.warning("Ignoring unreadable cached snapshot: %s", err)
+            return None
+
+    @callback
+    def async_save(self, snapshot: Snapshot, fetched_at: datetime) -> None:
+        """Schedule writing the snapshot, coalescing bursts of refreshes."""
+        self._store.async_delay_save(
+            lambda: serialize_snapshot(snapshot, fetched_at), SAVE_DELAY
+        )
+
+    async def async_remove(self) -> None:
+        """Delete the cached snapshot."""
+        await self._store.async_remove()
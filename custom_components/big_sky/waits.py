@@ -0,0 +1,172 @@
+"""Rolling statistics and short-horizon prediction of lift wait times."""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Hashable, Mapping
+from datetime import datetime
+import math
+import re
+from typing import Any
+
+from .diff import SECTION_WAIT
+from .model import Lift, Snapshot
+
+# Samples kept per lift; two hours of refreshes at a 1 minute interval.
+WAIT_WINDOW = 120
+# Waits are whole minutes; longer ones are counted in the top bucket.
+MAX_WAIT = 240
+# Time constants in minutes of the smoothed level and trend.
+LEVEL_TAU = 10.0
+TREND_TAU = 30.0
+# A gap this long (minutes), such as overnight, restarts level and trend.
+RESET_GAP = 60.0
+PREDICTION_HORIZON = 30
+
+WAIT_SKIER = "skier"
+WAIT_SCENIC = "scenic"
+
+_MINUTES = re.compile(r"\d+")
+
+
+def parse_wait(value: str | None) -> int | None:
+    """Return the minutes of a feed wait time such as ``15`` or ``5 min``."""
+    if not value or (match := _MINUTES.search(value)) is None:
+        return None
+    return min(int(match.group()), MAX_WAIT)
+
+
+class WaitSeries:
+    """Wait times of one lift queue over the last ``WAIT_WINDOW`` samples.
+
+    Every statistic is kept incrementally: the mean from a running sum, the
+    90th percentile from a histogram of whole minutes and the trend from
+    Holt's double exponential smoothing with time-based weights, so adding
+    a sample never rescans the window and irregular poll intervals weigh
+    samples by the time between them.
+    """
+
+    __slots__ = ("_samples", "_histogram", "_sum", "last", "level", "trend", "_last_time")
+
+    def __init__(self) -> None:
+        """Initialize an empty series."""
+        self._samples: deque[int] = deque(maxlen=WAIT_WINDOW)
+        self._histogram = [0] * (MAX_WAIT + 1)
+        self._sum = 0
+        self.last: int | None = None
+        self.level: float | None = None
+        self.trend = 0.0
+        self._last_time: datetime | None = None
+
+    def add(self, minutes: int, now: datetime) -> None:
+        """Record a sample taken at ``now``."""
+        if len(self._samples) == WAIT_WINDOW:
+            evicted = self._samples[0]
+            self._sum -= evicted
+            self._histogram[evicted] -= 1
+        self._samples.append(minutes)
+        self._sum += minutes
+        self._histogram[minutes] += 1
+        self.last = minutes
+
+        elapsed = (
+            (now - self._last_time).total_seconds() / 60 if self._last_time else None
+        )
+        self._last_time = now
+        if self.level is None or elapsed is None or elapsed > RESET_GAP:
+            self.level = float(minutes)
+            self.trend = 0.0
+            return
+        if elapsed <= 0:
+            return
+        alpha = 1 - math.exp(-elapsed / LEVEL_TAU)
+        beta = 1 - math.exp(-elapsed / TREND_TAU)
+        level = alpha * minutes + (1 - alpha) * (self.level + self.trend * elapsed)
+        self.trend = beta * (level - self.level) / elapsed + (1 - beta) * self.trend
+        self.level = level
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean wait of the window."""
+        return self._sum / len(self._samples) if self._samples else None
+
+    @property
+    def p90(self) -> int | None:
+        """Return the 90th percentile wait of the window."""
+        if not self._samples:
+            return None
+        rank = math.ceil(0.9 * len(self._samples))
+        seen = 0
+        for minutes, count in enumerate(self._histogram):
+            seen += count
+            if seen >= rank:
+                return minutes
+        return MAX_WAIT
+
+    def predict(self, minutes_ahead: float = PREDICTION_HORIZON) -> float | None:
+        """Return the wait extrapolated ``minutes_ahead`` along the trend."""
+        if self.level is None:
+            return None
+        return max(0.0, self.level + self.trend * minutes_ahead)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as state attributes."""
+        mean = self.mean
+        predicted = self.predict()
+        return {
+            "mean": round(mean, 1) if mean is not None else None,
+            "p90": self.p90,
+            "trend_per_hour": round(self.trend * 60, 1),
+            f"predicted_wait_{PREDICTION_HORIZON}m": (
+                round(predicted, 1) if predicted is not None else None
+            ),
+            "samples": len(self._samples),
+        }
+
+
+class WaitTracker:
+    """Wait time series of every lift queue that reports one.
+
+    Fed once per successful refresh, including unchanged feeds, with the
+    waits of open lifts; the cost is constant per reporting lift.
+    """
+
+    def __init__(self) -> None:
+        """Initialize without series."""
+        self.series: dict[tuple[Hashable, str], WaitSeries] = {}
+
+    def add_snapshot(self, snapshot: Snapshot, now: datetime) -> set[Hashable]:
+        """Record the current waits of the open lifts of ``snapshot``.
+
+        Return the ``(SECTION_WAIT, area, name)`` contexts of the lifts that
+        took a sample.
+        """
+        sampled: set[Hashable] = set()
+        for key, lift in snapshot.lifts.items():
+            if not lift.is_open:
+                continue
+            for kind, value in (
+                (WAIT_SKIER, lift.skier_wait_time),
+                (WAIT_SCENIC, lift.scenic_wait_time),
+            ):
+                if (minutes := parse_wait(value)) is None:
+                    continue
+                if (series := self.series.get((key, kind))) is None:
+                    series = self.series[(key, kind)] = WaitSeries()
+                series.add(minutes, now)
+                sampled.add((SECTION_WAIT, *key))
+        return sampled
+
+    def get(self, key: Hashable, kind: str) -> WaitSeries | None:
+        """Return the series of a lift queue, if it reported a wait."""
+        return self.series.get((key, kind))
+
+    def index(self, snapshot: Snapshot) -> Mapping[Hashable, Lift]:
+        """Return the lifts of ``snapshot`` that have or report a wait time."""
+        return {
+            key: lift
+            for key, lift in snapshot.lifts.items()
+            if (key, WAIT_SKIER) in self.series
+            or (key, WAIT_SCENIC) in self.series
+            or parse_wait(lift.skier_wait_time) is not None
+            or parse_wait(lift.scenic_wait_time) is not None
+        }
@@ -7,29 +7,13 @@ from homeassistant.components.weather import (
    Forecast,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.const import UnitOfTemperature
 
 from .const import DOMAIN
-
-WEATHER_ICONS = {
-   "Sunny": "sunny",
-   "Mostly Sunny": "partlycloudy",
-   "Partly Sunny": "partlycloudy", 
-   "Mostly Cloudy": "cloudy",
-   "Cloudy": "cloudy",
-   "Rain": "rainy",
-   "Snow": "snowy",
-   "Rain Showers": "rainy",
-   "Snow Showers": "snowy",
-   "Partly Cloudy": "partlycloudy",
-   "Clear": "clear-night",
-   "Chance Rain Showers": "rainy",
-   "Chance Snow Showers": "snowy",
-   "Slight Chance Rain Showers": "rainy",
-}
+from .diff import SECTION_FORECAST, section_context
 
 async def async_setup_entry(
    hass: HomeAssistant,
@@ -38,35 +22,32 @@ async def async_setup_entry(
 ) -> None:
    """Set up Big Sky weather platform."""
    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
-   async_add_entities([BigSkyWeather(coordinator)], True)
+   async_add_entities([BigSkyWeather(coordinator)])
 
 class BigSkyWeather(CoordinatorEntity, WeatherEntity):
    """Big Sky weather implementation."""
 
+   _attr_has_entity_name = True
+
    def __init__(self, coordinator):
        """Initialize weather entity."""
-       super().__init__(coordinator)
-       self._attr_name = "Big Sky Weather"
-       self._attr_unique_id = "big_sky_weather"
+       super().__init__(coordinator, section_context(SECTION_FORECAST))
+       self._attr_name = None
+       self._attr_unique_id = coordinator.entity_unique_id("weather")
+       self._attr_device_info = coordinator.device_info
        self._attr_native_temperature_unit = UnitOfTemperature.FAHRENHEIT
        self._attr_supported_features = WeatherEntityFeature.FORECAST_DAILY
 
    @property
    def condition(self):
        """Return current condition."""
-       try:
-           condition = self.coordinator.data["report"]["forecast"]["day"][0]["@weather"]
-           return WEATHER_ICONS.get(condition, "exceptional")
-       except (KeyError, IndexError):
-           return None
+       return self.coordinator.forecast.condition
 
    @property
    def native_temperature(self):
        """Return current temperature."""
-       try:
-           return float(self.coordinator.data["report"]["forecast"]["day"][0]["@high"])
-       except (KeyError, IndexError, ValueError):
-           return None
+       current = self.coordinator.forecast.current
+       return current.high if current else None
 
    @property
    def native_precipitation_unit(self) -> str:
@@ -74,19 +55,16 @@ class BigSkyWeather(CoordinatorEntity, WeatherEntity):
        return "in"
 
    @property
-   def forecast(self) -> list[Forecast] | None:
-       """Return forecast array."""
-       try:
-           forecasts = []
-           for day in self.coordinator.data["report"]["forecast"]["day"]:
-               forecast = {
-                   "datetime": day["@name"],
-                   "native_temperature": float(day["@high"]),
-                   "native_templow": float(day["@low"]),
-                   "condition": WEATHER_ICONS.get(day["@weather"], "exceptional"),
-                   "precipitation_probability": None,
-               }
-               forecasts.append(forecast)
-           return forecasts
-       except (KeyError, IndexError, ValueError):
-           return None
\ No newline at end of file
+   def extra_state_attributes(self):
+       """Return forecast snow accumulation in inches by date."""
+       return {"forecast_snowfall_in": self.coordinator.forecast.snowfall}
+
+   async def async_forecast_daily(self) -> list[Forecast] | None:
+       """Return the daily forecast, derived once per snapshot."""
+       return self.coordinator.forecast.daily
+
+   @callback
+   def _handle_coordinator_update(self) -> None:
+       """Write the state and push the new forecast to subscribers."""
+       super()._handle_coordinator_update()
+       self.hass.async_create_task(self.async_update_listeners(("daily",)))
@@ -0,0 +1,49 @@
+"""Websocket commands for the Big Sky Resort integration."""
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import DOMAIN
+from .services import DETAIL_KINDS, loaded_entries, snapshot_details
+
+
+@callback
+def async_setup_websocket_api(hass: HomeAssistant) -> None:
+    """Register the integration's websocket commands."""
+    websocket_api.async_register_command(hass, websocket_details)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/details",
+        vol.Optional("entry_id"): str,
+        vol.Required("kind"): vol.In(DETAIL_KINDS),
+    }
+)
+@callback
+def websocket_details(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Send detail data of the cached snapshot of each resort."""
+    try:
+        entries = loaded_entries(hass, msg.get("entry_id"))
+    except HomeAssistantError as err:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, str(err))
+        return
+    connection.send_result(
+        msg["id"],
+        {
+            "resorts": {
+                entry_id: snapshot_details(entry_data["coordinator"], msg["kind"])
+                for entry_id, entry_data in entries.items()
+            }
+        },
+    )
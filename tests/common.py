@@ -0,0 +1,84 @@
+"""Helpers shared by the Big Sky Resort tests."""
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from datetime import datetime, timedelta
+import os
+from typing import Any
+
+import xmltodict
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.util import dt as dt_util
+
+from big_sky.const import CONF_FEED_URL, DOMAIN
+from big_sky.diff import diff_snapshots
+from big_sky.model import Snapshot, build_snapshot
+from big_sky.parking import ParkingTracker
+
+FEED = os.path.join(os.path.dirname(__file__), "fixtures", "big_sky.xml")
+FEED_URL = "https://feeds.example.com/mtnxml/162"
+NOW = datetime(2026, 1, 10, 17, 0, tzinfo=dt_util.UTC)
+
+
+def load_snapshot(*replacements: tuple[str, str]) -> Snapshot:
+    """Return the sample feed as a snapshot, with text replaced first."""
+    with open(FEED, encoding="utf-8") as file:
+        body = file.read()
+    for old, new in replacements:
+        assert old in body, old
+        body = body.replace(old, new)
+    return build_snapshot(xmltodict.parse(body))
+
+
+def make_entry(version: int = 3, **data: Any) -> ConfigEntry:
+    """Return a Big Sky config entry that is not added to Home Assistant."""
+    return ConfigEntry(
+        version=version,
+        minor_version=1,
+        domain=DOMAIN,
+        title="Big Sky Resort",
+        data={CONF_FEED_URL: FEED_URL, **data},
+        source="user",
+        options={},
+        unique_id="162",
+    )
+
+
+class StubCoordinator:
+    """The parts of the coordinator the per-entry helpers read.
+
+    ``refresh`` replaces the snapshot, diffs it against the previous one
+    and notifies the listeners whose context intersects the changed set,
+    as the real coordinator does after a successful refresh.
+    """
+
+    resort_id = "162"
+
+    def __init__(self, snapshot: Snapshot | None = None) -> None:
+        """Initialize the coordinator with a first snapshot."""
+        self.data = snapshot
+        self.last_changed: set[Hashable] | None = None
+        self.last_fetch: datetime | None = None
+        self.update_interval = timedelta(minutes=15)
+        self.parking = ParkingTracker()
+        self._listeners: list[tuple[Callable[[], None], frozenset | None]] = []
+
+    def async_add_listener(
+        self, update_callback: Callable[[], None], context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for refreshes, like ``DataUpdateCoordinator``."""
+        listener = (update_callback, context)
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def refresh(self, snapshot: Snapshot, now: datetime = NOW) -> None:
+        """Apply a new snapshot and notify the interested listeners."""
+        changed = diff_snapshots(self.data, snapshot)
+        self.data = snapshot
+        self.last_fetch = now
+        self.parking.add_snapshot(snapshot, now)
+        self.last_changed = changed
+        for update_callback, context in list(self._listeners):
+            if changed is None or context is None or not changed.isdisjoint(context):
+                update_callback()
@@ -0,0 +1,47 @@
+"""Fixtures of the Big Sky Resort tests.
+
+Run from the repository root::
+
+    python -m pytest tests
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterator
+import os
+import sys
+from typing import Any
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "custom_components"))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+
+@pytest.fixture
+def loop() -> Iterator[asyncio.AbstractEventLoop]:
+    """Return a fresh event loop for the test."""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    yield loop
+    loop.close()
+    asyncio.set_event_loop(None)
+
+
+@pytest.fixture
+def hass(loop: asyncio.AbstractEventLoop, tmp_path: Any) -> Iterator[HomeAssistant]:
+    """Return a Home Assistant instance configured in a temporary directory."""
+
+    async def _async_create() -> HomeAssistant:
+        return HomeAssistant(str(tmp_path))
+
+    instance = loop.run_until_complete(_async_create())
+    yield instance
+    loop.run_until_complete(instance.async_stop(force=True))
+
+
+@pytest.fixture
+def run(loop: asyncio.AbstractEventLoop) -> Callable[[Any], Any]:
+    """Return a function running a coroutine to completion on the test loop."""
+    return loop.run_until_complete
@@ -0,0 +1,114 @@
+"""Tests of snapshot diffing and the coordinator's changed-set notifications."""
+from __future__ import annotations
+
+from common import load_snapshot, make_entry
+
+from big_sky.coordinator import BigSkyDataUpdateCoordinator
+from big_sky.diff import (
+    SECTION_AREA,
+    SECTION_LIFT,
+    SECTION_PARKING,
+    SECTION_RESORT,
+    SECTION_TRAIL,
+    SECTION_WAIT,
+    diff_snapshots,
+    item_context,
+    section_context,
+)
+
+OPEN_EXPLORER = (
+    'name="Explorer" type="Fixed Quad" status="Closed"',
+    'name="Explorer" type="Fixed Quad" status="Open"',
+)
+FILL_MOUNTAIN_VILLAGE = ('percentFull="45"', 'percentFull="60"')
+DROP_AMBUSH = (
+    '<trail name="Ambush" difficulty="Advanced" status="Closed" groomed="no"/>', ""
+)
+
+
+def test_first_snapshot_notifies_everyone() -> None:
+    """Without a previous snapshot every listener is updated."""
+    assert diff_snapshots(None, load_snapshot()) is None
+
+
+def test_unchanged_feed() -> None:
+    """Equal snapshots have nothing to notify."""
+    assert diff_snapshots(load_snapshot(), load_snapshot()) == set()
+
+
+def test_changed_lift() -> None:
+    """A changed lift flags the lift, its section and its area."""
+    changed = diff_snapshots(load_snapshot(), load_snapshot(OPEN_EXPLORER))
+    assert changed == {
+        SECTION_LIFT,
+        (SECTION_LIFT, "Mountain Village", "Explorer"),
+        SECTION_AREA,
+        (SECTION_AREA, "Mountain Village"),
+    }
+
+
+def test_removed_trail() -> None:
+    """A trail missing from the feed is flagged like a changed one."""
+    changed = diff_snapshots(load_snapshot(), load_snapshot(DROP_AMBUSH))
+    assert changed == {
+        SECTION_TRAIL,
+        (SECTION_TRAIL, "Mountain Village", "Ambush"),
+        SECTION_AREA,
+        (SECTION_AREA, "Mountain Village"),
+    }
+
+
+def test_parking_lot_is_not_an_area() -> None:
+    """Lots are keyed by name and never flag the area of the same name."""
+    changed = diff_snapshots(load_snapshot(), load_snapshot(FILL_MOUNTAIN_VILLAGE))
+    assert changed == {SECTION_PARKING, (SECTION_PARKING, "Mountain Village")}
+
+
+def test_resort_change() -> None:
+    """Resort-wide fields flag the resort section only."""
+    changed = diff_snapshots(
+        load_snapshot(),
+        load_snapshot(('numTrailsOpen="210"', 'numTrailsOpen="211"')),
+    )
+    assert changed == {SECTION_RESORT}
+
+
+def test_listeners_follow_the_changed_set(hass, run) -> None:
+    """Only listeners whose context intersects the changed set are called."""
+    calls: dict[str, int] = {"explorer": 0, "tram": 0, "trails": 0, "wait": 0}
+
+    async def _async_test() -> None:
+        coordinator = BigSkyDataUpdateCoordinator(hass, make_entry())
+        contexts = {
+            "explorer": item_context(SECTION_LIFT, "Mountain Village", "Explorer"),
+            "tram": item_context(SECTION_LIFT, "Lone Peak Area", "Lone Peak Tram"),
+            "trails": section_context(SECTION_TRAIL),
+            "wait": item_context(SECTION_WAIT, "Lone Peak Area", "Lone Peak Tram"),
+        }
+        for name, context in contexts.items():
+            coordinator.async_add_listener(
+                lambda name=name: calls.__setitem__(name, calls[name] + 1), context
+            )
+        coordinator.last_update_success = True
+        # The first notification after setup reaches everyone.
+        coordinator.async_update_listeners()
+        assert calls == {"explorer": 1, "tram": 1, "trails": 1, "wait": 1}
+
+        coordinator.changed = diff_snapshots(
+            load_snapshot(), load_snapshot(OPEN_EXPLORER)
+        )
+        coordinator.async_update_listeners()
+        assert calls == {"explorer": 2, "tram": 1, "trails": 1, "wait": 1}
+
+        # An unchanged feed notifies nobody.
+        coordinator.changed = set()
+        coordinator.async_update_listeners()
+        assert calls == {"explorer": 2, "tram": 1, "trails": 1, "wait": 1}
+
+        # A new wait sample reaches only the lift's wait listeners.
+        coordinator.changed = {(SECTION_WAIT, "Lone Peak Area", "Lone Peak Tram")}
+        coordinator.async_update_listeners()
+        assert calls == {"explorer": 2, "tram": 1, "trails": 1, "wait": 2}
+        await coordinator.async_shutdown()
+
+    run(_async_test())
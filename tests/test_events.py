@@ -0,0 +1,85 @@
+"""Tests of the batched status events."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+from common import NOW, StubCoordinator, load_snapshot, make_entry
+
+from homeassistant.core import Event
+
+from big_sky.events import (
+    EVENT_FIRST_OPEN,
+    EVENT_PARKING_THRESHOLD,
+    EVENT_STATUS_CHANGED,
+    EVENT_WIND_HOLD,
+    StatusEvents,
+)
+
+OPEN_EXPLORER = (
+    'name="Explorer" type="Fixed Quad" status="Closed" statusDetail="Wind Hold"',
+    'name="Explorer" type="Fixed Quad" status="Open" statusDetail=""',
+)
+CLOSE_TRAM = (
+    'name="Lone Peak Tram" type="Tram" status="Open" statusDetail=""',
+    'name="Lone Peak Tram" type="Tram" status="Closed" statusDetail="Wind Hold"',
+)
+EVENTS = (EVENT_STATUS_CHANGED, EVENT_FIRST_OPEN, EVENT_WIND_HOLD, EVENT_PARKING_THRESHOLD)
+
+
+def test_transitions(hass, run) -> None:
+    """One event per kind and refresh, none for the baseline."""
+    fired: list[Event] = []
+
+    async def _async_test() -> None:
+        for event_type in EVENTS:
+            hass.bus.async_listen(event_type, fired.append)
+        coordinator = StubCoordinator(load_snapshot())
+        coordinator.parking.add_snapshot(coordinator.data, NOW)
+        entry = make_entry()
+        StatusEvents(hass, entry, coordinator).async_setup()
+        await hass.async_block_till_done()
+        assert fired == []
+
+        coordinator.refresh(load_snapshot(OPEN_EXPLORER, CLOSE_TRAM))
+        await hass.async_block_till_done()
+        by_type = {event.event_type: event.data for event in fired}
+        assert set(by_type) == {EVENT_STATUS_CHANGED, EVENT_FIRST_OPEN, EVENT_WIND_HOLD}
+        assert by_type[EVENT_STATUS_CHANGED]["entry_id"] == entry.entry_id
+        assert by_type[EVENT_STATUS_CHANGED]["resort_id"] == "162"
+        changes = {
+            change["name"]: (change["old_status"], change["new_status"])
+            for change in by_type[EVENT_STATUS_CHANGED]["changes"]
+        }
+        assert changes == {
+            "Explorer": ("Closed", "Open"), "Lone Peak Tram": ("Open", "Closed")
+        }
+        assert by_type[EVENT_FIRST_OPEN]["items"] == [
+            {"type": "lift", "area": "Mountain Village", "name": "Explorer"}
+        ]
+        holds = {
+            lift["name"]: lift["on_hold"] for lift in by_type[EVENT_WIND_HOLD]["lifts"]
+        }
+        assert holds == {"Explorer": False, "Lone Peak Tram": True}
+
+        # The tram reopening later that day is not a first opening.
+        fired.clear()
+        coordinator.refresh(load_snapshot(OPEN_EXPLORER), NOW + timedelta(minutes=15))
+        await hass.async_block_till_done()
+        by_type = {event.event_type: event.data for event in fired}
+        assert EVENT_FIRST_OPEN not in by_type
+        assert [change["name"] for change in by_type[EVENT_STATUS_CHANGED]["changes"]] == [
+            "Lone Peak Tram"
+        ]
+
+        fired.clear()
+        coordinator.refresh(
+            load_snapshot(OPEN_EXPLORER, ('percentFull="45"', 'percentFull="92"')),
+            NOW + timedelta(minutes=30),
+        )
+        await hass.async_block_till_done()
+        [event] = fired
+        assert event.event_type == EVENT_PARKING_THRESHOLD
+        assert event.data["lots"][0]["thresholds"] == [50, 75, 90]
+        await entry._async_process_on_unload(hass)  # noqa: SLF001
+
+    run(_async_test())
@@ -0,0 +1,63 @@
+"""Tests of the forecast narrative parsing and daily forecast."""
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from common import load_snapshot
+
+from big_sky.forecast import ForecastSummary, forecast_dates, parse_narrative
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        (
+            "Snow showers likely. Snow accumulation of 2 to 4 inches possible.",
+            (None, 3.0, None),
+        ),
+        ("Mostly sunny. 20 percent chance of precipitation.", (20, None, None)),
+        ("Snow likely. Little or no snow accumulation expected.", (None, 0.0, None)),
+        (
+            "New snow accumulation of around an inch. Chance of snow is 70%.",
+            (70, 1.0, None),
+        ),
+        (
+            "Rain and snow. New rainfall amounts of less than a half inch possible.",
+            (None, None, 0.5),
+        ),
+        ("Snow accumulation of 1.5 inches. 40 percent chance of snow.", (40, 1.5, None)),
+        ("Partly sunny.", (None, None, None)),
+    ],
+)
+def test_parse_narrative(text: str, expected: tuple) -> None:
+    """Probability, snowfall and rainfall are read from the narrative."""
+    assert parse_narrative(text) == expected
+
+
+def test_forecast_dates_follow_the_report() -> None:
+    """Days are dated from the report, one per entry."""
+    assert forecast_dates(load_snapshot()) == [
+        date(2026, 1, 10), date(2026, 1, 11), date(2026, 1, 12)
+    ]
+
+
+def test_late_report_starts_tomorrow() -> None:
+    """A report from the evening before starts at the weekday it names."""
+    snapshot = load_snapshot(
+        ('updated="2026-01-10 07:45:00"', 'updated="2026-01-09 19:00:00"')
+    )
+    assert forecast_dates(snapshot)[0] == date(2026, 1, 10)
+
+
+def test_daily_forecast() -> None:
+    """The daily forecast is dated and snowfall is kept by date."""
+    summary = ForecastSummary(load_snapshot())
+    first = summary.daily[0]
+    assert first["datetime"].startswith("2026-01-10T00:00:00")
+    assert first["native_temperature"] == 22
+    assert first["native_templow"] == 8
+    assert first["native_precipitation"] is None
+    assert summary.daily[1]["precipitation_probability"] == 20
+    assert summary.snowfall == {"2026-01-10": 3.0, "2026-01-11": None, "2026-01-12": None}
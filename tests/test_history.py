@@ -0,0 +1,84 @@
+"""Tests of the local status history."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+from common import NOW, StubCoordinator, load_snapshot, make_entry
+
+from big_sky.diff import SECTION_LIFT
+from big_sky.history import StatusHistory
+
+CLOSED = 'name="Explorer" type="Fixed Quad" status="Closed"'
+OPEN = 'name="Explorer" type="Fixed Quad" status="Open"'
+
+
+def test_uptime_and_timeline(hass, run) -> None:
+    """Uptime counts the open time of the queried window."""
+
+    async def _async_test() -> None:
+        coordinator = StubCoordinator(load_snapshot())
+        coordinator.last_fetch = NOW
+        entry = make_entry()
+        history = StatusHistory(hass, entry, coordinator)
+        await history.async_setup()
+        coordinator.refresh(load_snapshot((CLOSED, OPEN)), NOW + timedelta(hours=1))
+        coordinator.refresh(load_snapshot(), NOW + timedelta(hours=3))
+        # Unchanged feeds record nothing.
+        coordinator.refresh(load_snapshot(), NOW + timedelta(hours=3, minutes=15))
+        await hass.async_block_till_done()
+
+        result = await history.async_query(
+            SECTION_LIFT, None, ["explorer", "magic carpet"], NOW, NOW + timedelta(hours=4)
+        )
+        by_name = {item["name"]: item for item in result}
+        explorer = by_name["Explorer"]
+        assert explorer["status"] == "Closed"
+        assert explorer["uptime"] == 50.0
+        assert explorer["openings"] == 1
+        assert [point["status"] for point in explorer["timeline"]] == ["Open", "Closed"]
+        assert explorer["timeline"][0]["time"] == (NOW + timedelta(hours=1)).isoformat()
+        assert by_name["Magic Carpet"]["uptime"] == 100.0
+        assert by_name["Magic Carpet"]["openings"] == 0
+
+        # Before the first recording nothing is known.
+        result = await history.async_query(
+            SECTION_LIFT, "mountain village", ["Explorer"],
+            NOW - timedelta(hours=2), NOW - timedelta(hours=1),
+        )
+        assert result[0]["uptime"] is None
+        assert result[0]["status"] is None
+
+        await entry._async_process_on_unload(hass)  # noqa: SLF001
+        await history.async_close()
+
+    run(_async_test())
+
+
+def test_history_survives_a_restart(hass, run) -> None:
+    """A reopened database continues from the last recorded statuses."""
+
+    async def _async_test() -> None:
+        coordinator = StubCoordinator(load_snapshot())
+        coordinator.last_fetch = NOW
+        entry = make_entry()
+        history = StatusHistory(hass, entry, coordinator)
+        await history.async_setup()
+        await history.async_close()
+
+        coordinator = StubCoordinator(load_snapshot((CLOSED, OPEN)))
+        coordinator.last_fetch = NOW + timedelta(hours=2)
+        history = StatusHistory(hass, entry, coordinator)
+        await history.async_setup()
+        await hass.async_block_till_done()
+        result = await history.async_query(
+            SECTION_LIFT, None, None, NOW, NOW + timedelta(hours=4)
+        )
+        by_name = {item["name"]: item for item in result}
+        assert len(by_name) == 4
+        assert [point["status"] for point in by_name["Explorer"]["timeline"]] == ["Open"]
+        assert by_name["Explorer"]["uptime"] == 50.0
+        # Unchanged items were not written again.
+        assert by_name["Magic Carpet"]["timeline"] == []
+        await history.async_close()
+
+    run(_async_test())
@@ -0,0 +1,45 @@
+"""Tests of config entry migration."""
+from __future__ import annotations
+
+from common import FEED_URL, make_entry
+
+from homeassistant.config_entries import ConfigEntries
+from homeassistant.helpers import entity_registry as er
+
+from big_sky import async_migrate_entry
+from big_sky.const import (
+    CONF_CREATE_LIFT_ENTITIES,
+    CONF_CREATE_RUN_ENTITIES,
+    CONF_FEED_URL,
+    CONF_UPDATE_INTERVAL,
+    DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+)
+
+
+def test_migrate_entry(hass, run) -> None:
+    """Version 1 entries get defaults and resort-scoped unique IDs."""
+
+    async def _async_test() -> None:
+        hass.config_entries = ConfigEntries(hass, {})
+        await hass.config_entries.async_initialize()
+        await er.async_load(hass)
+        entry = make_entry(version=1)
+        hass.config_entries._entries[entry.entry_id] = entry  # noqa: SLF001
+        registry = er.async_get(hass)
+        old = registry.async_get_or_create(
+            "sensor", DOMAIN, f"{DOMAIN}_snow_depth", config_entry=entry
+        )
+
+        assert await async_migrate_entry(hass, entry)
+        assert entry.version == 3
+        assert entry.unique_id == "162"
+        assert dict(entry.data) == {
+            CONF_FEED_URL: FEED_URL,
+            CONF_CREATE_RUN_ENTITIES: True,
+            CONF_CREATE_LIFT_ENTITIES: True,
+            CONF_UPDATE_INTERVAL: DEFAULT_UPDATE_INTERVAL,
+        }
+        assert registry.async_get(old.entity_id).unique_id == f"{DOMAIN}_162_snow_depth"
+
+    run(_async_test())
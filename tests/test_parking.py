@@ -0,0 +1,74 @@
+"""Tests of the parking lot fill rates and thresholds."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+from common import NOW, load_snapshot
+
+from big_sky.diff import SECTION_FILL
+from big_sky.parking import FillSeries, ParkingTracker
+
+
+def _minutes(minutes: float):
+    return NOW + timedelta(minutes=minutes)
+
+
+def test_fill_rate() -> None:
+    """The least-squares rate predicts when the lot fills."""
+    series = FillSeries()
+    assert series.add(40, _minutes(0)) is False
+    for minute, percent in ((1, 45), (2, 50), (3, 55)):
+        assert series.add(percent, _minutes(minute)) is True
+    assert series.rate == 5.0
+    assert series.minutes_to_full() == 9.0
+    attributes = series.as_dict()
+    assert attributes["fill_rate_per_hour"] == 300.0
+    assert attributes["predicted_full_at"] == _minutes(12).isoformat()
+    # A repeated timestamp is not a sample.
+    assert series.add(60, _minutes(3)) is False
+    assert series.samples == 4
+
+
+def test_fill_series_restarts_after_a_gap() -> None:
+    """An overnight gap drops the old samples and the last percentage."""
+    series = FillSeries()
+    for minute, percent in ((0, 80), (1, 90), (2, 95)):
+        series.add(percent, _minutes(minute))
+    assert series.add(10, _minutes(12 * 60)) is False
+    assert series.samples == 1
+    assert series.rate is None
+    assert series.minutes_to_full() is None
+
+
+def test_parking_thresholds() -> None:
+    """Crossings are reported once per refresh, but not across a restart."""
+    tracker = ParkingTracker()
+    sampled = tracker.add_snapshot(load_snapshot(), NOW)
+    assert sampled == {
+        (SECTION_FILL, "Mountain Village"), (SECTION_FILL, "Madison Base")
+    }
+    assert tracker.pop_crossings() == []
+
+    tracker.add_snapshot(
+        load_snapshot(('percentFull="45"', 'percentFull="76"')), _minutes(15)
+    )
+    [crossing] = tracker.pop_crossings()
+    assert crossing["name"] == "Mountain Village"
+    assert crossing["thresholds"] == [50, 75]
+    assert crossing["rising"] is True
+    assert crossing["previous_percent_full"] == 45
+    assert tracker.pop_crossings() == []
+
+    # The next morning starts a new series rather than "falling" to 10%.
+    tracker.add_snapshot(
+        load_snapshot(('percentFull="45"', 'percentFull="10"')), _minutes(15 + 14 * 60)
+    )
+    assert tracker.pop_crossings() == []
+
+
+def test_parking_index_skips_silent_lots() -> None:
+    """Lots that never report a percentage get no sensor."""
+    silent = load_snapshot(('percentFull="0" openTime', 'openTime'))
+    tracker = ParkingTracker()
+    assert tracker.add_snapshot(silent, NOW) == {(SECTION_FILL, "Mountain Village")}
+    assert list(tracker.index(silent)) == ["Mountain Village"]
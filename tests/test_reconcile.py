@@ -0,0 +1,177 @@
+"""Tests of the per-item entity reconciler."""
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from common import NOW, StubCoordinator, load_snapshot, make_entry
+
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
+
+from big_sky import reconcile
+from big_sky.const import CONF_CREATE_LIFT_ENTITIES, DOMAIN
+from big_sky.diff import SECTION_LIFT
+from big_sky.reconcile import REMOVE_AFTER_MISSED, EntityReconciler, ItemFamily
+
+DROP_EXPLORER = (
+    '<lift name="Explorer" type="Fixed Quad" status="Closed" statusDetail="Wind Hold"'
+    ' capacity="4" openTime="9:00 AM" closeTime="4:00 PM"/>',
+    "",
+)
+
+
+class LiftEntity(Entity):
+    """Registered entity of one lift."""
+
+    def __init__(self, registry: er.EntityRegistry, name: str) -> None:
+        """Register the entity under the lift's name."""
+        self.lift_name = name
+        self.entity_id = registry.async_get_or_create(
+            "binary_sensor", DOMAIN, f"lift_{name}"
+        ).entity_id
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[datetime]:
+    """Return a settable clock read by the reconciler."""
+    now = [NOW]
+    monkeypatch.setattr(reconcile.dt_util, "utcnow", lambda: now[0])
+    return now
+
+
+def test_items_are_added_and_removed_after_grace(hass, run, clock) -> None:
+    """Vanished items keep their entity for ``REMOVE_AFTER_MISSED`` intervals."""
+
+    async def _async_test() -> None:
+        await er.async_load(hass)
+        registry = er.async_get(hass)
+        coordinator = StubCoordinator(load_snapshot())
+        entry = make_entry()
+        added: list[LiftEntity] = []
+        reconciler = EntityReconciler(
+            hass,
+            entry,
+            coordinator,
+            added.extend,
+            [
+                ItemFamily(
+                    SECTION_LIFT,
+                    CONF_CREATE_LIFT_ENTITIES,
+                    lambda snapshot: snapshot.lifts,
+                    lambda lift: LiftEntity(registry, lift.name),
+                )
+            ],
+        )
+        reconciler.async_setup()
+        assert sorted(entity.lift_name for entity in added) == [
+            "Explorer", "Lone Peak Tram", "Magic Carpet", "Ramcharger 8"
+        ]
+        explorer = next(entity for entity in added if entity.lift_name == "Explorer")
+
+        # One truncated feed does not remove the entity.
+        coordinator.refresh(load_snapshot(DROP_EXPLORER))
+        assert registry.async_get(explorer.entity_id) is not None
+
+        # Coming back within the grace period starts the count over.
+        clock[0] = NOW + coordinator.update_interval
+        coordinator.refresh(load_snapshot())
+        clock[0] = NOW + coordinator.update_interval * 2
+        coordinator.refresh(load_snapshot(DROP_EXPLORER))
+        clock[0] += coordinator.update_interval * (REMOVE_AFTER_MISSED - 1)
+        reconciler.async_reconcile()
+        assert registry.async_get(explorer.entity_id) is not None
+
+        # Missing for the whole grace period removes it, without a refresh.
+        clock[0] += coordinator.update_interval
+        reconciler.async_reconcile()
+        assert registry.async_get(explorer.entity_id) is None
+        assert len(added) == 4
+
+        # An item that returns later gets a new entity.
+        coordinator.refresh(load_snapshot())
+        assert [entity.lift_name for entity in added[4:]] == ["Explorer"]
+        await entry._async_process_on_unload(hass)  # noqa: SLF001
+
+    run(_async_test())
+
+
+def test_families_sharing_a_section(hass, run, clock) -> None:
+    """Two families of the same section keep separate entities."""
+
+    async def _async_test() -> None:
+        await er.async_load(hass)
+        registry = er.async_get(hass)
+        coordinator = StubCoordinator(load_snapshot())
+        entry = make_entry()
+        added: list[LiftEntity] = []
+        EntityReconciler(
+            hass,
+            entry,
+            coordinator,
+            added.extend,
+            [
+                ItemFamily(
+                    SECTION_LIFT,
+                    None,
+                    lambda snapshot: snapshot.lifts,
+                    lambda lift: LiftEntity(registry, lift.name),
+                ),
+                ItemFamily(
+                    SECTION_LIFT,
+                    None,
+                    lambda snapshot: {
+                        key: lift for key, lift in snapshot.lifts.items() if lift.is_open
+                    },
+                    lambda lift: LiftEntity(registry, f"{lift.name} open"),
+                ),
+            ],
+        ).async_setup()
+        assert len(added) == 7
+        await entry._async_process_on_unload(hass)  # noqa: SLF001
+
+    run(_async_test())
+
+
+def test_legacy_unique_ids_are_migrated(hass, run, clock) -> None:
+    """Registry entries under an item's legacy unique ID move to the new one."""
+
+    async def _async_test() -> None:
+        await er.async_load(hass)
+        registry = er.async_get(hass)
+        coordinator = StubCoordinator(load_snapshot())
+        entry = make_entry()
+        old = registry.async_get_or_create(
+            "binary_sensor", DOMAIN, "lift_Explorer", config_entry=entry
+        )
+        added: list[Entity] = []
+
+        def _factory(lift) -> Entity:
+            entity = Entity()
+            entity._attr_unique_id = f"lift_{lift.area}_{lift.name}"  # noqa: SLF001
+            return entity
+
+        EntityReconciler(
+            hass,
+            entry,
+            coordinator,
+            added.extend,
+            [
+                ItemFamily(
+                    SECTION_LIFT,
+                    None,
+                    lambda snapshot: snapshot.lifts,
+                    _factory,
+                    legacy_unique_id=lambda lift: f"lift_{lift.name}",
+                )
+            ],
+        ).async_setup()
+        assert len(added) == 4
+        assert (
+            registry.async_get(old.entity_id).unique_id
+            == "lift_Mountain Village_Explorer"
+        )
+        await entry._async_process_on_unload(hass)  # noqa: SLF001
+
+    run(_async_test())
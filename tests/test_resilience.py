@@ -0,0 +1,43 @@
+"""Tests of the coordinator's circuit breaker."""
+from __future__ import annotations
+
+import pytest
+
+from common import FEED, make_entry
+
+from big_sky.api import BigSkyFeedError, FeedResponse
+from big_sky.coordinator import BigSkyDataUpdateCoordinator
+from big_sky.resilience import BREAKER_CLOSED, BREAKER_OPEN
+
+
+def test_invalid_feeds_open_the_breaker(hass, run) -> None:
+    """Feeds that download but do not parse count as failed refreshes."""
+    bodies = [b"<resort", b"<resort", b"<resort"]
+
+    async def _async_fetch(session, sink=None) -> FeedResponse:
+        body = bodies.pop(0)
+        if sink is not None:
+            sink.feed(body)
+        return FeedResponse(None if sink else body, None, None, body)
+
+    async def _async_test() -> None:
+        coordinator = BigSkyDataUpdateCoordinator(hass, make_entry())
+        coordinator.client.async_fetch = _async_fetch
+        for _ in range(coordinator.breaker.failure_threshold - 1):
+            with pytest.raises(BigSkyFeedError):
+                await coordinator._async_fetch_snapshot()  # noqa: SLF001
+        assert coordinator.breaker.state == BREAKER_CLOSED
+
+        with open(FEED, "rb") as file:
+            bodies[0] = file.read()
+        await coordinator._async_fetch_snapshot()  # noqa: SLF001
+        assert coordinator.breaker.failures == 0
+
+        bodies.extend([b"<resort"] * coordinator.breaker.failure_threshold)
+        for _ in range(coordinator.breaker.failure_threshold):
+            with pytest.raises(BigSkyFeedError):
+                await coordinator._async_fetch_snapshot()  # noqa: SLF001
+        assert coordinator.breaker.state == BREAKER_OPEN
+        await coordinator.async_shutdown()
+
+    run(_async_test())
@@ -0,0 +1,77 @@
+"""Tests of the item search index."""
+from __future__ import annotations
+
+import pytest
+
+from common import StubCoordinator, load_snapshot, make_entry
+
+from big_sky.search import SCORE_EXACT, SCORE_PREFIX, SearchIndex
+
+OPEN_EXPLORER = (
+    'name="Explorer" type="Fixed Quad" status="Closed"',
+    'name="Explorer" type="Fixed Quad" status="Open"',
+)
+DROP_AMBUSH = (
+    '<trail name="Ambush" difficulty="Advanced" status="Closed" groomed="no"/>', ""
+)
+
+
+@pytest.fixture
+def coordinator() -> StubCoordinator:
+    """Return a coordinator with the sample feed."""
+    return StubCoordinator(load_snapshot())
+
+
+@pytest.fixture
+def index(coordinator: StubCoordinator) -> SearchIndex:
+    """Return an index following ``coordinator``."""
+    index = SearchIndex(make_entry(), coordinator)
+    index.async_setup()
+    return index
+
+
+def _names(results: list[dict]) -> list[str]:
+    return [result["name"] for result in results]
+
+
+def test_exact_match_ranks_first(index: SearchIndex) -> None:
+    """An exact name beats names the query only prefixes."""
+    results = index.search("ambush")
+    assert _names(results) == ["Ambush", "Ambush Park"]
+    assert [result["score"] for result in results] == [SCORE_EXACT, SCORE_PREFIX]
+    assert results[0]["section"] == "trail"
+
+
+def test_word_prefixes(index: SearchIndex) -> None:
+    """Every query word must start a word of the name."""
+    assert _names(index.search("lo mor")) == ["Lower Morning Star"]
+    assert _names(index.search("tram")) == ["Lone Peak Tram"]
+
+
+def test_fuzzy_fallback(index: SearchIndex) -> None:
+    """Misspelled names fall back to trigram matching."""
+    results = index.search("libery bowl")
+    assert _names(results)[0] == "Liberty Bowl"
+    assert results[0]["score"] < SCORE_PREFIX
+
+
+def test_filters(index: SearchIndex) -> None:
+    """Filters intersect, and trail colors map to difficulties."""
+    assert _names(index.search(filters={"difficulty": "blue"})) == [
+        "Lower Morning Star", "Swifty Park"
+    ]
+    assert _names(
+        index.search(filters={"section": "trail", "groomed": True, "uphill": True})
+    ) == ["Mr. K"]
+    assert _names(
+        index.search(filters={"area": "MADISON BASE", "open": True})
+    ) == ["Ambush Park", "Tippy's Tumble"]
+    assert _names(index.search("explorer", {"open": True})) == []
+    assert len(index.search(filters={"section": "lift"}, limit=2)) == 2
+
+
+def test_follows_refreshes(coordinator: StubCoordinator, index: SearchIndex) -> None:
+    """Changed and removed items are re-indexed after a refresh."""
+    coordinator.refresh(load_snapshot(OPEN_EXPLORER, DROP_AMBUSH))
+    assert "Explorer" in _names(index.search(filters={"section": "lift", "open": True}))
+    assert _names(index.search("ambush")) == ["Ambush Park"]
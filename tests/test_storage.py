@@ -0,0 +1,67 @@
+"""Tests of the snapshot cache."""
+from __future__ import annotations
+
+import json
+
+from common import NOW, load_snapshot
+
+from homeassistant.helpers.storage import Store
+
+from big_sky.const import DOMAIN
+from big_sky.storage import (
+    STORAGE_VERSION,
+    SnapshotStore,
+    deserialize_snapshot,
+    serialize_snapshot,
+)
+
+SNAPSHOT_FIELDS = (
+    "resort", "areas", "lifts", "trails", "parks", "parking_lots", "shuttles",
+    "forecast", "updated",
+)
+
+
+def _assert_same(snapshot, other) -> None:
+    for name in SNAPSHOT_FIELDS:
+        assert getattr(other, name) == getattr(snapshot, name), name
+
+
+def test_round_trip() -> None:
+    """A snapshot survives serialization through JSON unchanged."""
+    snapshot = load_snapshot()
+    data = json.loads(json.dumps(serialize_snapshot(snapshot, NOW)))
+    restored, fetched_at = deserialize_snapshot(data)
+    _assert_same(snapshot, restored)
+    assert fetched_at == NOW
+    assert restored.lifts[("Mountain Village", "Explorer")].area == "Mountain Village"
+
+
+def test_cache_without_report_date() -> None:
+    """Caches written before the report date was kept still load."""
+    data = serialize_snapshot(load_snapshot(), NOW)
+    del data["updated"]
+    restored, _ = deserialize_snapshot(data)
+    assert restored.updated is None
+    assert restored.lifts == load_snapshot().lifts
+
+
+def test_store(hass, run) -> None:
+    """The store loads what it saved and ignores caches of another layout."""
+
+    async def _async_test() -> None:
+        store = SnapshotStore(hass, "entry")
+        assert await store.async_load() is None
+        store.async_save(load_snapshot(), NOW)
+        await store._store._async_handle_write_data()  # noqa: SLF001
+        snapshot, fetched_at = await SnapshotStore(hass, "entry").async_load()
+        _assert_same(load_snapshot(), snapshot)
+        assert fetched_at == NOW
+
+        # Lift rows of an older record layout have fewer fields.
+        data = serialize_snapshot(load_snapshot(), NOW)
+        data["areas"][0][1] = [row[:-1] for row in data["areas"][0][1]]
+        raw = Store(hass, STORAGE_VERSION, f"{DOMAIN}.snapshot.entry")
+        await raw.async_save(data)
+        assert await SnapshotStore(hass, "entry").async_load() is None
+
+    run(_async_test())
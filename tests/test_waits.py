@@ -0,0 +1,78 @@
+"""Tests of the lift wait statistics."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+from common import NOW, load_snapshot
+
+from big_sky.diff import SECTION_WAIT
+from big_sky.waits import (
+    MAX_WAIT,
+    WAIT_SCENIC,
+    WAIT_SKIER,
+    WAIT_WINDOW,
+    WaitSeries,
+    WaitTracker,
+    parse_wait,
+)
+
+TRAM = ("Lone Peak Area", "Lone Peak Tram")
+
+
+def _minutes(minutes: float):
+    return NOW + timedelta(minutes=minutes)
+
+
+def test_parse_wait() -> None:
+    """Waits are whole minutes, capped at ``MAX_WAIT``."""
+    assert parse_wait("15") == 15
+    assert parse_wait("5 min") == 5
+    assert parse_wait("999") == MAX_WAIT
+    assert parse_wait("") is None
+    assert parse_wait(None) is None
+
+
+def test_wait_window() -> None:
+    """Mean and 90th percentile cover the last ``WAIT_WINDOW`` samples."""
+    series = WaitSeries()
+    for minute in range(1, 11):
+        series.add(minute, _minutes(minute))
+    assert series.mean == 5.5
+    assert series.p90 == 9
+    for minute in range(WAIT_WINDOW):
+        series.add(20, _minutes(11 + minute))
+    assert series.mean == 20
+    assert series.p90 == 20
+    assert series.as_dict()["samples"] == WAIT_WINDOW
+
+
+def test_wait_trend_and_prediction() -> None:
+    """A rising queue trends up and predicts a longer wait."""
+    series = WaitSeries()
+    for minute in range(30):
+        series.add(5 + minute // 2, _minutes(minute))
+    assert series.trend > 0
+    assert series.predict() > series.last
+    # An overnight gap restarts level and trend.
+    series.add(5, _minutes(30 + 12 * 60))
+    assert series.level == 5
+    assert series.trend == 0
+    assert series.predict() == 5
+
+
+def test_wait_tracker() -> None:
+    """Only open lifts that report a wait are sampled."""
+    tracker = WaitTracker()
+    sampled = tracker.add_snapshot(load_snapshot(), NOW)
+    assert sampled == {(SECTION_WAIT, *TRAM)}
+    assert tracker.get(TRAM, WAIT_SKIER).last == 15
+    assert tracker.get(TRAM, WAIT_SCENIC).last == 30
+    assert list(tracker.index(load_snapshot())) == [TRAM]
+
+    closed = load_snapshot(
+        ('name="Lone Peak Tram" type="Tram" status="Open"',
+         'name="Lone Peak Tram" type="Tram" status="Closed"')
+    )
+    assert tracker.add_snapshot(closed, _minutes(1)) == set()
+    # The series stays, so the sensor is kept while the lift is closed.
+    assert list(tracker.index(closed)) == [TRAM]